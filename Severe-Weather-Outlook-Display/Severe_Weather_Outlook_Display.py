@@ -12,44 +12,106 @@ for WeatherTrackUS and other users
 
 # Import all necessary modules
 import os
+import json
+import hashlib
+import codecs
+import re
+import io
+import shutil
+import argparse
+import email.utils
+import http.server
 import requests
 import matplotlib
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import numpy as np
+import pandas as pd
 import geopandas as gpd
+import shapely
 import tkinter as tk
 import customtkinter as ctk
 import contextily as ctx
+import mercantile
 import sys
 import logging as log
-import pystray
 import feedparser
 import time
 import threading
+import concurrent.futures
+import queue
+import itertools
+import collections
+import datetime
 
 # Import specific functions from modules
+from matplotlib import animation
+from matplotlib.collections import PolyCollection
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 from matplotlib.backends._backend_tk import NavigationToolbar2Tk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from tkinter import messagebox
 from PIL import Image
 from plyer import notification
-
-matplotlib.use('TkAgg')
-
-root = tk.Tk()
-root.withdraw()
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from shapely.geometry import MultiPolygon, Polygon
 
 # Variables
 log_directory = 'C:\\log'
 current_directory = os.path.dirname(os.path.abspath(__file__))
 instance = 0
 rss_url = 'https://www.spc.noaa.gov/products/spcacrss.xml'
-check_interval = 60
-refresh_interval = 15  # Refresh the list every 15 seconds
-notified_titles = []  # List to store notified titles
+check_interval = 60  # Seconds between checks of the RSS feed
+rss_fast_interval = 15  # Seconds between checks of the RSS feed around the times SPC issues a watched product
+rss_issue_window = 20 * 60  # Seconds before and after an issuance time that the RSS feed is checked faster
+rss_max_backoff = 15 * 60  # Longest wait between checks of the RSS feed after it keeps failing
+rss_watched_products = ('day1', 'day2', 'day3', 'day4-8')  # Products whose issuance times speed up the RSS checks
+rss_seen_path = os.path.join(current_directory, 'cache', 'rss_seen.json')  # Where notified RSS entries are remembered between runs
+rss_seen_max_entries = 500  # RSS entries remembered before the oldest are forgotten
+rss_seen_max_age = 7 * 24 * 60 * 60  # Seconds an RSS entry is remembered
 first_message_title = None  # Title of the first message encountered
 question = None
+fetch_max_workers = 6  # Maximum number of outlooks downloaded at the same time
+fetch_timeout = 15  # Seconds to wait on the SPC server before a download is abandoned
+job_max_workers = 2  # Background threads used for downloading and rendering outlooks
+job_poll_interval = 100  # Milliseconds between checks for finished background jobs
+http_cache_directory = os.path.join(current_directory, 'cache', 'http')  # Where downloaded outlooks are cached
+http_cache_max_age = 60  # Seconds a cached outlook is reused before asking SPC if it has changed
+outlook_store_max_age = 15 * 60  # Longest a current outlook is reused in a session before asking SPC for it again
+http_cache_max_bytes = 50 * 1024 * 1024  # Size of the outlook cache before the least recently used entries are removed
+http_pool_size = 10  # Keep-alive connections held open to each host
+http_retries = 3  # Times a failed request is retried before giving up
+http_backoff_factor = 0.5  # Seconds to wait before the first retry, doubled for every retry after it
+plot_extent = (-125, -66, 20, 60)  # West, east, south and north edges of the map
+base_layer_tolerance = 0.02  # Degrees the state and freeway lines are simplified by, well under a pixel on the 10x8 map
+basemap_source = 'https://tiles.stadiamaps.com/tiles/stamen_terrain/{z}/{x}/{y}{r}.png?api_key=63fe7729-f786-444d-8787-817db15f3368'  # skipcq: FLK-E501
+base_map_directory = os.path.join(current_directory, 'cache', 'basemap')  # Where the pre-drawn base maps are saved
+tile_directory = os.path.join(current_directory, 'cache', 'tiles')  # Where downloaded basemap tiles are stored
+tile_zoom = 6  # Zoom level of the basemap tiles
+tile_cache_max_bytes = 200 * 1024 * 1024  # Size of the tile store before the least recently used tiles are removed
+offline_mode = False  # Never touch the network for tiles or outlooks, set with --offline
+output_directory_path = os.path.join(current_directory, 'output')  # Where rendered outlooks are saved, set with --output-dir
+figure_size = (10, 8)  # Size of the outlook figure in inches
+output_dpi = 96  # Resolution outlook images are saved at
+d48_strip_size = (10, 5.8)  # Size of the saved Day 4-8 strip in inches, two rows of three map panels
+render_cache_directory = os.path.join(current_directory, 'cache', 'renders')  # Where rendered outlook images are kept for reuse
+render_cache_max_bytes = 100 * 1024 * 1024  # Size of the render cache before the least recently used images are removed
+summary_cache_size = 64  # Outlook issuances whose risk summaries are kept in memory
+stream_chunk_size = 64 * 1024  # Bytes read at a time when an outlook is streamed in and parsed
+archive_url = 'https://www.spc.noaa.gov/products/outlook/archive/{year}/day{day}otlk_{date}_{time}_{product}.lyr.geojson'
+archive_directory = os.path.join(current_directory, 'archive')  # Where backfilled archive outlooks are stored
+archive_max_workers = 4  # Archive outlooks downloaded at the same time
+archive_requests_per_second = 4  # Most archive requests started each second, to go easy on SPC
+region_shapefile = os.path.join(current_directory, '../files/mapping/s_11au16.shp')  # Regions risk is summarized over, set with --regions
+region_name_field = 'NAME'  # Column naming each region; regions are numbered instead if it is missing
+region_label_file = os.path.join(current_directory, '../files/mapping/s_11au16_labels.csv')  # Points naming the bundled states, unset by --regions
+region_crs = 'EPSG:5070'  # Equal-area projection region coverage is measured in
+animation_fps = 2  # Frames per second of exported animations, set with --fps
+server_host = '127.0.0.1'  # Address the local HTTP server listens on, set with --host
+server_port = 8080  # Port the local HTTP server listens on when --serve is given without one
+population_file = None  # CSV of 'latitude', 'longitude' and 'population' columns to weight coverage by, set with --population
 
 # Icons
 tornado_icon = ctk.CTkImage(dark_image=Image.open(os.path.join(current_directory, '../files/icons/Tornado.png')),
@@ -64,1095 +126,3481 @@ lightning_icon = ctk.CTkImage(dark_image=Image.open(os.path.join(current_directo
 logo_icon = ctk.CTkImage(dark_image=Image.open(os.path.join(current_directory, '../files/icons/My_project.png')),
                          light_image=Image.open(os.path.join(current_directory, '../files/icons/My_project.png')), size=(120, 120))
 
-# Create a Tkinter root window
-root = tk.Tk()
-root.withdraw()
-
-
-def check_rss_feed(url, interval):
-    """
-    Checks the RSS feed at the specified URL for new entries and sends a notification for each new entry.
+root = None  # Hidden Tkinter root window the GUI and the outlook viewer belong to, created when the GUI starts
 
-    Parameters:
-        url (str): The URL of the RSS feed to check.
-        interval (int): The interval in seconds to wait between checks.
-        refresh_interval (int): The interval in seconds to refresh the list of notified titles.
 
-    Returns:
-        None
-    """
-    last_refresh_time = time.time()  # Time of the last refresh
+# UTC times SPC issues each product all year
+rss_issue_times = {
+    'day1': ('0100', '0600', '1300', '1630', '2000'),
+    'day2': ('1730',),
+    'day3': ('1930',),
+    'day4-8': ()
+}
 
-    while True:
-        current_time = time.time()
-        if current_time - last_refresh_time >= refresh_interval:
-            # Refresh the list every refresh_interval seconds
-            last_refresh_time = current_time
-
-        feed = feedparser.parse(url)
-        if feed.entries:
-            for entry in feed.entries:
-                # Check if the message is new
-                if entry.title not in notified_titles:
-                    # Process the message here
-                    # For example, send a notification
-                    truncated_title = entry.title[:256]
-                    log.info(f'RSS - New RSS Notification. {entry.title}')  # skipcq: PYL-W1203
-                    notification.notify(  # type: ignore
-                        title="New RSS Feed Update",
-                        message=(f'{truncated_title}. Check it out in the App!'),
-                        timeout=10
-                    )
-                    # Add the title to the notified_titles list
-                    notified_titles.append(entry.title)
-        log.info(f'RSS - {notified_titles}')  # skipcq: PYL-W1203
-        time.sleep(interval)
-        log.info('RSS - Interval Passed')
+# UTC times SPC issues the products that follow US Central time, while daylight saving time is and is not in effect
+rss_central_issue_times = {
+    'day2': {True: ('0600',), False: ('0700',)},
+    'day3': {True: ('0730',), False: ('0830',)},
+    'day4-8': {True: ('0900',), False: ('1000',)}
+}
 
 
-# Set the global exception handler
-def global_exception_handler(exc_type, exc_value, exc_traceback):
+# Function to check if US Central time is on daylight saving time
+def central_daylight_time(timestamp):
     """
-    Handles uncaught exceptions by logging the error and exiting the program.
+    Checks if daylight saving time is in effect in US Central time, which runs from 2 AM on the second Sunday
+    of March to 2 AM on the first Sunday of November.
 
     Parameters:
-        exc_type (type): The type of the exception.
-        exc_value (Exception): The instance of the exception.
-        exc_traceback (traceback): The traceback object associated with the exception.
+        timestamp (float): The time as a Unix timestamp.
 
     Returns:
-        None
+        bool: True if daylight saving time is in effect.
     """
-    log.error('uncaught exception', exc_info=(exc_type, exc_value, exc_traceback))
-    sys.exit(0)
-
-
-sys.excepthook = global_exception_handler
+    year = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).year
+    march_first = datetime.datetime(year, 3, 1, 8, tzinfo=datetime.timezone.utc)  # 2 AM Central Standard Time
+    november_first = datetime.datetime(year, 11, 1, 7, tzinfo=datetime.timezone.utc)  # 2 AM Central Daylight Time
+    starts = march_first + datetime.timedelta(days=(6 - march_first.weekday()) % 7 + 7)
+    ends = november_first + datetime.timedelta(days=(6 - november_first.weekday()) % 7)
+    return starts.timestamp() <= timestamp < ends.timestamp()
 
 
-def fetch_cat_outlooks(day):
+# Function to get the UTC times a product is issued on a given day
+def product_issue_times(product, timestamp):
     """
-    Fetches the categorial outlook data for a specified day.
+    Gets the UTC times SPC issues a product, picking the Central time issuances for the UTC offset in effect.
 
     Parameters:
-        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, 3, or 'test'.
+        product (str): The product, e.g. 'day1' or 'day4-8'.
+        timestamp (float): The time the issuances are wanted around, as a Unix timestamp.
 
     Returns:
-        dict: The outlook data in JSON format.
+        tuple: The issue times as 'HHMM' strings in UTC.
     """
-    log.info('Fetching a Categorial Outlook')
-    if day == 1:
-        url = 'https://www.spc.noaa.gov/products/outlook/day1otlk_cat.nolyr.geojson'
-    elif day == 2:
-        url = 'https://www.spc.noaa.gov/products/outlook/day2otlk_cat.nolyr.geojson'
-    elif day == 3:
-        url = 'https://www.spc.noaa.gov/products/outlook/day3otlk_cat.nolyr.geojson'
-    elif day == 'test':
-        url = 'https://www.spc.noaa.gov/products/outlook/archive/2023/day1otlk_20230331_1630_cat.lyr.geojson'
-    else:
-        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 153')
-        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
-        sys.exit(0)
-    response = requests.get(url)  # Requests the data from the GeoJSON URL
-    response.raise_for_status()
-    outlook_data = response.json()
-    return outlook_data  # Returns the data from the Outlook
+    central_times = rss_central_issue_times.get(product)
+    if central_times is None:
+        return rss_issue_times.get(product, ())
+    return rss_issue_times.get(product, ()) + central_times[central_daylight_time(timestamp)]
 
 
-def fetch_tor_outlooks(day):
+# Function to load the RSS entries that were already notified
+def load_rss_seen():
     """
-    Fetches the tornado outlook data for a specified day.
+    Loads the RSS entries notified in earlier runs, dropping the ones older than rss_seen_max_age.
 
     Parameters:
-        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, or 'test'.
+        None
 
     Returns:
-        dict: The outlook data in JSON format.
-
-    Raises:
-        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
-
-    Exits the program with status code 0 if the specified day is invalid.
+        collections.OrderedDict: The time each entry was seen, keyed by its GUID, oldest first.
     """
-    log.info('Fetching a Tornado Outlook')
-    if day == 1:
-        url = 'https://www.spc.noaa.gov/products/outlook/day1otlk_torn.nolyr.geojson'
-    elif day == 2:
-        url = 'https://www.spc.noaa.gov/products/outlook/day2otlk_torn.nolyr.geojson'
-    elif day == 'test':
-        url = 'https://www.spc.noaa.gov/products/outlook/archive/2021/day1otlk_20210317_1630_torn.lyr.geojson'
-    else:
-        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 185')
-        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
-    response = requests.get(url)  # Requests the data from the GeoJSON URL
-    response.raise_for_status()
-    outlook_data = response.json()
-    return outlook_data  # Returns the data from the Outlook
-
-
-def fetch_wind_outlooks(day):
+    try:
+        with open(rss_seen_path, 'r', encoding='utf-8') as seen_file:
+            entries = json.load(seen_file)
+    except (OSError, ValueError):
+        entries = []
+    seen = collections.OrderedDict()
+    for guid, seen_at in sorted(entries, key=lambda entry: entry[1]):
+        seen[guid] = seen_at
+    prune_rss_seen(seen)
+    return seen
+
+
+# Function to save the RSS entries that were notified
+def save_rss_seen(seen):
     """
-    Fetches the wind outlook data for a specified day.
+    Saves the notified RSS entries so they are not notified again after a restart.
 
     Parameters:
-        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, or 'test'.
+        seen (collections.OrderedDict): The time each entry was seen, keyed by its GUID.
 
     Returns:
-        dict: The outlook data in JSON format.
+        None
     """
-    log.info('Fetching a Wind Outlook')
-    if day == 1:
-        url = 'https://www.spc.noaa.gov/products/outlook/day1otlk_wind.nolyr.geojson'
-    elif day == 2:
-        url = 'https://www.spc.noaa.gov/products/outlook/day2otlk_wind.nolyr.geojson'
-    elif day == 'test':
-        url = 'https://www.spc.noaa.gov/products/outlook/archive/2021/day1otlk_20210325_1630_wind.lyr.geojson'
-    else:
-        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 211')
-        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
-        sys.exit(0)
-    response = requests.get(url)  # Requests the data from the GeoJSON URL
-    response.raise_for_status()
-    outlook_data = response.json()
-    return outlook_data  # Returns the data from the outlook
+    try:
+        os.makedirs(os.path.dirname(rss_seen_path), exist_ok=True)
+        with open(rss_seen_path + '.tmp', 'w', encoding='utf-8') as seen_file:
+            json.dump(list(seen.items()), seen_file)
+        os.replace(rss_seen_path + '.tmp', rss_seen_path)
+    except OSError:
+        log.warning('RSS - Could not save the notified entries', exc_info=True)
 
 
-def fetch_hail_outlooks(day):
+# Function to forget old RSS entries
+def prune_rss_seen(seen):
     """
-    Fetches the hail outlook data for a specified day.
+    Forgets the oldest RSS entries until no more than rss_seen_max_entries remain and none is older than rss_seen_max_age.
 
     Parameters:
-        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, or 'test'.
+        seen (collections.OrderedDict): The time each entry was seen, keyed by its GUID, oldest first.
 
     Returns:
-        dict: The outlook data in JSON format.
-
-    Raises:
-        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
-
-    Exits the program with status code 0 if the specified day is invalid.
+        None
     """
-    log.info('Fetching a Hail Outlook')
-    if day == 1:
-        url = 'https://www.spc.noaa.gov/products/outlook/day1otlk_hail.nolyr.geojson'
-    elif day == 2:
-        url = 'https://www.spc.noaa.gov/products/outlook/day2otlk_hail.nolyr.geojson'
-    elif day == 'test':
-        url = 'https://www.spc.noaa.gov/products/outlook/archive/2021/day1otlk_20210526_1630_hail.lyr.geojson'
-    else:
-        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 243')
-        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
-        sys.exit(0)
-    response = requests.get(url)
-    response.raise_for_status()
-    outlook_data = response.json()
-    return outlook_data  # Returns the data from the outlook
+    oldest_allowed = time.time() - rss_seen_max_age
+    while seen and (len(seen) > rss_seen_max_entries or next(iter(seen.values())) < oldest_allowed):
+        seen.popitem(last=False)
 
 
-def fetch_d48_outlooks(day):
+# Function to get the key an RSS entry is remembered by
+def rss_entry_key(entry):
     """
-    Fetches the 48 hour outlook data for a specified day.
+    Gets the GUID of an RSS entry, falling back to its link or title if the feed leaves it out.
 
     Parameters:
-        day (int): The day for which to fetch the outlook data. Can be 4, 5, 6, 7, or 8.
+        entry (feedparser.FeedParserDict): The RSS entry.
 
     Returns:
-        dict: The outlook data in JSON format.
+        str: The key of the entry.
     """
-    log.info('Fetching Day ' + str(day) + ' outlook')
-    if day == 4:
-        url = 'https://www.spc.noaa.gov/products/exper/day4-8/day4prob.lyr.geojson'
-    elif day == 5:
-        url = 'https://www.spc.noaa.gov/products/exper/day4-8/day5prob.lyr.geojson'
-    elif day == 6:
-        url = 'https://www.spc.noaa.gov/products/exper/day4-8/day6prob.lyr.geojson'
-    elif day == 7:
-        url = 'https://www.spc.noaa.gov/products/exper/day4-8/day7prob.lyr.geojson'
-    elif day == 8:
-        url = 'https://www.spc.noaa.gov/products/exper/day4-8/day8prob.lyr.geojson'
-    else:
-        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 274')
-        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
-        sys.exit(0)
-    response = requests.get(url)
-    response.raise_for_status()
-    outlook_data = response.json()
-    return outlook_data  # Returns the data from the outlook
+    return entry.get('id') or entry.get('link') or entry.get('title', '')
 
 
-def fetch_prob_outlooks(day):
+# Function to pick how long to wait before checking the RSS feed again
+def rss_poll_interval(interval, now=None):
     """
-    Fetches a probabilistic outlook for a given day.
+    Picks the wait before the next RSS check: rss_fast_interval near the issuance time of a watched product,
+    and interval the rest of the time.
 
     Parameters:
-        day (int): The day for which to fetch the outlook.
+        interval (int): The usual seconds between checks.
+        now (float): The current time as a Unix timestamp, or None for the current time.
 
     Returns:
-        dict: The outlook data in JSON format.
-
-    Raises:
-        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
-
-    Exits the program with status code 0 if the specified day is invalid.
+        int: The seconds to wait.
     """
-    log.info('Fetching a Probabilistic Outlook')
-    if day == 3:
-        url = 'https://www.spc.noaa.gov/products/outlook/day3otlk_prob.lyr.geojson'
-    else:
-        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 302')
-        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
-        sys.exit(0)
-    response = requests.get(url)
-    response.raise_for_status()
-    outlook_data = response.json()
-    return outlook_data  # Returns the data from the outlook
-
-
-# Function to create the output directory
-def create_output_directory():
+    now = time.time() if now is None else now
+    seconds_into_day = now % 86400
+    for product in rss_watched_products:
+        for issue_time in product_issue_times(product, now):
+            issue_seconds = int(issue_time[:2]) * 3600 + int(issue_time[2:]) * 60
+            distance = abs(seconds_into_day - issue_seconds)
+            if min(distance, 86400 - distance) <= rss_issue_window:
+                return min(interval, rss_fast_interval)
+    return interval
+
+
+# Function to notify the user about an RSS entry
+def notify_rss_entry(title, message=None):
     """
-    Creates an output directory in the specified current directory.
+    Shows a desktop notification for an RSS entry.
 
     Parameters:
-        current_directory (str): The path of the current directory.
+        title (str): The title of the RSS entry.
+        message (str): The notification text, or None for the default text.
 
     Returns:
-        str: The path of the newly created output directory.
+        None
     """
-    log.info('running create_output_directory')
-    output_directory = os.path.join(current_directory, 'output')  # Creates a folder named "output"
-    os.makedirs(output_directory, exist_ok=True)
-    return output_directory  # Returns where the output directory is
-
+    truncated_title = title[:256]
+    log.info(f'RSS - New RSS Notification. {title}')  # skipcq: PYL-W1203
+    notification.notify(  # type: ignore
+        title="New RSS Feed Update",
+        message=message or (f'{truncated_title}. Check it out in the App!'),
+        timeout=10
+    )
 
-def setup_plot():
-    """
-    Sets up a plot with a specified size and aspect ratio.
 
-    Returns:
-        fig (matplotlib.figure.Figure): The figure object.
-        ax (matplotlib.axes.Axes): The axes object.
+def check_rss_feed(url, interval):
     """
-    log.info('running setup_plot')
-    fig, ax = plt.subplots(figsize=(10, 8))  # Set the size of the plot
-    fig.set_facecolor('black')
-    ax.set_aspect('auto', adjustable='box')
-    return fig, ax  # Return the variables holding the data about the plot
-
+    Checks the RSS feed at the specified URL for new entries and sends a notification for each new entry.
 
-# Function to set the limits of the plot
-def set_plot_limits(ax):
-    """
-    Sets the x and y limits of a plot.
+    Requests are conditional, so an unchanged feed costs a 304. Notified entries are remembered by GUID
+    across restarts. Failures back off exponentially up to rss_max_backoff, and the feed is checked
+    faster around the issuance times of the watched products. A convective outlook entry is only
+    remembered once SPC's GeoJSON carries the outlook it announces; until then it is tried again with
+    the same backoff, and if it still has not updated rss_max_backoff after the entry was first seen, the
+    entry is notified anyway. An entry that leaves the feed while it waits is dropped, and notified if
+    it was already past that point.
 
     Parameters:
-        ax (matplotlib.axes.Axes): The axes object to set the limits for.
+        url (str): The URL of the RSS feed to check.
+        interval (int): The usual interval in seconds to wait between checks.
 
     Returns:
         None
     """
-    log.info('running set_plot_limits')
-    ax.set_xlim([-125, -66])  # Base for x: (-125, -66)
-    ax.set_ylim([20, 60])  # Base for y: (23, 50)
+    seen = load_rss_seen()
+    etag = last_modified = None
+    failures = 0
+    entries = []  # Entries of the last feed downloaded, looked at again while the feed is unchanged
+    pending = {}  # Title, detection time and pre-render future of the outlook entries being drawn, keyed by GUID
+    retries = {}  # Title, attempts, time of the next attempt and detection time of the outlook entries to try again, keyed by GUID
+
+    while True:
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            response = get_http_session().get(url, headers=headers, timeout=fetch_timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            failures += 1
+            delay = min(interval * 2 ** failures, rss_max_backoff)
+            log.warning(f'RSS - Could not reach the RSS feed, trying again in {delay} seconds', exc_info=True)  # skipcq: PYL-W1203
+            time.sleep(delay)
+            continue
+        failures = 0
+
+        if response.status_code == 304:
+            log.info('RSS - The feed has not changed')
+        else:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            entries = feedparser.parse(response.content).entries
+
+        now = time.time()
+        remembered = 0
+        for key, (title, detected_at, future) in list(pending.items()):
+            if not future.done():
+                continue
+            del pending[key]
+            if future.result():
+                retries.pop(key, None)
+            elif now - detected_at < rss_max_backoff:
+                attempts = retries[key][1] if key in retries else 0
+                delay = min(rss_fast_interval * 2 ** attempts, rss_max_backoff)
+                log.info(f'RSS - The outlooks of {title} have not updated yet, trying again in {delay} seconds')  # skipcq: PYL-W1203
+                retries[key] = (title, attempts + 1, now + delay, detected_at)
+                continue
+            else:
+                log.warning('RSS - The outlooks of ' + title + ' never updated, notifying without them')
+                retries.pop(key, None)
+                notify_rss_entry(title)
+            seen[key] = now
+            remembered += 1
+
+        for entry in entries:
+            key = rss_entry_key(entry)
+            if key in seen or key in pending or (key in retries and retries[key][2] > now):
+                continue
+            products = classify_rss_entry(entry.title)
+            if products:
+                # Draw the outlook before telling the user about it
+                detected_at = retries[key][3] if key in retries else now
+                pending[key] = (entry.title, detected_at,
+                                prerender_executor.submit(prerender_entry, entry.title, products, detected_at))
+            else:
+                seen[key] = now
+                remembered += 1
+                notify_rss_entry(entry.title)
+
+        feed_keys = {rss_entry_key(entry) for entry in entries}
+        for key in [key for key in retries if key not in feed_keys]:
+            title, _, _, detected_at = retries.pop(key)
+            if now - detected_at < rss_max_backoff:
+                log.info('RSS - ' + title + ' left the feed before its outlooks updated')
+                continue
+            log.warning('RSS - ' + title + ' left the feed and its outlooks never updated, notifying without them')
+            notify_rss_entry(title)
+            seen[key] = now
+            remembered += 1
+        if remembered:
+            prune_rss_seen(seen)
+            save_rss_seen(seen)
+        log.info(f'RSS - {remembered} new entries, {len(pending.keys() | retries.keys())} waiting on SPC, {len(seen)} remembered')  # skipcq: PYL-W1203
+        time.sleep(rss_poll_interval(interval))
 
 
-# Function to remove all labels and axes
-def remove_axes_labels_boxes_title(ax):
+# Set the global exception handler
+def global_exception_handler(exc_type, exc_value, exc_traceback):
     """
-    Removes axes, labels, boxes, and titles from a plot.
+    Handles uncaught exceptions by logging the error and exiting the program.
 
     Parameters:
-        ax (matplotlib.axes.Axes): The axes object to modify.
+        exc_type (type): The type of the exception.
+        exc_value (Exception): The instance of the exception.
+        exc_traceback (traceback): The traceback object associated with the exception.
 
     Returns:
         None
     """
-    log.info('running remove_axes_labels_boxes_title')
-    # Remove the Axes
-    ax.set_xticks([])
-    ax.set_yticks([])
+    log.error('uncaught exception', exc_info=(exc_type, exc_value, exc_traceback))
+    sys.exit(0)
 
-    # Remove the Labels
-    ax.set_xticklabels([])
-    ax.set_yticklabels([])
 
-    # Remove the Box around the Plot
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_visible(False)
-    ax.spines['left'].set_visible(False)
+sys.excepthook = global_exception_handler
 
-    # Remove the Title
-    plt.title('')
 
+# Shared HTTP Session
+http_session = None
+http_session_lock = threading.Lock()
 
-# Function to control the CONUS State Outlines
-def add_overlays(ax, outlook_type):
+
+# Function to get the shared HTTP session
+def get_http_session():
     """
-    Adds overlays and shapefiles to a plot.
+    Gets the HTTP session shared by the outlook fetchers and the RSS feed, creating it on first use.
+
+    The session keeps connections to SPC alive between requests, asks for gzip compressed replies and
+    retries failed requests with an exponential backoff.
 
     Parameters:
-        ax (matplotlib.axes.Axes): The axes object to add overlays to.
-        current_directory (str): The path of the current directory.
-        type (str): The type of header image to add.
+        None
 
     Returns:
-        None
+        requests.Session: The shared session.
     """
-    log.info('Adding all Overlays and Shapefiles')
-
-    # State Outlines
-    states_shapefile = os.path.join(current_directory, '../files/mapping/s_11au16.shp')
-    states = gpd.read_file(states_shapefile)
-    states.plot(ax=ax, edgecolor='black', lw=0.75, alpha=0.75)
-    ax.set_facecolor("black")  # Background of the CONUS Shapefile will be Black
-
-    # Interstate Lines
-    highways_shapefile = os.path.join(current_directory, '../files/mapping/USA_Freeway_System.shp')
-    highways_gdf = gpd.read_file(highways_shapefile)
-    highways_gdf.plot(ax=ax, color='red', linewidth=0.6, alpha=0.75)
-
-    # Header Image
-    if outlook_type == 'cat':
-        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_cat_header.png'))
-    elif outlook_type == 'tor':
-        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_tor_header.png'))
-    elif outlook_type == 'wind':
-        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_wind_header.png'))
-    elif outlook_type == 'hail':
-        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_hail_header.png'))
-    elif outlook_type == 'd4-8':
-        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_d48_header.png'))
-    elif outlook_type == 'prob':
-        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_prob_header.png'))
-    else:
-        log.error('Header Error. Outlook_type ' + outlook_type + 'Error on line 429')
-        popup('error', 'Header Error', 'An error has occured getting the header image. The program will now quit.')
-        sys.exit(0)
-    header_img = OffsetImage(header_img, zoom=0.4)
-    ab = AnnotationBbox(header_img, (0.3, 0.95), xycoords='axes fraction', frameon=False)
-    ax.add_artist(ab)
+    global http_session  # skipcq: PYL-W0603
+    with http_session_lock:
+        if http_session is None:
+            retry = Retry(total=http_retries, backoff_factor=http_backoff_factor, status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=('GET', 'HEAD'), raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=http_pool_size, pool_maxsize=http_pool_size, max_retries=retry)
+            http_session = requests.Session()
+            http_session.mount('https://', adapter)
+            http_session.mount('http://', adapter)
+            http_session.headers.update({'Accept-Encoding': 'gzip, deflate', 'User-Agent': 'Severe Weather Outlook Display'})
+            log.info('Created the shared HTTP session')
+        return http_session
+
+
+# Function to count how often connections are reused
+def http_session_stats():
+    """
+    Counts the requests sent through the shared session and the connections opened to send them.
 
+    Parameters:
+        None
 
-# Function to control the basemap
-def add_basemap(ax):
+    Returns:
+        dict: The number of 'requests', new 'connections' and 'reused' connections.
     """
-    Adds a basemap to a plot.
+    session = get_http_session()
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    requests_sent = connections = 0
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                connections += pool.num_connections
+    return {'requests': requests_sent, 'connections': connections, 'reused': requests_sent - connections}
+
+
+# Outlook Cache
+http_cache_lock = threading.Lock()
+http_cache_memory = {}  # Cache entries and their parsed outlooks kept in memory, keyed by URL
+geojson_features_pattern = re.compile(r'"features"\s*:\s*\[')  # Start of the features array in a GeoJSON document
+
+
+# Function to get the cache file paths for a URL
+def http_cache_paths(url):
+    """
+    Gets the paths of the cached body and metadata files for a URL.
 
     Parameters:
-        ax (matplotlib.axes.Axes): The axes object to add the basemap to.
+        url (str): The URL of the cached product.
 
     Returns:
-        None
+        tuple: The path of the body file and the path of the metadata file.
     """
-    log.info('running add_basemap')
-    ctx.add_basemap(ax, zoom=6, crs='EPSG:4326', source='https://tiles.stadiamaps.com/tiles/stamen_terrain/{z}/{x}/{y}{r}.png?api_key=63fe7729-f786-444d-8787-817db15f3368')  # type: ignore  # skipcq: FLK-E501
-    log.info('basemap loaded')
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(http_cache_directory, key + '.json'), os.path.join(http_cache_directory, key + '.meta.json')
 
 
-# Function to check if there is a outlook to display
-def check_outlook_availability(outlook_data):
+# Function to read a cached response
+def read_http_cache(url):
     """
-    Checks if there is an available outlook in the given outlook data.
+    Reads the cache entry for a URL, from memory if possible and from disk otherwise. An entry read from
+    disk has no parsed outlook until load_cached_outlook is called.
 
     Parameters:
-        outlook_data (dict): The outlook data to check for availability.
+        url (str): The URL of the cached product.
 
     Returns:
-        bool: True if an outlook is available, False otherwise.
+        dict: The cache entry with 'etag', 'last_modified', 'fetched_at' and 'outlook' keys, or None if not cached.
     """
-    log.info('running check_outlook_availability')
-    for feature in outlook_data['features']:
-        # Check is there is a LABEL if there is coordinates in the geometry portion of the feature from the Source
-        if 'coordinates' in feature['geometry']:
-            log.info('There is an outlook')
-            return True
-    return False
-
-
-# Function to plot the polygons
-def plot_outlook_polygons(ax, outlook_type, outlook_data):  # skipcq: PY-R1000
+    with http_cache_lock:
+        entry = http_cache_memory.get(url)
+    if entry is not None:
+        return entry
+
+    body_path, meta_path = http_cache_paths(url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as meta_file:
+            meta = json.load(meta_file)
+    except (OSError, ValueError):
+        return None
+    if not os.path.exists(body_path):
+        return None
+
+    entry = {'etag': meta['etag'], 'last_modified': meta['last_modified'], 'fetched_at': meta['fetched_at'], 'outlook': None}
+    with http_cache_lock:
+        http_cache_memory[url] = entry
+    return entry
+
+
+# Function to parse a cached outlook
+def load_cached_outlook(outlook_type, url, entry):
     """
-    Plots outlook polygons on a given axis.
+    Gets the parsed outlook for a cache entry, streaming it from the cached body file if it is not in memory yet.
 
     Parameters:
-        ax (matplotlib.axes.Axes): The axis to plot the outlook polygons on.
-        outlook_type (str): The type of outlook to plot (e.g. 'cat', 'tor', 'wind', etc.).
-        outlook_data (dict): A dictionary containing the outlook data, including features and geometry.
+        outlook_type (str): The type of outlook (e.g. 'cat', 'tor', 'wind', etc.).
+        url (str): The URL of the cached product.
+        entry (dict): The cache entry from read_http_cache.
 
     Returns:
-        None
+        Outlook: The parsed outlook, or None if the cached body could not be read.
     """
-    log.info('Plotting Outlook Polygons')
-    if outlook_type == 'cat':
-        for feature in outlook_data['features']:
-            outlook_label = feature['properties']['LABEL']
-            outlook_polygon = feature['geometry']['coordinates']
-            if feature['geometry']['type'] == 'Polygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-            for polygon in outlook_polygon:  # Find the properties of each polygon
-                ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('cat', outlook_label)))
-    elif outlook_type == 'tor':
-        for feature in outlook_data['features']:
-            outlook_label = feature['properties']['LABEL']
-            outlook_polygon = feature['geometry']['coordinates']
-            if feature['geometry']['type'] == 'Polygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for polygon in outlook_polygon:  # Find the properties of each polygon
-                    if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('tor', outlook_label),
-                                                      edgecolor='black', hatch='x'))
-                    else:
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('tor', outlook_label)))
-            elif feature['geometry']['type'] == 'MultiPolygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for multipolygon in outlook_polygon:  # Find the properties of each polygon
-                    for polygon in multipolygon:
-                        if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('tor', outlook_label),
-                                                          edgecolor='black', hatch='x'))
-                        else:
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('tor', outlook_label)))
-    elif outlook_type == 'wind':
-        for feature in outlook_data['features']:
-            outlook_label = feature['properties']['LABEL']
-            outlook_polygon = feature['geometry']['coordinates']
-            if feature['geometry']['type'] == 'Polygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for polygon in outlook_polygon:  # Find the properties of each polygon
-                    if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('wind', outlook_label),
-                                                      edgecolor='black', hatch='x'))
-                    else:
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('wind', outlook_label)))
-            elif feature['geometry']['type'] == 'MultiPolygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for multipolygon in outlook_polygon:  # Find the properties of each polygon
-                    for polygon in multipolygon:
-                        if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('wind', outlook_label),
-                                                          edgecolor='black', hatch='x'))
-                        else:
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('wind', outlook_label)))
-    elif outlook_type == 'hail':
-        for feature in outlook_data['features']:
-            outlook_label = feature['properties']['LABEL']
-            outlook_polygon = feature['geometry']['coordinates']
-            if feature['geometry']['type'] == 'Polygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for polygon in outlook_polygon:  # Find the properties of each polygon
-                    if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('hail', outlook_label),
-                                                      edgecolor='black', hatch='x'))
-                    else:
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('hail', outlook_label)))
-            elif feature['geometry']['type'] == 'MultiPolygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for multipolygon in outlook_polygon:  # Find the properties of each polygon
-                    for polygon in multipolygon:
-                        if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('hail', outlook_label),
-                                                          edgecolor='black', hatch='x'))
-                        else:
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('hail', outlook_label)))
-    elif outlook_type == 'd4-8':
-        for feature in outlook_data['features']:
-            outlook_label = feature['properties']['LABEL']
-            outlook_polygon = feature['geometry']['coordinates']
-            if feature['geometry']['type'] == 'Polygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-            for polygon in outlook_polygon:  # Find the properties of each polygon
-                ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('d4-8', outlook_label)))
-    elif outlook_type == 'prob':
-        for feature in outlook_data['features']:
-            outlook_label = feature['properties']['LABEL']
-            outlook_polygon = feature['geometry']['coordinates']
-            if feature['geometry']['type'] == 'Polygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for polygon in outlook_polygon:  # Find the properties of each polygon
-                    if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('prob', outlook_label),
-                                                      edgecolor='black', hatch='x'))
-                    else:
-                        ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('prob', outlook_label)))
-            elif feature['geometry']['type'] == 'MultiPolygon':
-                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
-                for multipolygon in outlook_polygon:  # Find the properties of each polygon
-                    for polygon in multipolygon:
-                        if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.2, ec='k', lw=1, fc=color('prob', outlook_label),
-                                                          edgecolor='black', hatch='x'))
-                        else:
-                            ax.add_patch(mpatches.Polygon(polygon[0], alpha=0.5, ec='k', lw=1, fc=color('prob', outlook_label)))
-    else:
-        log.error('Plotting Error. Outlook_Type' + outlook_type + 'error on line 598')
-        popup('error', 'Plotting Error', 'An error has occured plotting the outlook. The program will now quit.')
-        sys.exit(0)
+    if entry['outlook'] is not None:
+        return entry['outlook']
+
+    body_path, _ = http_cache_paths(url)
+    try:
+        with open(body_path, 'rb') as body_file:
+            outlook = Outlook(outlook_type, iter_geojson_features(iter(lambda: body_file.read(stream_chunk_size), b'')))
+    except (OSError, ValueError):
+        log.warning('Could not read the cached copy of ' + url, exc_info=True)
+        return None
+
+    with http_cache_lock:
+        http_cache_memory[url] = dict(entry, outlook=outlook)
+    return outlook
 
 
-# Function to display a popup and end the program if no outlook is available
-def no_outlook_available():  # skipcq: PYL-R1711
+# Function to save a response to the cache
+def write_http_cache(url, entry, new_body_path=None):
     """
-    Displays an error message when no severe weather outlook is available.
+    Saves a cache entry to memory and disk. The body file is only replaced when a new body was downloaded.
 
     Parameters:
-        None
+        url (str): The URL of the cached product.
+        entry (dict): The cache entry with 'etag', 'last_modified', 'fetched_at' and 'outlook' keys.
+        new_body_path (str): The temporary file holding a newly downloaded body, or None if only the metadata changed.
 
     Returns:
         None
-
-    Logs:
-        info: No outlook available
     """
-    log.info('There is no outlook available')
-    popup('warning', 'No Outlook', "There is no outlook available at this time")
-    return  # skipcq: PYL-R1711
+    with http_cache_lock:
+        http_cache_memory[url] = entry
+
+    body_path, meta_path = http_cache_paths(url)
+    meta = {'url': url, 'etag': entry['etag'], 'last_modified': entry['last_modified'], 'fetched_at': entry['fetched_at']}
+    try:
+        if new_body_path is not None:
+            os.replace(new_body_path, body_path)
+        else:
+            os.utime(body_path)  # Mark the entry as recently used
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(meta_path + '.tmp', meta_path)
+    except OSError:
+        log.warning('Could not write the outlook cache for ' + url, exc_info=True)
+        return
 
+    if new_body_path is not None:
+        evict_http_cache()
 
-# Function to display the outlook
-def display_cat_outlook(day, outlook_data):
+
+# Function to keep the cache under its size limit
+def evict_http_cache():
     """
-    Displays the categorical outlook for a given day.
+    Removes the least recently used cache entries until the cache fits in http_cache_max_bytes.
 
     Parameters:
-        day (int): The day for which to display the outlook.
-        outlook_data (dict): The data containing the outlook information.
+        None
 
     Returns:
         None
     """
-    log.info('Displaying Categorial Outlook')
-    fig, ax = setup_plot()
+    try:
+        body_files = [os.path.join(http_cache_directory, name) for name in os.listdir(http_cache_directory)
+                      if name.endswith('.json') and not name.endswith('.meta.json')]
+        body_stats = sorted(((os.stat(path), path) for path in body_files), key=lambda item: item[0].st_mtime)
+    except OSError:
+        return
+
+    total_bytes = sum(stat.st_size for stat, _ in body_stats)
+    for stat, body_path in body_stats:
+        if total_bytes <= http_cache_max_bytes:
+            break
+        meta_path = body_path[:-len('.json')] + '.meta.json'
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                url = json.load(meta_file).get('url')
+        except (OSError, ValueError):
+            url = None
+        for path in (body_path, meta_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with http_cache_lock:
+            http_cache_memory.pop(url, None)
+        total_bytes -= stat.st_size
+        log.info('Evicted ' + str(url) + ' from the outlook cache')
+
+
+# Function to decode GeoJSON features as they arrive
+def iter_geojson_features(chunks):
+    """
+    Decodes the features of a GeoJSON FeatureCollection one at a time from a stream of byte chunks, so a
+    feature can be parsed as soon as it has been downloaded and the whole document is never held in memory.
 
-    # Clear the figure and axes before displaying a new outlook
-    fig.clear()
-    ax = fig.add_subplot(111)
+    Parameters:
+        chunks (iterable): The bytes of the document, in pieces of any size.
 
-    if not check_outlook_availability(outlook_data):
-        no_outlook_available()
-        start_gui()
+    Yields:
+        dict: Each feature of the collection, in order.
 
-    add_overlays(ax, 'cat')
-    set_plot_limits(ax)
-    add_basemap(ax)
-    remove_axes_labels_boxes_title(ax)
+    Raises:
+        ValueError: If the document is not valid JSON or ends before its features array does.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    in_features = False
+    retry_length = 0  # Don't try to decode an unfinished feature again until the buffer has doubled
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        buffer += text_decoder.decode(b'' if final else chunk, final)
+        if not in_features:
+            match = geojson_features_pattern.search(buffer)
+            if match is None:
+                buffer = buffer[-64:]  # Keep enough to match the key if it is split between chunks
+                continue
+            buffer = buffer[match.end():]
+            in_features = True
+        if len(buffer) < retry_length and not final:
+            continue
+
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position < len(buffer) and buffer[position] == ']':
+                return
+            try:
+                feature, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # The rest of the feature is still downloading
+            yield feature
+        buffer = buffer[position:]
+        retry_length = 2 * len(buffer)
+    raise ValueError('The GeoJSON document ended before its features did')
+
+
+# Function to save chunks to a file as they pass through
+def save_chunks(chunks, file):
+    """
+    Writes each chunk to a file before passing it on.
 
-    plot_outlook_polygons(ax, 'cat', outlook_data)
+    Parameters:
+        chunks (iterable): The chunks of bytes.
+        file (file object): The file to write them to.
 
-    output_directory = create_output_directory()
-    output_filename = f'spc_day_{day}cat_outlook.png'
-    output_path = os.path.join(output_directory, output_filename)
+    Yields:
+        bytes: Each chunk, unchanged.
+    """
+    for chunk in chunks:
+        file.write(chunk)
+        yield chunk
 
-    for widget in root.winfo_children():
-        widget.destroy()
 
-    # Create a canvas and add it to the root window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
-    canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+# Function to fetch an outlook
+def fetch_outlook(outlook_type, url):
+    """
+    Fetches a GeoJSON outlook from SPC, reusing the cached copy when it has not changed.
 
-    # Create a custom toolbar with a close button
-    toolbar = NavigationToolbar2Tk(canvas, root)
-    toolbar.update()
+    A copy younger than http_cache_max_age is returned without touching the network. Older copies are
+    revalidated with If-None-Match/If-Modified-Since, and a 304 reply returns the cached outlook. In
+    offline mode any cached copy is returned, however old. A new download is parsed as it streams in
+    and written to the cache at the same time.
 
-    def close_figure():
-        """
-        Closes the current figure, withdraws the root window, and starts the GUI.
+    Parameters:
+        outlook_type (str): The type of outlook (e.g. 'cat', 'tor', 'wind', etc.).
+        url (str): The URL of the GeoJSON product.
 
-        Parameters:
-            None
+    Returns:
+        Outlook: The parsed outlook.
 
-        Returns:
-            None
-        """
-        plt.close(fig)
-        root.withdraw()
-        start_gui()
+    Raises:
+        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
+        ValueError: If the response is not a GeoJSON FeatureCollection.
+    """
+    entry = read_http_cache(url)
+    if entry is not None and (offline_mode or time.time() - entry['fetched_at'] < http_cache_max_age):
+        outlook = load_cached_outlook(outlook_type, url, entry)
+        if outlook is not None:
+            log.info('Using cached copy of ' + url)
+            return outlook
+        entry = None
+    if offline_mode:
+        raise requests.exceptions.ConnectionError('No cached copy of ' + url + ' is available in offline mode')
+
+    headers = {}
+    if entry is not None:
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    with get_http_session().get(url, headers=headers, timeout=fetch_timeout, stream=True) as response:
+        if response.status_code == 304 and entry is not None:
+            outlook = load_cached_outlook(outlook_type, url, entry)
+            if outlook is None:
+                raise ValueError('The cached copy of ' + url + ' could not be read')
+            log.info('Cached copy of ' + url + ' is still current')
+            write_http_cache(url, dict(entry, fetched_at=time.time(), outlook=outlook))
+            return outlook
+
+        response.raise_for_status()
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'outlook': None
+        }
+        chunks = response.iter_content(stream_chunk_size)
+        new_body_path = http_cache_paths(url)[0] + '.' + str(threading.get_ident()) + '.tmp'
+        try:
+            os.makedirs(http_cache_directory, exist_ok=True)
+            body_file = open(new_body_path, 'wb')  # skipcq: PTC-W6004
+        except OSError:
+            log.warning('Could not write the outlook cache for ' + url, exc_info=True)
+            entry['outlook'] = Outlook(outlook_type, iter_geojson_features(chunks))
+            return entry['outlook']
+        try:
+            with body_file:
+                chunks = save_chunks(chunks, body_file)
+                entry['outlook'] = Outlook(outlook_type, iter_geojson_features(chunks))
+                for _ in chunks:  # Save the rest of the document after the features
+                    pass
+        except BaseException:
+            os.remove(new_body_path)
+            raise
+
+    write_http_cache(url, entry, new_body_path)
+    return entry['outlook']
+
+
+# Rank of each risk level in each outlook type, lowest first. Labels that are not listed (like 'SIGN') have a rank of 0
+risk_level_mappings = {
+    'cat': {
+        'TSTM': 1,  # Thunderstorm
+        'MRGL': 2,  # Marginal
+        'SLGT': 3,  # Slight
+        'ENH': 4,   # Enhanced
+        'MDT': 5,   # Moderate
+        'HIGH': 6   # High
+    },
+    'tor': {
+        '0.02': 1,
+        '0.05': 2,
+        '0.10': 3,
+        '0.15': 4,
+        '0.30': 5,
+        '0.45': 6,
+        '0.60': 7
+    },
+    'prob': {
+        '0.05': 1,
+        '0.15': 2,
+        '0.30': 3,
+        '0.45': 4,
+        '0.60': 5,
+    },
+    'd4-8': {
+        '0.15': 1,
+        '0.30': 2
+    }
+}
+risk_level_mappings['wind'] = risk_level_mappings['hail'] = risk_level_mappings['prob']
 
-    close_button = tk.Button(toolbar, text='Close', command=close_figure)
-    close_button.pack(side=tk.RIGHT)
 
-    root.protocol("WM_DELETE_WINDOW", close_figure)
+class OutlookFeature:
+    """
+    One risk area of a parsed outlook.
 
-    # Show the Tkinter root window with the canvas and toolbar
-    root.deiconify()
-    root.mainloop()
+    Attributes:
+        label (str): The risk level label (e.g. 'SLGT', '0.15', 'SIGN').
+        rank (int): The rank of the label in its outlook type, 0 if it is not a risk level.
+        polygons (range): The indexes of this feature's polygons in the outlook's polygon_offsets.
+        bounds (tuple): The (min_x, min_y, max_x, max_y) of the feature, or None if it has no polygons.
+    """
+    __slots__ = ('label', 'rank', 'polygons', 'bounds')
 
-    log.info('Showing the plot')
-    plt.savefig(output_path, dpi=96, bbox_inches='tight')
+    def __init__(self, label, rank, polygons, bounds):
+        self.label = label
+        self.rank = rank
+        self.polygons = polygons
+        self.bounds = bounds
 
 
-def display_tor_outlook(day, outlook_data):
+class Outlook:
     """
-    Displays a tornado outlook for a given day.
-
-    Parameters:
-        day (int): The day for which to display the tornado outlook.
-        outlook_data (dict): The data containing the tornado outlook information.
-
-    Returns:
-        None
+    A parsed SPC outlook. The rings of every polygon are stored one after another in a single
+    coordinate array, and the offset arrays say where each ring and polygon starts, so the
+    GeoJSON is only walked once when the outlook is parsed.
+
+    Attributes:
+        outlook_type (str): The type of outlook (e.g. 'cat', 'tor', 'wind', etc.).
+        coordinates (numpy.ndarray): Every ring vertex as an (n, 2) array of longitude and latitude.
+        ring_offsets (numpy.ndarray): Where each ring starts in coordinates, with the total vertex count at the end.
+        polygon_offsets (numpy.ndarray): Where each polygon starts in ring_offsets; the first ring of a polygon
+            is its outline and the rest are holes.
+        features (tuple): The OutlookFeature for each risk area, in the order SPC lists them.
+        max_rank (int): The highest rank of any feature that has polygons, 0 if there are none.
+        bounds (tuple): The (min_x, min_y, max_x, max_y) of the outlook, or None if it is empty.
+        available (bool): Whether the outlook has any polygons.
+        issue (str): When the outlook was issued, as the 'YYYYMMDDHHMM' string SPC uses, or None.
+        valid (str): When the outlook starts, or None.
+        expire (str): When the outlook ends, or None.
+        fingerprint (str): A hash of the labels and geometry, the same for re-issuances that draw the same outlook.
     """
-    log.info('Displaying Tornado Outlook')
-    fig, ax = setup_plot()
+    __slots__ = ('outlook_type', 'coordinates', 'ring_offsets', 'polygon_offsets', 'features', 'max_rank', 'bounds',
+                 'available', 'issue', 'valid', 'expire', 'fingerprint')
 
-    # Clear the figure and axes before displaying a new outlook
-    fig.clear()
-    ax = fig.add_subplot(111)
-
-    add_overlays(ax, 'tor')
-    set_plot_limits(ax)
-    add_basemap(ax)
-    remove_axes_labels_boxes_title(ax)
+    def __init__(self, outlook_type, features):
+        """
+        Parses the features of an outlook.
 
-    plot_outlook_polygons(ax, 'tor', outlook_data)
+        Parameters:
+            outlook_type (str): The type of outlook (e.g. 'cat', 'tor', 'wind', etc.).
+            features (iterable): The GeoJSON features of the outlook.
+        """
+        rank_mapping = risk_level_mappings.get(outlook_type, {})
+        self.outlook_type = outlook_type
+        self.issue = self.valid = self.expire = None
+        coordinates = []
+        ring_offsets = [0]
+        polygon_offsets = [0]
+        parsed_features = []
+        for feature in features:
+            properties = feature.get('properties') or {}
+            geometry = feature.get('geometry') or {}
+            outlook_polygon = geometry.get('coordinates') or []
+            if geometry.get('type') == 'Polygon':
+                outlook_polygon = [outlook_polygon]  # Convert single polygon to a list for consistency
+            first_polygon = len(polygon_offsets) - 1
+            for polygon in outlook_polygon:
+                for ring in polygon:
+                    coordinates.extend(ring)
+                    ring_offsets.append(len(coordinates))
+                polygon_offsets.append(len(ring_offsets) - 1)
+            label = properties.get('LABEL') or ''
+            parsed_features.append((label, rank_mapping.get(label, 0), range(first_polygon, len(polygon_offsets) - 1)))
+            self.issue = self.issue or properties.get('ISSUE')
+            self.valid = self.valid or properties.get('VALID')
+            self.expire = self.expire or properties.get('EXPIRE')
+
+        self.coordinates = np.array(coordinates, dtype=float).reshape(-1, 2)
+        self.ring_offsets = np.array(ring_offsets, dtype=np.int64)
+        self.polygon_offsets = np.array(polygon_offsets, dtype=np.int64)
+        self.features = tuple(OutlookFeature(label, rank, polygons, self.vertex_bounds(polygons))
+                              for label, rank, polygons in parsed_features)
+        self.max_rank = max((feature.rank for feature in self.features if feature.polygons), default=0)  # SPC lists empty levels too
+        self.available = len(self.coordinates) > 0
+        self.bounds = self.vertex_bounds(range(len(self.polygon_offsets) - 1))
+
+        fingerprint = hashlib.sha1(outlook_type.encode('utf-8'))
+        for array in (self.coordinates, self.ring_offsets, self.polygon_offsets):
+            fingerprint.update(array.tobytes())
+        for feature in self.features:
+            fingerprint.update(f'{feature.label}:{feature.polygons.start}:{feature.polygons.stop};'.encode('utf-8'))
+        self.fingerprint = fingerprint.hexdigest()
+
+    def vertex_bounds(self, polygons):
+        """
+        Finds the bounding box of a run of polygons.
 
-    output_directory = create_output_directory()
-    output_filename = f'spc_day_{day}_tor_outlook.png'
-    output_path = os.path.join(output_directory, output_filename)
+        Parameters:
+            polygons (range): The indexes of the polygons.
 
-    for widget in root.winfo_children():
-        widget.destroy()
+        Returns:
+            tuple: The (min_x, min_y, max_x, max_y) of the polygons, or None if they have no vertices.
+        """
+        if not polygons:
+            return None
+        start = self.ring_offsets[self.polygon_offsets[polygons.start]]
+        stop = self.ring_offsets[self.polygon_offsets[polygons.stop]]
+        if start == stop:
+            return None
+        vertices = self.coordinates[start:stop]
+        return tuple(float(value) for value in (*vertices.min(axis=0), *vertices.max(axis=0)))
+
+    def rings(self, polygon):
+        """
+        Returns the rings of a polygon as views into the coordinate array.
 
-    # Create a canvas and add it to the root window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
-    canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        Parameters:
+            polygon (int): The index of the polygon.
 
-    # Create a custom toolbar with a close button
-    toolbar = NavigationToolbar2Tk(canvas, root)
-    toolbar.update()
+        Returns:
+            list: The (n, 2) coordinate array of each ring, outline first.
+        """
+        offsets = self.ring_offsets[self.polygon_offsets[polygon]:self.polygon_offsets[polygon + 1] + 1]
+        return [self.coordinates[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
 
-    def close_figure():
+    def geometry(self, feature):
         """
-        Closes the current figure, withdraws the root window, and starts the GUI.
+        Builds the shape of a risk area, holes included.
 
         Parameters:
-            None
+            feature (OutlookFeature): The risk area.
 
         Returns:
-            None
+            shapely.geometry.MultiPolygon: Every polygon of the risk area.
         """
-        plt.close(fig)
-        root.withdraw()
-        start_gui()
+        polygons = [self.rings(polygon) for polygon in feature.polygons]
+        return MultiPolygon([Polygon(rings[0], rings[1:]) for rings in polygons])
 
-    close_button = tk.Button(toolbar, text='Close', command=close_figure)
-    close_button.pack(side=tk.RIGHT)
+    def label_rings(self):
+        """
+        Collects the outline of every polygon, grouped by the risk level it belongs to.
 
-    root.protocol("WM_DELETE_WINDOW", close_figure)
+        Returns:
+            dict: The outline rings for each label, in the order the labels first appear in the outlook.
+        """
+        rings = {}
+        for feature in self.features:
+            if not feature.polygons:
+                continue
+            label_rings = rings.setdefault(feature.label, [])
+            for polygon in feature.polygons:
+                start = self.ring_offsets[self.polygon_offsets[polygon]]
+                label_rings.append(self.coordinates[start:self.ring_offsets[self.polygon_offsets[polygon] + 1]])
+        return rings
+
+
+# Name of each risk level rank in each outlook type, starting with rank 0
+risk_level_names = {
+    'cat': ('None', 'Thunderstorm', 'Marginal', 'Slight', 'Enhanced', 'Moderate', 'High'),
+    'tor': ('None', '2%', '5%', '10%', '15%', '30%', '45%', '60%'),
+    'prob': ('None', '5%', '15%', '30%', '45%', '60%'),
+    'd4-8': ('None', '15%', '30%')
+}
+risk_level_names['wind'] = risk_level_names['hail'] = risk_level_names['prob']
+
+# Risk Summaries
+earth_radius = 6371.0088  # Mean radius of the Earth in kilometers
+outlook_summaries = {}  # Summary of each outlook issuance, keyed by outlook type, issue time and valid time
+outlook_summaries_lock = threading.Lock()
+
+
+# Function to get the key an outlook issuance is cached under
+def outlook_cache_key(outlook_data):
+    """
+    Gets the key the summary and spatial index of an outlook issuance are cached under.
 
-    # Show the Tkinter root window with the canvas and toolbar
-    root.deiconify()
-    root.mainloop()
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
 
-    log.info('Showing the plot')
-    plt.savefig(output_path, dpi=96, bbox_inches='tight')
+    Returns:
+        tuple: The outlook type, issue time and valid time, or None if the outlook has no issue time.
+    """
+    if outlook_data.issue is None:
+        return None
+    return outlook_data.outlook_type, outlook_data.issue, outlook_data.valid
 
 
-def display_wind_outlook(day, outlook_data):
+# Function to find the area of a ring
+def ring_area(ring):
     """
-    Displays a wind outlook for a given day.
+    Finds the area of a longitude/latitude ring on a spherical Earth.
 
     Parameters:
-        day (int): The day for which to display the wind outlook.
-        outlook_data (dict): The data containing the wind outlook information.
+        ring (numpy.ndarray): The (n, 2) coordinates of the ring, in degrees.
 
     Returns:
-        None
+        float: The area enclosed by the ring in square kilometers.
     """
-    log.info('Displaying Wind Outlook')
-    fig, ax = setup_plot()
+    longitudes = np.radians(ring[:, 0])
+    latitudes = np.sin(np.radians(ring[:, 1]))
+    return abs(float(np.sum((np.roll(longitudes, -1) - longitudes) * (latitudes + np.roll(latitudes, -1))))) * earth_radius ** 2 / 2
 
-    # Clear the figure and axes before displaying a new outlook
-    fig.clear()
-    ax = fig.add_subplot(111)
 
-    add_overlays(ax, 'wind')
-    set_plot_limits(ax)
-    add_basemap(ax)
-    remove_axes_labels_boxes_title(ax)
+# Function to summarize the risk in an outlook
+def summarize_outlook(outlook_data):
+    """
+    Summarizes the risk in an outlook in a single pass over its features. Summaries are cached by issuance,
+    so summarizing a fresh download of the same outlook costs nothing.
 
-    plot_outlook_polygons(ax, 'wind', outlook_data)
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
 
-    output_directory = create_output_directory()
-    output_filename = f'spc_day_{day}_wind_outlook.png'
-    output_path = os.path.join(output_directory, output_filename)
+    Returns:
+        dict: 'highest_risk' (the name of the highest risk level), 'highest_rank', 'levels' (the labels present,
+        lowest first), 'significant' (whether there is a significant severe area), 'areas' (square kilometers
+        covered by each label) and 'area' (square kilometers covered by the outlook).
+    """
+    summary_key = outlook_cache_key(outlook_data)
+    if summary_key is not None:
+        with outlook_summaries_lock:
+            summary = outlook_summaries.get(summary_key)
+        if summary is not None:
+            return summary
+
+    highest_rank = 0
+    ranks = {}
+    areas = {}
+    for feature in outlook_data.features:
+        if not feature.polygons:
+            continue
+        highest_rank = max(highest_rank, feature.rank)
+        ranks[feature.label] = feature.rank
+        area = 0.0
+        for polygon in feature.polygons:
+            rings = outlook_data.rings(polygon)
+            area += ring_area(rings[0]) - sum(ring_area(hole) for hole in rings[1:])
+        areas[feature.label] = areas.get(feature.label, 0.0) + area
+
+    level_areas = [area for label, area in areas.items() if ranks[label]]
+    summary = {
+        'highest_risk': risk_level_names.get(outlook_data.outlook_type, ('None',))[highest_rank],
+        'highest_rank': highest_rank,
+        'levels': tuple(sorted((label for label, rank in ranks.items() if rank), key=ranks.get)),
+        'significant': 'SIGN' in ranks,
+        'areas': areas,
+        'area': max(level_areas, default=0.0)  # SPC draws each risk level inside the one below it
+    }
 
-    for widget in root.winfo_children():
-        widget.destroy()
+    if summary_key is not None:
+        with outlook_summaries_lock:
+            outlook_summaries[summary_key] = summary
+            while len(outlook_summaries) > summary_cache_size:
+                del outlook_summaries[next(iter(outlook_summaries))]
+    return summary
 
-    # Create a canvas and add it to the root window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
-    canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
 
-    # Create a custom toolbar with a close button
-    toolbar = NavigationToolbar2Tk(canvas, root)
-    toolbar.update()
+# Spatial Indexes
+outlook_indexes = {}  # Spatial index of each outlook issuance, keyed by outlook type, issue time and valid time
+outlook_indexes_lock = threading.Lock()
 
-    def close_figure():
-        """
-        Closes the current figure, withdraws the root window, and starts the GUI.
 
-        Parameters:
-            None
+# Function to build the spatial index of an outlook
+def outlook_index(outlook_data):
+    """
+    Builds an STRtree of the risk areas in an outlook. Indexes are cached by issuance, so repeated
+    queries against the same outlook only build it once.
 
-        Returns:
-            None
-        """
-        plt.close(fig)
-        root.withdraw()
-        start_gui()
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
 
-    close_button = tk.Button(toolbar, text='Close', command=close_figure)
-    close_button.pack(side=tk.RIGHT)
+    Returns:
+        tuple: The STRtree of the risk areas, the rank of each area and the label of each area.
+    """
+    index_key = outlook_cache_key(outlook_data)
+    if index_key is not None:
+        with outlook_indexes_lock:
+            index = outlook_indexes.get(index_key)
+        if index is not None:
+            return index
+
+    features = [feature for feature in outlook_data.features if feature.polygons]
+    index = (shapely.STRtree([outlook_data.geometry(feature) for feature in features]),
+             np.array([feature.rank for feature in features], dtype=int),
+             np.array([feature.label for feature in features], dtype=object))
+
+    if index_key is not None:
+        with outlook_indexes_lock:
+            outlook_indexes[index_key] = index
+            while len(outlook_indexes) > summary_cache_size:
+                del outlook_indexes[next(iter(outlook_indexes))]
+    return index
+
+
+# Function to find the risk at a set of locations
+def classify_points(outlook_data, latitudes, longitudes):
+    """
+    Finds the highest risk level at each location in one vectorized query. Points inside a hole of a
+    risk area are not in that area, and points on an edge count as inside it.
 
-    root.protocol("WM_DELETE_WINDOW", close_figure)
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
+        latitudes (array-like): The latitude of each location.
+        longitudes (array-like): The longitude of each location.
 
-    # Show the Tkinter root window with the canvas and toolbar
-    root.deiconify()
-    root.mainloop()
+    Returns:
+        tuple: The highest label at each location (None outside every risk area) and whether each
+        location is in a significant severe ('SIGN') area, as NumPy arrays.
+    """
+    tree, ranks, labels = outlook_index(outlook_data)
+    points = shapely.points(np.asarray(longitudes, dtype=float), np.asarray(latitudes, dtype=float))
+    highest_ranks = np.zeros(len(points), dtype=int)
+    significant = np.zeros(len(points), dtype=bool)
+    if len(ranks):
+        point_indexes, area_indexes = tree.query(points, predicate='intersects')
+        np.maximum.at(highest_ranks, point_indexes, ranks[area_indexes])
+        significant[point_indexes[labels[area_indexes] == 'SIGN']] = True
 
-    log.info('Showing the plot')
-    plt.savefig(output_path, dpi=96, bbox_inches='tight')
+    return outlook_rank_labels(outlook_data.outlook_type)[highest_ranks], significant
 
 
-def display_hail_outlook(day, outlook_data):
+# Function to list the labels of an outlook type by rank
+def outlook_rank_labels(outlook_type):
     """
-    Displays a hail outlook for a given day.
+    Lists the labels of an outlook type in rank order.
 
     Parameters:
-        day (int): The day for which to display the hail outlook.
-        outlook_data (dict): The data containing the hail outlook information.
+        outlook_type (str): The type of outlook.
 
     Returns:
-        None
+        numpy.ndarray: The label of each rank, with None for rank 0.
     """
-    log.info('Displaying Hail Outlook')
-    fig, ax = setup_plot()
+    rank_mapping = risk_level_mappings.get(outlook_type, {})
+    return np.array([None] + sorted(rank_mapping, key=rank_mapping.get), dtype=object)
 
-    # Clear the figure and axes before displaying a new outlook
-    fig.clear()
-    ax = fig.add_subplot(111)
 
-    add_overlays(ax, 'hail')
-    set_plot_limits(ax)
-    add_basemap(ax)
-    remove_axes_labels_boxes_title(ax)
+# Region Summaries
+regions = None  # The regions and population points, loaded on first use
+regions_lock = threading.Lock()
+region_summaries = {}  # Region summary of each outlook issuance, keyed by outlook type, issue time and valid time
+region_summaries_lock = threading.Lock()
 
-    plot_outlook_polygons(ax, 'hail', outlook_data)
 
-    output_directory = create_output_directory()
-    output_filename = f'spc_day_{day}_hail_outlook.png'
-    output_path = os.path.join(output_directory, output_filename)
+# Function to name the regions enclosed by boundary lines
+def name_enclosed_regions(shapes):
+    """
+    Names the regions enclosed by a shapefile of boundary lines after the points in region_label_file
+    that fall in them, and merges the regions that share a name, like the two peninsulas of Michigan.
+    Regions without a label point, like lakes and small islands, are left out. Without a label file the
+    regions are numbered instead.
 
-    for widget in root.winfo_children():
-        widget.destroy()
+    Parameters:
+        shapes (geopandas.GeoSeries): The enclosed regions, projected to region_crs.
 
-    # Create a canvas and add it to the root window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
-    canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+    Returns:
+        tuple: The name of each region and its shape, as lists.
+    """
+    if region_label_file is None:
+        return [str(number) for number in range(len(shapes))], list(shapes)
+
+    labels = pd.read_csv(region_label_file, usecols=['name', 'latitude', 'longitude'])
+    points = gpd.GeoSeries.from_xy(labels['longitude'], labels['latitude'], crs='EPSG:4326').to_crs(region_crs)
+    point_indexes, shape_indexes = shapes.sindex.query(points.to_numpy(), predicate='intersects')
+    names = {}
+    for point_index, shape_index in zip(point_indexes, shape_indexes):
+        names.setdefault(shape_index, set()).add(labels['name'][point_index])
+    unplaced = set(labels['name']) - set().union(*names.values())
+    if unplaced:
+        log.warning('No region encloses the label point of ' + ', '.join(sorted(unplaced)))
+
+    shapes_by_name = {}
+    for shape_index, shape_names in sorted(names.items()):
+        if len(shape_names) > 1:
+            log.warning('One region encloses the label points of ' + ', '.join(sorted(shape_names)))
+        shapes_by_name.setdefault(' / '.join(sorted(shape_names)), []).append(shapes.iloc[shape_index])
+    log.info(f'Named {len(shapes_by_name)} regions, leaving out {len(shapes) - len(names)} without a label point')  # skipcq: PYL-W1203
+    return list(shapes_by_name), [shapely.union_all(region_shapes) for region_shapes in shapes_by_name.values()]
+
+
+# Function to load the regions risk is summarized over
+def load_regions():
+    """
+    Loads the region shapefile once per process, projected to region_crs. A shapefile of boundary lines
+    (like the bundled state outlines) is turned into the regions the lines enclose, named by
+    name_enclosed_regions. If population_file is set, each population point is matched to the region it is in.
 
-    # Create a custom toolbar with a close button
-    toolbar = NavigationToolbar2Tk(canvas, root)
-    toolbar.update()
+    Parameters:
+        None
 
-    def close_figure():
-        """
-        Closes the current figure, withdraws the root window, and starts the GUI.
+    Returns:
+        tuple: The regions as a GeoDataFrame with 'region', 'area' and geometry columns, and the population
+        points as a DataFrame with 'latitude', 'longitude', 'population' and 'region_index' columns (or None).
+    """
+    global regions  # skipcq: PYL-W0603
+    with regions_lock:
+        if regions is not None:
+            return regions
+
+        log.info('Loading the regions from ' + region_shapefile)
+        layer = gpd.read_file(region_shapefile)
+        if layer.geom_type.isin(['LineString', 'MultiLineString']).all():
+            lines = shapely.get_parts(shapely.union_all(layer.geometry.values))  # Split the lines where they cross
+            shapes = gpd.GeoSeries(list(shapely.polygonize(lines).geoms), crs=layer.crs).to_crs(region_crs)
+            names, shapes = name_enclosed_regions(shapes)
+            shapes = gpd.GeoSeries(shapes, crs=region_crs)
+        else:
+            shapes = layer.geometry.to_crs(region_crs).make_valid()
+            names = layer[region_name_field].astype(str) if region_name_field in layer else [str(number) for number in range(len(layer))]
+        region_frame = gpd.GeoDataFrame({'region': names, 'area': shapes.area.to_numpy()}, geometry=shapes.to_numpy(), crs=region_crs)
 
-        Parameters:
-            None
+        population = None
+        if population_file is not None:
+            population = pd.read_csv(population_file, usecols=['latitude', 'longitude', 'population'])
+            points = gpd.GeoSeries.from_xy(population['longitude'], population['latitude'], crs='EPSG:4326').to_crs(region_crs)
+            point_indexes, region_indexes = region_frame.sindex.query(points.to_numpy(), predicate='intersects')
+            point_indexes, first = np.unique(point_indexes, return_index=True)  # A point on a border counts for one region
+            population['region_index'] = -1
+            population.loc[point_indexes, 'region_index'] = region_indexes[first]
 
-        Returns:
-            None
-        """
-        plt.close(fig)
-        root.withdraw()
-        start_gui()
+        regions = (region_frame, population)
+        return regions
+
+
+# Function to summarize an outlook over the regions
+def aggregate_outlook(outlook_data):
+    """
+    Intersects an outlook with every region once and summarizes the risk in each. Summaries are cached by
+    issuance, so asking again for the same outlook costs nothing.
 
-    close_button = tk.Button(toolbar, text='Close', command=close_figure)
-    close_button.pack(side=tk.RIGHT)
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
 
-    root.protocol("WM_DELETE_WINDOW", close_figure)
+    Returns:
+        pandas.DataFrame: A row for each region with 'region', 'max_label', 'max_risk', 'max_rank',
+        'area_fraction' (share of the region under any risk level) and 'population_fraction' (share of
+        the region's population under any risk level, NaN without population points) columns.
+    """
+    summary_key = outlook_cache_key(outlook_data)
+    if summary_key is not None:
+        with region_summaries_lock:
+            summary = region_summaries.get(summary_key)
+        if summary is not None:
+            return summary.copy()
+
+    region_frame, population = load_regions()
+    max_ranks = np.zeros(len(region_frame), dtype=int)
+    covered_areas = np.zeros(len(region_frame))
+    features = [feature for feature in outlook_data.features if feature.polygons and feature.rank]
+    if features:
+        areas = gpd.GeoSeries([outlook_data.geometry(feature) for feature in features], crs='EPSG:4326').to_crs(region_crs).make_valid()
+        area_indexes, region_indexes = region_frame.sindex.query(areas.to_numpy(), predicate='intersects')
+        np.maximum.at(max_ranks, region_indexes, np.array([feature.rank for feature in features])[area_indexes])
+        touched = np.unique(region_indexes)
+        covered_areas[touched] = region_frame.geometry.iloc[touched].intersection(areas.union_all()).area.to_numpy()
+
+    population_fractions = np.full(len(region_frame), np.nan)
+    if population is not None:
+        inside = population['region_index'].to_numpy() >= 0
+        region_index = population['region_index'].to_numpy()[inside]
+        weights = population['population'].to_numpy(dtype=float)[inside]
+        covered = pd.notna(classify_points(outlook_data, population['latitude'][inside], population['longitude'][inside])[0])
+        totals = np.bincount(region_index, weights=weights, minlength=len(region_frame))
+        covered_totals = np.bincount(region_index, weights=weights * covered, minlength=len(region_frame))
+        np.divide(covered_totals, totals, out=population_fractions, where=totals > 0)
+
+    summary = pd.DataFrame({
+        'region': region_frame['region'].to_numpy(),
+        'max_label': outlook_rank_labels(outlook_data.outlook_type)[max_ranks],
+        'max_risk': np.array(risk_level_names.get(outlook_data.outlook_type, ('None',)), dtype=object)[max_ranks],
+        'max_rank': max_ranks,
+        'area_fraction': covered_areas / region_frame['area'].to_numpy(),
+        'population_fraction': population_fractions
+    })
+
+    if summary_key is not None:
+        with region_summaries_lock:
+            region_summaries[summary_key] = summary
+            while len(region_summaries) > summary_cache_size:
+                del region_summaries[next(iter(region_summaries))]
+    return summary.copy()
+
+
+# Function to list the regions at or above a risk level
+def regions_at_or_above(outlook_data, label):
+    """
+    Lists the regions that are at least partly under a risk level or higher, e.g. the states under Enhanced or higher.
 
-    # Show the Tkinter root window with the canvas and toolbar
-    root.deiconify()
-    root.mainloop()
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
+        label (str): The lowest risk level to include (e.g. 'ENH' or '0.15').
 
-    log.info('Showing the plot')
-    plt.savefig(output_path, dpi=96, bbox_inches='tight')
+    Returns:
+        list: The names of the regions.
+    """
+    summary = aggregate_outlook(outlook_data)
+    return summary.loc[summary['max_rank'] >= risk_level_mappings[outlook_data.outlook_type][label], 'region'].tolist()
 
 
-def display_d48_outlook(day, outlook_data):
+# Function to export a region summary
+def export_region_summary(outlook_data, path):
     """
-    Displays a Day 4-8 outlook for a given day.
+    Saves the region summary of an outlook as CSV or JSON, picked by the file extension.
 
     Parameters:
-        day (int): The day for which to display the Day 4-8 outlook.
-        outlook_data (dict): The data containing the Day 4-8 outlook information.
+        outlook_data (Outlook): The parsed outlook.
+        path (str): Where to save the summary, ending in '.csv' or '.json'.
 
     Returns:
         None
     """
-    log.info('Displaying a Day 4-8 Outlook')
-    fig, ax = setup_plot()
+    summary = aggregate_outlook(outlook_data)
+    if path.lower().endswith('.json'):
+        summary.to_json(path, orient='records', indent=2)
+    else:
+        summary.to_csv(path, index=False)
+    log.info('Saved the region summary to ' + path)
 
-    # Clear the figure and axes before displaying a new outlook
-    fig.clear()
-    ax = fig.add_subplot(111)
 
-    add_overlays(ax, 'd4-8')
-    set_plot_limits(ax)
-    add_basemap(ax)
-    remove_axes_labels_boxes_title(ax)
+# Issuance Changes
+last_outlooks = {}  # The last outlook seen for each (outlook_type, day)
+last_outlooks_lock = threading.Lock()
 
-    plot_outlook_polygons(ax, 'd4-8', outlook_data)
 
-    output_directory = create_output_directory()
-    output_filename = f'spc_day_{day}_outlook.png'
-    output_path = os.path.join(output_directory, output_filename)
+# Function to get the area covered by a risk level
+def risk_level_geometry(outlook_data, label):
+    """
+    Gets the area covered by a risk level. For a ranked level this includes every higher level, so it is
+    the area at or above that level; for 'SIGN' it is just the significant severe area.
 
-    for widget in root.winfo_children():
-        widget.destroy()
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
+        label (str): The risk level.
 
-    # Create a canvas and add it to the root window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
-    canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+    Returns:
+        shapely.Geometry: The area, which may be empty.
+    """
+    rank = risk_level_mappings.get(outlook_data.outlook_type, {}).get(label, 0)
+    geometries = [outlook_data.geometry(feature) for feature in outlook_data.features
+                  if feature.polygons and (feature.rank >= rank > 0 or (not rank and feature.label == label))]
+    return shapely.union_all(shapely.make_valid(geometries))
 
-    # Create a custom toolbar with a close button
-    toolbar = NavigationToolbar2Tk(canvas, root)
-    toolbar.update()
 
-    def close_figure():
-        """
-        Closes the current figure, withdraws the root window, and starts the GUI.
+# Function to compare two issuances of an outlook
+def diff_outlooks(previous, current):
+    """
+    Compares two issuances of the same outlook. Areas are only compared when the labels or geometry differ,
+    so an identical re-issuance costs one hash comparison.
 
-        This function closes the current figure using the `plt.close()` function.
-        It then withdraws the root window using the `root.withdraw()` function.
-        Finally, it starts the GUI by calling the `start_gui()` function.
+    Parameters:
+        previous (Outlook): The earlier outlook.
+        current (Outlook): The newer outlook.
 
-        Parameters:
-            None
+    Returns:
+        dict: 'changed' (whether the labels or geometry differ), 'previous_risk' and 'current_risk' (the highest
+        risk names), 'upgraded' and 'downgraded' (whether the highest risk went up or down), 'added_levels' and
+        'removed_levels' (labels that appeared or disappeared) and 'areas' (for each label whose area changed, the
+        square kilometers 'added' to and 'removed' from the area at or above that level).
+    """
+    previous_summary = summarize_outlook(previous)
+    current_summary = summarize_outlook(current)
+    diff = {
+        'changed': previous.fingerprint != current.fingerprint,
+        'previous_risk': previous_summary['highest_risk'],
+        'current_risk': current_summary['highest_risk'],
+        'upgraded': current_summary['highest_rank'] > previous_summary['highest_rank'],
+        'downgraded': current_summary['highest_rank'] < previous_summary['highest_rank'],
+        'added_levels': tuple(label for label in current_summary['levels'] if label not in previous_summary['levels']),
+        'removed_levels': tuple(label for label in previous_summary['levels'] if label not in current_summary['levels']),
+        'areas': {}
+    }
+    if not diff['changed']:
+        return diff
+
+    labels = list(dict.fromkeys(list(previous_summary['areas']) + list(current_summary['areas'])))
+    for label in labels:
+        previous_area = risk_level_geometry(previous, label)
+        current_area = risk_level_geometry(current, label)
+        changes = gpd.GeoSeries([shapely.difference(current_area, previous_area), shapely.difference(previous_area, current_area)],
+                                crs='EPSG:4326').to_crs(region_crs).area.to_numpy() / 1e6
+        if changes.any():
+            diff['areas'][label] = {'added': float(changes[0]), 'removed': float(changes[1])}
+    return diff
+
+
+# Function to check if an outlook has changed since it was last seen
+def track_outlook_change(outlook_type, day, outlook_data):
+    """
+    Compares an outlook with the last one seen for the same product and remembers it for next time.
 
-        Returns:
-            None
-        """
-        plt.close(fig)
-        root.withdraw()
-        start_gui()
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int): The day of the outlook.
+        outlook_data (Outlook): The newly fetched outlook.
+
+    Returns:
+        dict: The diff from diff_outlooks, or None if the product has not been seen before.
+    """
+    with last_outlooks_lock:
+        previous = last_outlooks.get((outlook_type, day))
+        last_outlooks[outlook_type, day] = outlook_data
+    if previous is None:
+        return None
+    diff = diff_outlooks(previous, outlook_data)
+    if diff['changed']:
+        log.info(f'The day {day} {outlook_type} outlook changed from {diff["previous_risk"]} to {diff["current_risk"]}: '  # skipcq: PYL-W1203
+                 f'{diff["areas"]}')
+    else:
+        log.info(f'The day {day} {outlook_type} outlook was re-issued without changes')  # skipcq: PYL-W1203
+    return diff
+
+
+# URL of each outlook product, by outlook type and day
+outlook_urls = {
+    'cat': {
+        1: 'https://www.spc.noaa.gov/products/outlook/day1otlk_cat.nolyr.geojson',
+        2: 'https://www.spc.noaa.gov/products/outlook/day2otlk_cat.nolyr.geojson',
+        3: 'https://www.spc.noaa.gov/products/outlook/day3otlk_cat.nolyr.geojson',
+        'test': 'https://www.spc.noaa.gov/products/outlook/archive/2023/day1otlk_20230331_1630_cat.lyr.geojson'
+    },
+    'tor': {
+        1: 'https://www.spc.noaa.gov/products/outlook/day1otlk_torn.nolyr.geojson',
+        2: 'https://www.spc.noaa.gov/products/outlook/day2otlk_torn.nolyr.geojson',
+        'test': 'https://www.spc.noaa.gov/products/outlook/archive/2021/day1otlk_20210317_1630_torn.lyr.geojson'
+    },
+    'wind': {
+        1: 'https://www.spc.noaa.gov/products/outlook/day1otlk_wind.nolyr.geojson',
+        2: 'https://www.spc.noaa.gov/products/outlook/day2otlk_wind.nolyr.geojson',
+        'test': 'https://www.spc.noaa.gov/products/outlook/archive/2021/day1otlk_20210325_1630_wind.lyr.geojson'
+    },
+    'hail': {
+        1: 'https://www.spc.noaa.gov/products/outlook/day1otlk_hail.nolyr.geojson',
+        2: 'https://www.spc.noaa.gov/products/outlook/day2otlk_hail.nolyr.geojson',
+        'test': 'https://www.spc.noaa.gov/products/outlook/archive/2021/day1otlk_20210526_1630_hail.lyr.geojson'
+    },
+    'd4-8': {
+        4: 'https://www.spc.noaa.gov/products/exper/day4-8/day4prob.lyr.geojson',
+        5: 'https://www.spc.noaa.gov/products/exper/day4-8/day5prob.lyr.geojson',
+        6: 'https://www.spc.noaa.gov/products/exper/day4-8/day6prob.lyr.geojson',
+        7: 'https://www.spc.noaa.gov/products/exper/day4-8/day7prob.lyr.geojson',
+        8: 'https://www.spc.noaa.gov/products/exper/day4-8/day8prob.lyr.geojson'
+    },
+    'prob': {
+        3: 'https://www.spc.noaa.gov/products/outlook/day3otlk_prob.lyr.geojson'
+    }
+}
 
-    close_button = tk.Button(toolbar, text='Close', command=close_figure)
-    close_button.pack(side=tk.RIGHT)
 
-    root.protocol("WM_DELETE_WINDOW", close_figure)
+def fetch_cat_outlooks(day):
+    """
+    Fetches the categorial outlook data for a specified day.
 
-    # Show the Tkinter root window with the canvas and toolbar
-    root.deiconify()
-    root.mainloop()
+    Parameters:
+        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, 3, or 'test'.
 
-    log.info('Showing the plot')
-    plt.savefig(output_path, dpi=96, bbox_inches='tight')
+    Returns:
+        Outlook: The parsed outlook data.
+    """
+    log.info('Fetching a Categorial Outlook')
+    url = outlook_urls['cat'].get(day)
+    if url is None:
+        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 153')
+        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
+        sys.exit(0)
+    outlook_data = fetch_outlook('cat', url)  # Requests the data from the GeoJSON URL and parses it
+    return outlook_data  # Returns the data from the Outlook
 
 
-def display_prob_outlook(day, outlook_data):
+def fetch_tor_outlooks(day):
     """
-    Displays a probabilistic outlook for a given day.
+    Fetches the tornado outlook data for a specified day.
 
     Parameters:
-        day (int): The day for which to display the probabilistic outlook.
-        outlook_data (dict): The data containing the probabilistic outlook information.
+        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, or 'test'.
 
     Returns:
-        None
+        Outlook: The parsed outlook data.
+
+    Raises:
+        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
+
+    Exits the program with status code 0 if the specified day is invalid.
     """
-    log.info('Displaying Probabilistic Outlook')
-    fig, ax = setup_plot()
+    log.info('Fetching a Tornado Outlook')
+    url = outlook_urls['tor'].get(day)
+    if url is None:
+        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 185')
+        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
+        sys.exit(0)
+    outlook_data = fetch_outlook('tor', url)  # Requests the data from the GeoJSON URL and parses it
+    return outlook_data  # Returns the data from the Outlook
 
-    # Clear the figure and axes before displaying a new outlook
-    fig.clear()
-    ax = fig.add_subplot(111)
 
-    add_overlays(ax, 'prob')
-    set_plot_limits(ax)
-    add_basemap(ax)
-    remove_axes_labels_boxes_title(ax)
+def fetch_wind_outlooks(day):
+    """
+    Fetches the wind outlook data for a specified day.
 
-    plot_outlook_polygons(ax, 'prob', outlook_data)
+    Parameters:
+        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, or 'test'.
 
-    output_directory = create_output_directory()
-    output_filename = f'spc_day_{day}_prob_outlook.png'
-    output_path = os.path.join(output_directory, output_filename)
+    Returns:
+        Outlook: The parsed outlook data.
+    """
+    log.info('Fetching a Wind Outlook')
+    url = outlook_urls['wind'].get(day)
+    if url is None:
+        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 211')
+        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
+        sys.exit(0)
+    outlook_data = fetch_outlook('wind', url)  # Requests the data from the GeoJSON URL and parses it
+    return outlook_data  # Returns the data from the outlook
 
-    for widget in root.winfo_children():
-        widget.destroy()
 
-    # Create a canvas and add it to the root window
-    canvas = FigureCanvasTkAgg(fig, master=root)
-    canvas.draw()
-    canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+def fetch_hail_outlooks(day):
+    """
+    Fetches the hail outlook data for a specified day.
 
-    # Create a custom toolbar with a close button
-    toolbar = NavigationToolbar2Tk(canvas, root)
-    toolbar.update()
+    Parameters:
+        day (int or str): The day for which to fetch the outlook data. Can be 1, 2, or 'test'.
 
-    def close_figure():
-        """
-        Closes the current figure, withdraws the root window, and starts the GUI.
+    Returns:
+        Outlook: The parsed outlook data.
 
-        Parameters:
-            None
+    Raises:
+        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
 
-        Returns:
-            None
-        """
-        plt.close(fig)
-        root.withdraw()
-        start_gui()
+    Exits the program with status code 0 if the specified day is invalid.
+    """
+    log.info('Fetching a Hail Outlook')
+    url = outlook_urls['hail'].get(day)
+    if url is None:
+        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 243')
+        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
+        sys.exit(0)
+    outlook_data = fetch_outlook('hail', url)  # Requests the data from the GeoJSON URL and parses it
+    return outlook_data  # Returns the data from the outlook
 
-    close_button = tk.Button(toolbar, text='Close', command=close_figure)
-    close_button.pack(side=tk.RIGHT)
 
-    root.protocol("WM_DELETE_WINDOW", close_figure)
+def fetch_d48_outlooks(day):
+    """
+    Fetches the 48 hour outlook data for a specified day.
 
-    # Show the Tkinter root window with the canvas and toolbar
-    root.deiconify()
-    root.mainloop()
+    Parameters:
+        day (int): The day for which to fetch the outlook data. Can be 4, 5, 6, 7, or 8.
 
-    log.info('Showing the plot')
-    plt.savefig(output_path, dpi=96, bbox_inches='tight')
+    Returns:
+        Outlook: The parsed outlook data.
+    """
+    log.info('Fetching Day ' + str(day) + ' outlook')
+    url = outlook_urls['d4-8'].get(day)
+    if url is None:
+        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 274')
+        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
+        sys.exit(0)
+    outlook_data = fetch_outlook('d4-8', url)  # Requests the data from the GeoJSON URL and parses it
+    return outlook_data  # Returns the data from the outlook
 
 
-# Colors for Display
-def color(outlook_type, outlook_level):
-    # skipcq: FLK-W505
+def fetch_prob_outlooks(day):
     """
-    Returns the color associated with a given outlook type.
+    Fetches a probabilistic outlook for a given day.
 
     Parameters:
-        type (str): The type of outlook (e.g., 'cat', 'tor', 'wind', 'hail', 'prob', 'd4-8').
-        outlook_type (str): The specific outlook type (e.g., 'TSTM', 'MRGL', 'SLGT', 'ENH', 'MDT', 'HIGH', '0.02', '0.05', '0.10', '0.15', '0.30', '0.45', '0.60', 'sig').  # skipcq: FLK-W505
+        day (int): The day for which to fetch the outlook.
 
     Returns:
-        str: The color associated with the given outlook type, or 'blue' if not found.
+        Outlook: The parsed outlook data.
+
+    Raises:
+        requests.exceptions.RequestException: If the request to the GeoJSON URL fails.
+
+    Exits the program with status code 0 if the specified day is invalid.
     """
-    log.info('Getting ' + outlook_level + ' for ' + outlook_type + ' outlook')
-    if outlook_type == 'cat':
-        colors = {
-            'TSTM': 'lightgreen',
-            'MRGL': 'green',
-            'SLGT': 'yellow',
-            'ENH': 'orange',
-            'MDT': 'red',
-            'HIGH': 'magenta'
-        }
-    if outlook_type == 'tor':
-        colors = {
-            '0.02': 'green',
-            '0.05': 'brown',
-            '0.10': 'yellow',
-            '0.15': 'red',
-            '0.30': 'pink',
-            '0.45': 'purple',
-            '0.60': 'blue',
-            'sig': 'black'
-        }
-    if outlook_type in ('wind', 'hail', 'prob'):
-        colors = {
-            '0.05': 'saddlebrown',
-            '0.15': 'gold',
-            '0.30': 'red',
-            '0.45': 'fuchsia',
-            '0.60': 'blueviolet',
-            'sig': 'black'
-        }
-    if outlook_type == 'd4-8':
-        colors = {
-            '0.15': 'gold',
-            '0.30': 'sandybrown'
-        }
-    if outlook_type not in ('cat', 'tor', 'wind', 'hail', 'prob', 'd4-8'):
-        log.error("There was an error accessing colors. Error on line 751")
-        popup('warning', 'Invalid Outlook Type', 'There was an error when trying to get colors. The program will now quit.')
+    log.info('Fetching a Probabilistic Outlook')
+    url = outlook_urls['prob'].get(day)
+    if url is None:
+        log.error('Invalid Date. Day = ' + str(day) + 'Error on line 302')
+        popup('error', 'Invalid Day', "An error has occured where the day wasn't read correctly. The program will now quit.")
         sys.exit(0)
+    outlook_data = fetch_outlook('prob', url)  # Requests the data from the GeoJSON URL and parses it
+    return outlook_data  # Returns the data from the outlook
 
-    return colors.get(outlook_level, 'blue')  # Returns the color, blue if not found
 
+# Fetch function for each outlook type
+outlook_fetch_functions = {
+    'cat': fetch_cat_outlooks,
+    'tor': fetch_tor_outlooks,
+    'wind': fetch_wind_outlooks,
+    'hail': fetch_hail_outlooks,
+    'd4-8': fetch_d48_outlooks,
+    'prob': fetch_prob_outlooks
+}
 
-# Displaying Popups
-def popup(popup_type, title, message):  # skipcq: PYL-R1710
+# Days each outlook type is issued for
+outlook_days = {
+    'cat': (1, 2, 3),
+    'tor': (1, 2),
+    'wind': (1, 2),
+    'hail': (1, 2),
+    'd4-8': (4, 5, 6, 7, 8),
+    'prob': (3,)
+}
+
+
+# Session Outlook Store
+outlook_store = {}  # The latest outlook fetched this session for each (outlook_type, day), with when it was fetched and how long it stays fresh
+outlook_store_lock = threading.Lock()
+
+
+# Function to get the RSS product an outlook belongs to
+def outlook_issue_product(day):
     """
-    The `popup` function displays different types of popups based on the input parameters such as
-    info, error, warning, or question.
+    Gets the product in rss_issue_times and rss_central_issue_times that an outlook day is issued under.
 
-    :param type: The `type` parameter in the `popup` method specifies the type of popup to display.
-    :param title: The `title` parameter in the `popup` function refers to the title of the popup
-    window that will be displayed. It is the text that appears at the top of the popup window to
-    provide context or information about the message being shown to the user.
-    :param message: The `message` parameter in the `popup` function is the text that will be
-    displayed in the popup dialog box. It is the information, error message, warning message, or
-    question that you want to show to the user depending on the type of popup being displayed.
-    :return: The `popup` method returns the value of `question` when the `type` parameter is
-    set to 'question'.
+    Parameters:
+        day (int or str): The day of the outlook.
+
+    Returns:
+        str: The product, e.g. 'day1' or 'day4-8', or None for the test outlooks.
     """
-    log.info('Showing a ' + popup_type + ' popup titled ' + title + 'with the following message: ' + message)
-    if popup_type == 'info':
-        messagebox.showinfo(title, message)
-    elif popup_type == 'error':
-        messagebox.showerror(title, message)
-    elif popup_type == 'warning':
-        messagebox.showwarning(title, message)
-    elif popup_type == 'question':
-        global question  # skipcq: PYL-W0603
-        question = messagebox.askquestion(title, message)
-        return question  # skipcq: PYL-R1710
-    else:
-        messagebox.showerror('Invalid Popup', 'There was an error when trying to display a popup. The program will now quit.')
-        sys.exit(0)
+    if day in (1, 2, 3):
+        return 'day' + str(day)
+    if day in outlook_days['d4-8']:
+        return 'day4-8'
+    return None
+
+
+# Function to work out how long a fetched outlook stays fresh
+def outlook_fresh_until(day, outlook_data, fetched_at):
+    """
+    Works out until when a fetched outlook can be reused without asking SPC again.
+
+    An outlook issued at or after the last scheduled issuance of its product is fresh until the next scheduled
+    issuance, but for no longer than outlook_store_max_age in case SPC sends an update between them. An outlook
+    older than the last scheduled issuance means the new one has not been posted yet, so it is only reused for
+    http_cache_max_age. The test outlooks come from the archive and never change.
+
+    Parameters:
+        day (int or str): The day of the outlook.
+        outlook_data (Outlook): The fetched outlook.
+        fetched_at (float): When the outlook was fetched, as a Unix timestamp.
+
+    Returns:
+        float: The Unix timestamp the outlook stays fresh until.
+    """
+    product = outlook_issue_product(day)
+    if product is None:
+        return float('inf')
+
+    seconds_into_day = fetched_at % 86400
+    issue_seconds = [int(issue_time[:2]) * 3600 + int(issue_time[2:]) * 60 for issue_time in product_issue_times(product, fetched_at)]
+    last_issuance = fetched_at - min((seconds_into_day - seconds) % 86400 for seconds in issue_seconds)
+    next_issuance = fetched_at + min((seconds - seconds_into_day) % 86400 or 86400 for seconds in issue_seconds)
+
+    issued_at = None
+    if outlook_data.issue is not None:
+        issued_at = datetime.datetime.strptime(outlook_data.issue, '%Y%m%d%H%M').replace(tzinfo=datetime.timezone.utc).timestamp()
+    if issued_at is None or issued_at < last_issuance - rss_issue_window:
+        return fetched_at + http_cache_max_age
+    return min(next_issuance, fetched_at + outlook_store_max_age)
+
+
+# Function to get an outlook from the session store
+def get_outlook(outlook_type, day):
+    """
+    Gets an outlook from the session store, fetching it only if it has not been fetched yet or is no longer
+    fresh. The frames and the outlook buttons share the store, so opening an outlook right after its frame
+    was loaded does not touch the network.
+
+    Parameters:
+        outlook_type (str): The type of outlook (e.g. 'cat', 'tor', 'wind', etc.).
+        day (int or str): The day of the outlook.
+
+    Returns:
+        Outlook: The parsed outlook.
+
+    Raises:
+        requests.exceptions.RequestException: If the outlook has to be fetched and the download fails.
+    """
+    with outlook_store_lock:
+        entry = outlook_store.get((outlook_type, day))
+    if entry is not None and (offline_mode or time.time() < entry['fresh_until']):
+        log.info(f'Using the day {day} {outlook_type} outlook fetched this session')  # skipcq: PYL-W1203
+        return entry['outlook']
+
+    outlook_data = outlook_fetch_functions[outlook_type](day)
+    fetched_at = time.time()
+    with outlook_store_lock:
+        outlook_store[outlook_type, day] = {'outlook': outlook_data, 'issue': outlook_data.issue, 'fetched_at': fetched_at,
+                                            'fresh_until': outlook_fresh_until(day, outlook_data, fetched_at)}
+    return outlook_data
+
+
+# Function to drop outlooks from the session store
+def invalidate_outlook_store(products=None):
+    """
+    Drops outlooks from the session store so they are fetched again the next time they are needed.
+
+    Parameters:
+        products (list): The (outlook_type, day) pairs to drop, or None to drop every outlook.
+
+    Returns:
+        None
+    """
+    with outlook_store_lock:
+        if products is None:
+            outlook_store.clear()
+        for product in products or ():
+            outlook_store.pop(product, None)
+
+
+# Function to fetch several outlooks at once
+def fetch_outlooks(products, max_workers=None):
+    """
+    Fetches several outlooks in parallel so a frame only waits as long as its slowest download. Outlooks
+    that are still fresh in the session store are not fetched again.
+
+    Parameters:
+        products (list): The (outlook_type, day) pairs to fetch, e.g. [('cat', 1), ('tor', 1)].
+        max_workers (int): The most downloads to run at the same time. Defaults to fetch_max_workers.
+
+    Returns:
+        dict: The parsed outlook for each (outlook_type, day) pair.
+
+    Raises:
+        requests.exceptions.RequestException: If any of the downloads fail or time out.
+    """
+    log.info('Fetching ' + str(len(products)) + ' outlooks in parallel')
+    if max_workers is None:
+        max_workers = fetch_max_workers
+    start_time = time.perf_counter()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(products))),
+                                               thread_name_prefix='fetch') as executor:
+        futures = {product: executor.submit(get_outlook, product[0], product[1]) for product in products}
+        outlooks = {product: future.result() for product, future in futures.items()}
+
+    log.info(f'Fetched {len(products)} outlooks in {time.perf_counter() - start_time:.2f}s')  # skipcq: PYL-W1203
+    log.info('HTTP - ' + str(http_session_stats()))
+    return outlooks
+
+
+# Background Jobs
+job_executor = concurrent.futures.ThreadPoolExecutor(max_workers=job_max_workers, thread_name_prefix='job')
+job_results = queue.Queue()  # Finished jobs waiting to be handed back to the Tk thread
+job_ids = itertools.count(1)
+job_lock = threading.Lock()
+active_jobs = {}  # Name of each job that is still wanted and the id of its latest submission
+
+
+# Function to start a background job
+def submit_job(job_name, work, args=(), on_done=None, on_error=None):
+    """
+    Runs work(*args) on a background thread and hands its result back to the Tk thread.
+
+    Submitting a job under the same name as a running job replaces it, so only the newest
+    request for a frame or outlook is ever shown.
+
+    Parameters:
+        job_name (str): The name of the job, e.g. 'frame' or 'outlook'.
+        work (function): The function to run off the Tk thread.
+        args (tuple): The arguments to pass to work.
+        on_done (function): Called on the Tk thread with the result of work.
+        on_error (function): Called on the Tk thread with the exception if work fails.
+
+    Returns:
+        int: The id of the submitted job.
+    """
+    with job_lock:
+        job_id = next(job_ids)
+        active_jobs[job_name] = job_id
+    log.info('Starting job ' + job_name + ' #' + str(job_id))
+    job_executor.submit(run_job, job_name, job_id, work, args, on_done, on_error)
+    return job_id
+
+
+# Function to run a background job
+def run_job(job_name, job_id, work, args, on_done, on_error):
+    """
+    Runs a job on a worker thread and queues its result for poll_job_results.
+
+    Parameters:
+        job_name (str): The name of the job.
+        job_id (int): The id of the job.
+        work (function): The function to run.
+        args (tuple): The arguments to pass to work.
+        on_done (function): Called on the Tk thread with the result of work.
+        on_error (function): Called on the Tk thread with the exception if work fails.
+
+    Returns:
+        None
+    """
+    if not job_is_current(job_name, job_id):
+        log.info('Skipping cancelled job ' + job_name + ' #' + str(job_id))
+        return
+    try:
+        result, error = work(*args), None
+    except Exception as e:  # skipcq: PYL-W0703
+        log.error('Job ' + job_name + ' failed', exc_info=True)
+        result, error = None, e
+    job_results.put((job_name, job_id, result, error, on_done, on_error))
+
+
+# Function to check if a job is still wanted
+def job_is_current(job_name, job_id):
+    """
+    Checks if a job is still the latest submission under its name and has not been cancelled.
+
+    Parameters:
+        job_name (str): The name of the job.
+        job_id (int): The id of the job.
+
+    Returns:
+        bool: True if the job is still wanted, False otherwise.
+    """
+    with job_lock:
+        return active_jobs.get(job_name) == job_id
+
+
+# Function to cancel a background job
+def cancel_job(job_name):
+    """
+    Cancels a job so its result is thrown away. A job that has not started yet is skipped.
+
+    Parameters:
+        job_name (str): The name of the job to cancel.
+
+    Returns:
+        None
+    """
+    with job_lock:
+        if active_jobs.pop(job_name, None) is not None:
+            log.info('Cancelled job ' + job_name)
+
+
+# Function to hand finished jobs back to the Tk thread
+def poll_job_results(widget):
+    """
+    Passes the results of finished jobs to their callbacks and schedules the next check. A callback that
+    raises is logged, and the rest of the results are still handed out.
+
+    Parameters:
+        widget (tk.Misc): The Tk widget used to schedule the next check with after().
+
+    Returns:
+        None
+    """
+    try:
+        while True:
+            try:
+                job_name, job_id, result, error, on_done, on_error = job_results.get_nowait()
+            except queue.Empty:
+                break
+            with job_lock:
+                if active_jobs.get(job_name) != job_id:
+                    log.info('Dropping result of cancelled job ' + job_name + ' #' + str(job_id))
+                    continue
+                del active_jobs[job_name]
+            try:
+                if error is not None:
+                    popup('error', 'Loading Error', 'An error has occurred while loading the outlook. Please try again.')
+                    if on_error is not None:
+                        on_error(error)
+                elif on_done is not None:
+                    on_done(result)
+            except Exception:  # skipcq: PYL-W0703
+                log.error('The callback of job ' + job_name + ' #' + str(job_id) + ' failed', exc_info=True)
+    finally:
+        widget.after(job_poll_interval, poll_job_results, widget)  # Keep polling even if something above failed
+
+
+# Function to create the output directory
+def create_output_directory():
+    """
+    Creates the output directory, a folder named "output" in the current directory unless --output-dir is given.
+
+    Parameters:
+        None
+
+    Returns:
+        str: The path of the newly created output directory.
+    """
+    log.info('running create_output_directory')
+    os.makedirs(output_directory_path, exist_ok=True)
+    return output_directory_path  # Returns where the output directory is
+
+
+def setup_plot():
+    """
+    Sets up a plot with a specified size and aspect ratio.
+
+    The figure is created without pyplot so it can be drawn on a background thread.
+
+    Returns:
+        fig (matplotlib.figure.Figure): The figure object.
+        ax (matplotlib.axes.Axes): The axes object.
+    """
+    log.info('running setup_plot')
+    fig = Figure(figsize=figure_size)  # Set the size of the plot
+    ax = fig.add_subplot(111)
+    fig.set_facecolor('black')
+    ax.set_aspect('auto', adjustable='box')
+    return fig, ax  # Return the variables holding the data about the plot
+
+
+# Function to set the limits of the plot
+def set_plot_limits(ax):
+    """
+    Sets the x and y limits of a plot.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to set the limits for.
+
+    Returns:
+        None
+    """
+    log.info('running set_plot_limits')
+    west, east, south, north = plot_extent
+    ax.set_xlim([west, east])  # Base for x: (-125, -66)
+    ax.set_ylim([south, north])  # Base for y: (23, 50)
+
+
+# Function to remove all labels and axes
+def remove_axes_labels_boxes_title(ax):
+    """
+    Removes axes, labels, boxes, and titles from a plot.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to modify.
+
+    Returns:
+        None
+    """
+    log.info('running remove_axes_labels_boxes_title')
+    # Remove the Axes
+    ax.set_xticks([])
+    ax.set_yticks([])
+
+    # Remove the Labels
+    ax.set_xticklabels([])
+    ax.set_yticklabels([])
+
+    # Remove the Box around the Plot
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['bottom'].set_visible(False)
+    ax.spines['left'].set_visible(False)
+
+    # Remove the Title
+    ax.set_title('')
+
+
+# Base Map Layers
+base_layers = None  # The state and freeway outlines, loaded on first use
+base_layers_lock = threading.Lock()
+
+
+# Function to load the state and freeway shapefiles
+def load_base_layers():
+    """
+    Loads the state and freeway shapefiles once per process, clipped to the map and simplified for drawing.
+
+    Parameters:
+        None
+
+    Returns:
+        tuple: The state outlines and the freeway lines as GeoSeries.
+    """
+    global base_layers  # skipcq: PYL-W0603
+    with base_layers_lock:
+        if base_layers is None:
+            log.info('Loading the state and freeway shapefiles')
+            states = gpd.read_file(os.path.join(current_directory, '../files/mapping/s_11au16.shp'))
+            highways = gpd.read_file(os.path.join(current_directory, '../files/mapping/USA_Freeway_System.shp'))
+            base_layers = (prepare_base_layer(states), prepare_base_layer(highways))
+        return base_layers
+
+
+# Function to trim a shapefile to the map
+def prepare_base_layer(layer):
+    """
+    Clips a shapefile to the area shown on the map and simplifies it to the detail the map can show.
+
+    Parameters:
+        layer (geopandas.GeoDataFrame): The shapefile to prepare.
+
+    Returns:
+        geopandas.GeoSeries: The clipped and simplified shapes.
+    """
+    west, east, south, north = plot_extent
+    shapes = layer.geometry.clip_by_rect(west, south, east, north)
+    shapes = shapes[~shapes.is_empty]
+    return shapes.simplify(base_layer_tolerance, preserve_topology=True)
+
+
+# Function to control the CONUS State Outlines
+def add_overlays(ax, outlook_type):
+    """
+    Adds overlays and shapefiles to a plot.
+
+    The states, interstates and basemap are drawn from the cached base map image, so only the
+    header is drawn fresh for each outlook.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to add overlays to.
+        type (str): The type of header image to add.
+
+    Returns:
+        bool: True if every basemap tile was available, False if some are missing from the base map.
+    """
+    log.info('Adding all Overlays and Shapefiles')
+
+    # States, Interstates and Basemap
+    complete = add_base_map_image(ax)
+    ax.set_facecolor("black")  # Background of the CONUS Shapefile will be Black
+
+    add_header(ax, outlook_type)
+    return complete
+
+
+# Function to add the header image of an outlook type
+def add_header(ax, outlook_type):
+    """
+    Adds the header image of an outlook type to a plot.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to add the header to.
+        outlook_type (str): The type of header image to add.
+
+    Returns:
+        matplotlib.offsetbox.AnnotationBbox: The added header.
+    """
+    if outlook_type == 'cat':
+        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_cat_header.png'))
+    elif outlook_type == 'tor':
+        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_tor_header.png'))
+    elif outlook_type == 'wind':
+        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_wind_header.png'))
+    elif outlook_type == 'hail':
+        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_hail_header.png'))
+    elif outlook_type == 'd4-8':
+        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_d48_header.png'))
+    elif outlook_type == 'prob':
+        header_img = plt.imread(os.path.join(current_directory, '../files/overlays/wtus_prob_header.png'))
+    else:
+        log.error('Header Error. Outlook_type ' + outlook_type + 'Error on line 429')
+        popup('error', 'Header Error', 'An error has occured getting the header image. The program will now quit.')
+        sys.exit(0)
+    header_img = OffsetImage(header_img, zoom=0.4)
+    ab = AnnotationBbox(header_img, (0.3, 0.95), xycoords='axes fraction', frameon=False)
+    ax.add_artist(ab)
+    return ab
+
+
+# Tile Store
+tiles_written = 0  # Tiles saved to the tile store since it was last trimmed to its size limit
+tiles_written_lock = threading.Lock()
+
+
+# Function to control the basemap
+def add_basemap(ax):
+    """
+    Adds a basemap to a plot, using the tiles in the local tile store.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to add the basemap to.
+
+    Returns:
+        bool: True if every tile was available, False if some are missing from the basemap.
+    """
+    log.info('running add_basemap')
+    image, extent, complete = build_tile_mosaic(tile_zoom)
+    image, extent = ctx.warp_tiles(image, extent, t_crs='EPSG:4326')
+    ax.imshow(image, extent=extent, interpolation='bilinear')
+    log.info('basemap loaded')
+    return complete
+
+
+# Function to list the basemap tiles covering the map
+def map_tiles(zoom):
+    """
+    Lists the basemap tiles that cover the map extent.
+
+    Parameters:
+        zoom (int): The zoom level of the tiles.
+
+    Returns:
+        list: The mercantile.Tile objects covering the map.
+    """
+    west, east, south, north = plot_extent
+    return list(mercantile.tiles(west, south, east, north, zooms=zoom))
+
+
+# Function to get the path of a stored tile
+def tile_path(tile):
+    """
+    Gets the path of a tile in the local tile store.
+
+    Parameters:
+        tile (mercantile.Tile): The tile.
+
+    Returns:
+        str: The path of the tile.
+    """
+    return os.path.join(tile_directory, str(tile.z), str(tile.x), str(tile.y) + '.png')
+
+
+# Function to get a basemap tile
+def get_tile(tile):
+    """
+    Gets a basemap tile from the local tile store, downloading it if it is missing and not in offline mode.
+
+    Parameters:
+        tile (mercantile.Tile): The tile to get.
+
+    Returns:
+        bytes: The PNG data of the tile, or None if the tile is not available.
+    """
+    path = tile_path(tile)
+    try:
+        with open(path, 'rb') as tile_file:
+            content = tile_file.read()
+        os.utime(path)  # Mark the tile as recently used
+        return content
+    except OSError:
+        pass
+
+    if offline_mode:
+        log.warning(f'Tile {tile.z}/{tile.x}/{tile.y} is not in the tile store')  # skipcq: PYL-W1203
+        return None
+
+    url = basemap_source.format(z=tile.z, x=tile.x, y=tile.y, r='')
+    try:
+        response = get_http_session().get(url, timeout=fetch_timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        log.warning(f'Could not download tile {tile.z}/{tile.x}/{tile.y}', exc_info=True)  # skipcq: PYL-W1203
+        return None
+
+    global tiles_written  # skipcq: PYL-W0603
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'wb') as tile_file:
+        tile_file.write(response.content)
+    os.replace(path + '.tmp', path)
+    with tiles_written_lock:
+        tiles_written += 1
+    return response.content
+
+
+# Function to keep the tile store under its size limit
+def evict_tiles():
+    """
+    Removes the least recently used tiles until the tile store fits in tile_cache_max_bytes. The tile
+    store is only walked if tiles were saved to it since the last time.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    global tiles_written  # skipcq: PYL-W0603
+    with tiles_written_lock:
+        if not tiles_written:
+            return
+        tiles_written = 0
+
+    tile_stats = []
+    for directory, _, names in os.walk(tile_directory):
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                tile_stats.append((os.stat(path), path))
+            except OSError:
+                pass
+    tile_stats.sort(key=lambda item: item[0].st_mtime)
+
+    total_bytes = sum(stat.st_size for stat, _ in tile_stats)
+    for stat, path in tile_stats:
+        if total_bytes <= tile_cache_max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= stat.st_size
+        log.info('Evicted ' + path + ' from the tile store')
+
+
+# Function to stitch the basemap tiles together
+def build_tile_mosaic(zoom):
+    """
+    Stitches the tiles covering the map into one Web Mercator image. Missing tiles are filled with black,
+    the background of the map.
+
+    Parameters:
+        zoom (int): The zoom level of the tiles.
+
+    Returns:
+        tuple: The RGBA image, its (left, right, bottom, top) extent in Web Mercator meters and whether every tile was available.
+    """
+    tiles = map_tiles(zoom)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_max_workers, thread_name_prefix='tile') as executor:
+        contents = list(executor.map(get_tile, tiles))
+
+    min_x = min(tile.x for tile in tiles)
+    min_y = min(tile.y for tile in tiles)
+    columns = max(tile.x for tile in tiles) - min_x + 1
+    rows = max(tile.y for tile in tiles) - min_y + 1
+    image = np.zeros((rows * 256, columns * 256, 4), dtype=np.uint8)
+    image[..., 3] = 255  # Opaque black wherever a tile is missing
+    for tile, content in zip(tiles, contents):
+        if content is not None:
+            tile_image = np.asarray(Image.open(io.BytesIO(content)).convert('RGBA'))
+            row, column = (tile.y - min_y) * 256, (tile.x - min_x) * 256
+            image[row:row + 256, column:column + 256] = tile_image[:256, :256]
+
+    top_left = mercantile.xy_bounds(mercantile.Tile(min_x, min_y, zoom))
+    bottom_right = mercantile.xy_bounds(mercantile.Tile(min_x + columns - 1, min_y + rows - 1, zoom))
+    extent = (top_left.left, bottom_right.right, bottom_right.bottom, top_left.top)
+
+    evict_tiles()
+    return image, extent, all(content is not None for content in contents)
+
+
+# Function to fill the tile store ahead of time
+def prefetch_tiles():
+    """
+    Downloads every basemap tile covering the map into the local tile store.
+
+    Parameters:
+        None
+
+    Returns:
+        int: The number of tiles available in the tile store.
+    """
+    log.info('Prefetching basemap tiles')
+    tiles = map_tiles(tile_zoom)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_max_workers, thread_name_prefix='tile') as executor:
+        available = sum(content is not None for content in executor.map(get_tile, tiles))
+    evict_tiles()
+    log.info(f'{available} of {len(tiles)} basemap tiles are in the tile store')  # skipcq: PYL-W1203
+    return available
+
+
+# Function to draw the state and freeway shapefiles
+def add_base_layers(ax):
+    """
+    Draws the state outlines and interstate lines on a plot.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to draw on.
+
+    Returns:
+        None
+    """
+    states, highways = load_base_layers()
+
+    # State Outlines
+    states.plot(ax=ax, edgecolor='black', lw=0.75, alpha=0.75)
+
+    # Interstate Lines
+    highways.plot(ax=ax, color='red', linewidth=0.6, alpha=0.75)
+
+
+# Pre-drawn Base Maps
+base_map_images = {}  # Drawn base maps and whether every tile was available, keyed by size in inches, DPI and base map version
+base_map_versions = {}  # Base map version for each tile source, map extent and line tolerance, worked out once per process
+base_map_lock = threading.Lock()
+
+
+# Function to get the version of the base map
+def base_map_version():
+    """
+    Gets a short hash that changes whenever the shapefiles, the tile source or the map extent change. The
+    shapefiles are only looked at the first time, since they don't change while the program runs.
+
+    Parameters:
+        None
+
+    Returns:
+        str: The base map version.
+    """
+    settings = repr((basemap_source, plot_extent, base_layer_tolerance))
+    version = base_map_versions.get(settings)
+    if version is not None:
+        return version
+
+    version_hash = hashlib.sha1(settings.encode('utf-8'))
+    mapping_directory = os.path.join(current_directory, '../files/mapping')
+    for name in sorted(os.listdir(mapping_directory)):
+        if name.startswith(('s_11au16.', 'USA_Freeway_System.')):
+            stat = os.stat(os.path.join(mapping_directory, name))
+            version_hash.update(f'{name}:{stat.st_size}:{stat.st_mtime_ns}'.encode('utf-8'))
+    version = base_map_versions[settings] = version_hash.hexdigest()[:12]
+    return version
+
+
+# Function to draw the base map once
+def render_base_map(width, height, dpi):
+    """
+    Draws the basemap tiles, state outlines and interstate lines into an image covering the map extent.
+
+    Parameters:
+        width (float): The width of the map in inches.
+        height (float): The height of the map in inches.
+        dpi (float): The resolution of the map.
+
+    Returns:
+        tuple: The drawn base map as an RGBA image and whether every basemap tile was available.
+    """
+    log.info(f'Drawing the base map at {width}x{height} inches and {dpi} DPI')  # skipcq: PYL-W1203
+    fig = Figure(figsize=(width, height), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_facecolor('black')
+    add_base_layers(ax)
+    set_plot_limits(ax)
+    complete = add_basemap(ax)
+    set_plot_limits(ax)
+    ax.set_aspect('auto')  # Fill the whole image; the plot it is drawn on keeps the map's aspect
+    ax.set_axis_off()
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy(), complete
+
+
+# Function to get the pre-drawn base map
+def get_base_map(width, height, dpi):
+    """
+    Gets the base map for a map size, drawing it only if it is not already in memory or on disk.
+
+    A base map drawn while basemap tiles were missing is kept in memory for the rest of the process but
+    not saved, so the next run draws it again from the tiles it has by then.
+
+    Parameters:
+        width (float): The width of the map in inches.
+        height (float): The height of the map in inches.
+        dpi (float): The resolution of the map.
+
+    Returns:
+        tuple: The drawn base map as an RGBA image and whether every basemap tile was available.
+    """
+    version = base_map_version()
+    key = (width, height, dpi, version)
+    with base_map_lock:
+        base_map = base_map_images.get(key)
+        if base_map is not None:
+            return base_map
+
+        size_name = f'base_map_{width:g}x{height:g}_{dpi:g}dpi'
+        image_path = os.path.join(base_map_directory, f'{size_name}_{version}.png')
+        if os.path.exists(image_path):
+            log.info('Loading the base map from ' + image_path)
+            base_map = (plt.imread(image_path), True)
+        else:
+            base_map = render_base_map(width, height, dpi)
+            if base_map[1]:
+                os.makedirs(base_map_directory, exist_ok=True)
+                for name in os.listdir(base_map_directory):
+                    if name.startswith(size_name + '_'):  # Remove base maps drawn from old shapefiles or tiles
+                        os.remove(os.path.join(base_map_directory, name))
+                plt.imsave(image_path, base_map[0])
+            else:
+                log.warning('Some basemap tiles are missing, the base map will be drawn again next run')
+
+        base_map_images[key] = base_map
+        return base_map
+
+
+# Function to add the pre-drawn base map to a plot
+def add_base_map_image(ax):
+    """
+    Adds the pre-drawn base map to a plot, sized to match the plot's axes.
+
+    The plot is given the same latitude-corrected aspect that drawing the shapefiles with geopandas
+    gives it, so the map keeps its shape.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axes object to add the base map to.
+
+    Returns:
+        bool: True if every basemap tile was available, False if some are missing from the base map.
+    """
+    set_plot_limits(ax)
+    ax.set_aspect(base_map_aspect())
+    ax.apply_aspect()
+
+    fig = ax.figure
+    fig_width, fig_height = fig.get_size_inches()
+    position = ax.get_position()
+    image, complete = get_base_map(round(position.width * fig_width, 2), round(position.height * fig_height, 2), fig.dpi)
+    west, east, south, north = plot_extent
+    ax.imshow(image, extent=(west, east, south, north), aspect='auto', zorder=0)
+    ax.set_aspect(base_map_aspect())
+    return complete
+
+
+# Function to get the aspect of the map
+def base_map_aspect():
+    """
+    Gets the aspect geopandas gives a plot of the state and freeway shapefiles.
+
+    Parameters:
+        None
+
+    Returns:
+        float: The aspect ratio of the map, corrected for its mean latitude.
+    """
+    states, highways = load_base_layers()
+    south = min(states.total_bounds[1], highways.total_bounds[1])
+    north = max(states.total_bounds[3], highways.total_bounds[3])
+    return 1 / np.cos(np.deg2rad((south + north) / 2))
+
+
+# Function to draw the base map before it is needed
+def preload_base_map():
+    """
+    Loads or draws the base map for the standard outlook figure so the first outlook does not wait on it.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    fig, ax = setup_plot()
+    add_base_map_image(ax)
+
+
+# Function to check if there is a outlook to display
+def check_outlook_availability(outlook_data):
+    """
+    Checks if there is an available outlook in the given outlook data.
+
+    Parameters:
+        outlook_data (Outlook): The outlook data to check for availability.
+
+    Returns:
+        bool: True if an outlook is available, False otherwise.
+    """
+    log.info('running check_outlook_availability')
+    if outlook_data.available:
+        log.info('There is an outlook')
+    return outlook_data.available
+
+
+# Function to plot the outlook polygons
+def plot_outlook_polygons(ax, outlook_type, outlook_data):
+    """
+    Plots outlook polygons on a given axis, drawing every polygon of a risk level as a single collection.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axis to plot the outlook polygons on.
+        outlook_type (str): The type of outlook to plot (e.g. 'cat', 'tor', 'wind', etc.).
+        outlook_data (Outlook): The parsed outlook to plot.
+
+    Returns:
+        list: The added PolyCollection of each risk level.
+    """
+    log.info('Plotting Outlook Polygons')
+    if outlook_type not in ('cat', 'tor', 'wind', 'hail', 'd4-8', 'prob'):
+        log.error('Plotting Error. Outlook_Type' + outlook_type + 'error on line 598')
+        popup('error', 'Plotting Error', 'An error has occured plotting the outlook. The program will now quit.')
+        sys.exit(0)
+
+    collections = []
+    for outlook_label, rings in outlook_data.label_rings().items():
+        if outlook_label == 'SIGN':  # Add hatching for 'SIGN' outlook type
+            polygons = PolyCollection(rings, alpha=0.2, edgecolors='k', linewidths=1, facecolors=color(outlook_type, outlook_label),
+                                      hatch='x')
+        else:
+            polygons = PolyCollection(rings, alpha=0.5, edgecolors='k', linewidths=1, facecolors=color(outlook_type, outlook_label))
+        ax.add_collection(polygons)
+        collections.append(polygons)
+    return collections
+
+
+# File name each outlook type is saved under in the output directory
+output_filenames = {
+    'cat': 'spc_day_{day}cat_outlook.png',
+    'tor': 'spc_day_{day}_tor_outlook.png',
+    'wind': 'spc_day_{day}_wind_outlook.png',
+    'hail': 'spc_day_{day}_hail_outlook.png',
+    'd4-8': 'spc_day_{day}_outlook.png',
+    'prob': 'spc_day_{day}_prob_outlook.png'
+}
+d48_strip_filename = 'spc_day_4-8_outlooks.png'  # File name the Day 4-8 strip is saved under in the output directory
+
+
+# Function to work out the render cache key of an outlook
+def render_cache_key(outlook_type, outlook_data):
+    """
+    Works out the key a rendered outlook is cached under. It changes whenever anything that shows in the
+    image does: the outlook's labels and geometry, the colors, the figure size and resolution, or the base map.
+
+    Parameters:
+        outlook_type (str): The type of outlook.
+        outlook_data (Outlook): The parsed outlook.
+
+    Returns:
+        str: The key.
+    """
+    styles = {label: color(outlook_type, label) for label in [*risk_level_mappings.get(outlook_type, {}), 'SIGN']}
+    key_data = [outlook_type, outlook_data.fingerprint, styles, figure_size, output_dpi, base_map_version()]
+    return hashlib.sha1(json.dumps(key_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+# Function to keep the render cache under its size limit
+def evict_render_cache():
+    """
+    Removes the least recently used images until the render cache fits in render_cache_max_bytes.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    try:
+        image_stats = sorted(((os.stat(os.path.join(render_cache_directory, name)), os.path.join(render_cache_directory, name))
+                              for name in os.listdir(render_cache_directory) if name.endswith('.png')),
+                             key=lambda item: item[0].st_mtime)
+    except OSError:
+        return
+
+    total_bytes = sum(stat.st_size for stat, _ in image_stats)
+    for stat, path in image_stats:
+        if total_bytes <= render_cache_max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= stat.st_size
+        log.info('Evicted ' + path + ' from the render cache')
+
+
+# Function to copy a cached render to the output directory
+def load_cached_render(cache_key, output_path):
+    """
+    Copies an image from the render cache to where it is saved in the output directory.
+
+    Parameters:
+        cache_key (str): The render cache key of the image.
+        output_path (str): Where the image is saved.
+
+    Returns:
+        bool: True if the image was in the render cache, False otherwise.
+    """
+    cache_path = os.path.join(render_cache_directory, cache_key + '.png')
+    tmp_path = output_path + '.' + str(threading.get_ident()) + '.tmp'  # Each thread copies through its own file
+    try:
+        shutil.copyfile(cache_path, tmp_path)
+        os.replace(tmp_path, output_path)
+        os.utime(cache_path)  # Mark the image as recently used
+    except OSError:
+        return False
+    return True
+
+
+# Function to keep a render for next time
+def save_cached_render(cache_key, image_path):
+    """
+    Copies a newly saved image into the render cache.
+
+    Parameters:
+        cache_key (str): The render cache key of the image.
+        image_path (str): The saved image.
+
+    Returns:
+        None
+    """
+    cache_path = os.path.join(render_cache_directory, cache_key + '.png')
+    tmp_path = cache_path + '.' + str(threading.get_ident()) + '.tmp'
+    try:
+        os.makedirs(render_cache_directory, exist_ok=True)
+        shutil.copyfile(image_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        log.warning('Could not save ' + image_path + ' to the render cache', exc_info=True)
+        return
+    evict_render_cache()
+
+
+# Function to save a figure to the output directory
+def save_figure(fig, output_path, cache_key):
+    """
+    Saves a figure as a PNG through a temporary file, so anything reading the image, like the local HTTP
+    server, never sees it half written. The image is copied into the render cache before it is moved into
+    place, so another render replacing the output image can't end up in the cache under this key.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): The figure to save.
+        output_path (str): Where the image is saved.
+        cache_key (str): The render cache key of the image, or None to keep it out of the render cache.
+
+    Returns:
+        None
+    """
+    tmp_path = output_path + '.' + str(threading.get_ident()) + '.tmp'  # Each thread saves through its own file
+    try:
+        fig.savefig(tmp_path, format='png', dpi=output_dpi, bbox_inches='tight')
+        if cache_key is not None:
+            save_cached_render(cache_key, tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Function to draw the outlook
+def render_outlook(outlook_type, day, outlook_data):
+    """
+    Draws an outlook onto a new figure and saves it to the output directory.
+
+    An outlook that has been drawn before with the same colors, size and base map is copied from the
+    render cache instead of being drawn again. An outlook drawn while basemap tiles were missing is not
+    kept in the render cache, so it is drawn again once the tiles are available. The figure is built
+    without pyplot so this can run on a background thread.
+
+    Parameters:
+        outlook_type (str): The type of outlook to draw (e.g. 'cat', 'tor', 'wind', etc.).
+        day (int or str): The day of the outlook.
+        outlook_data (Outlook): The parsed outlook to draw.
+
+    Returns:
+        str: The path of the saved image.
+    """
+    output_path = outlook_output_path(outlook_type, day)
+    cache_key = render_cache_key(outlook_type, outlook_data)
+    if load_cached_render(cache_key, output_path):
+        log.info('Using the cached render of the ' + outlook_type + ' outlook for day ' + str(day))
+        return output_path
+
+    log.info('Rendering ' + outlook_type + ' outlook for day ' + str(day))
+    fig, ax = setup_plot()
+
+    complete = add_overlays(ax, outlook_type)
+    set_plot_limits(ax)
+    remove_axes_labels_boxes_title(ax)
+
+    plot_outlook_polygons(ax, outlook_type, outlook_data)
+
+    if not complete:
+        log.warning('Not caching the ' + outlook_type + ' outlook for day ' + str(day) + ', some basemap tiles are missing')
+    save_figure(fig, output_path, cache_key if complete else None)
+    return output_path
+
+
+# Function to get where an outlook is saved
+def outlook_output_path(outlook_type, day):
+    """
+    Gets the path an outlook image is saved to in the output directory.
+
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int or str): The day of the outlook.
+
+    Returns:
+        str: The path of the outlook image.
+    """
+    return os.path.join(create_output_directory(), output_filenames[outlook_type].format(day=day))
+
+
+# Function to lay out the Day 4-8 strip
+def setup_d48_strip(fig):
+    """
+    Lays out the Day 4-8 strip on a figure: a panel with the base map for each day in a 2x3 grid, and the
+    Day 4-8 header in the last cell. The panels are all the same size, so they share one base map image.
+
+    Parameters:
+        fig (matplotlib.figure.Figure): The figure to lay the strip out on.
+
+    Returns:
+        tuple: The axes of each day's panel, Day 4 first, the axes holding the header, and whether every
+        basemap tile was available.
+    """
+    grid = fig.add_gridspec(2, 3, left=0.01, right=0.99, bottom=0.01, top=0.99, wspace=0.03, hspace=0.03)
+    panels = []
+    complete = True
+    for index in range(len(outlook_days['d4-8'])):
+        ax = fig.add_subplot(grid[divmod(index, 3)])
+        complete = add_base_map_image(ax) and complete
+        ax.set_facecolor("black")
+        set_plot_limits(ax)
+        remove_axes_labels_boxes_title(ax)
+        panels.append(ax)
+
+    header_ax = fig.add_subplot(grid[1, 2])
+    header_ax.imshow(plt.imread(os.path.join(current_directory, '../files/overlays/wtus_d48_header.png')))
+    header_ax.axis('off')
+    return panels, header_ax, complete
+
+
+# Function to plot the Day 4-8 outlooks on the strip
+def plot_d48_panels(panels, outlooks):
+    """
+    Plots each Day 4-8 outlook on its panel, labelled with the day and its highest risk.
+
+    Parameters:
+        panels (list): The axes of each day's panel, from setup_d48_strip.
+        outlooks (dict): The parsed outlook for each ('d4-8', day) pair.
+
+    Returns:
+        list: The artists added to the panels.
+    """
+    artists = []
+    for ax, day in zip(panels, outlook_days['d4-8']):
+        outlook_data = outlooks['d4-8', day]
+        if outlook_data.available:
+            artists.extend(plot_outlook_polygons(ax, 'd4-8', outlook_data))
+            text = f'Day {day}: {summarize_outlook(outlook_data)["highest_risk"]}'
+        else:
+            text = f'Day {day}: No Outlook'
+        artists.append(ax.text(0.02, 0.97, text, transform=ax.transAxes, color='white', fontsize=12, fontweight='bold',
+                               va='top', bbox={'facecolor': 'black', 'alpha': 0.6, 'linewidth': 0}))
+    return artists
+
+
+# Function to draw the Day 4-8 strip
+def render_d48_strip(outlooks):
+    """
+    Draws Days 4 through 8 side by side on one figure and saves it to the output directory, taking it
+    from the render cache if the same five outlooks have been drawn before.
+
+    Parameters:
+        outlooks (dict): The parsed outlook for each ('d4-8', day) pair.
+
+    Returns:
+        str: The path of the saved strip.
+    """
+    output_path = os.path.join(create_output_directory(), d48_strip_filename)
+    panel_keys = [render_cache_key('d4-8', outlooks['d4-8', day]) for day in outlook_days['d4-8']]
+    cache_key = hashlib.sha1(json.dumps(['strip', d48_strip_size, *panel_keys]).encode('utf-8')).hexdigest()
+    if load_cached_render(cache_key, output_path):
+        log.info('Using the cached render of the Day 4-8 strip')
+        return output_path
+
+    log.info('Rendering the Day 4-8 strip')
+    fig = Figure(figsize=d48_strip_size)
+    fig.set_facecolor('black')
+    panels, _, complete = setup_d48_strip(fig)
+    plot_d48_panels(panels, outlooks)
+
+    if not complete:
+        log.warning('Not caching the Day 4-8 strip, some basemap tiles are missing')
+    save_figure(fig, output_path, cache_key if complete else None)
+    return output_path
+
+
+# Outlook Viewer
+outlook_viewer = None  # The window outlooks are shown in, created the first time an outlook is shown
+
+
+class OutlookViewer:
+    """
+    The window outlooks are shown in. One figure, canvas and toolbar are kept for the whole session, and
+    showing an outlook only swaps the header and risk polygons drawn over the base map. The viewer always
+    draws the outlook itself rather than showing the saved image, so it can be zoomed without losing
+    detail; only the polygons are drawn fresh, since the base map is a pre-drawn image. The Day 4-8 strip
+    panels are added to the same figure the first time the strip is shown, and hidden while a single
+    outlook is shown.
+
+    Attributes:
+        window (tkinter.Toplevel): The viewer window, hidden while no outlook is shown.
+        fig (matplotlib.figure.Figure): The figure outlooks are drawn on.
+        ax (matplotlib.axes.Axes): The axes holding the base map and the outlook.
+        canvas (FigureCanvasTkAgg): The canvas showing the figure.
+        toolbar (NavigationToolbar2Tk): The zoom and pan toolbar, with the Close button.
+        home_limits (tuple): The x and y limits of the whole map.
+        strip_panels (list): The axes of each Day 4-8 strip panel, or None until the strip is first shown.
+        strip_axes (list): Every axes of the Day 4-8 strip, header included.
+        layer (list): The artists of the outlook being shown.
+        on_close (function): Called when the viewer is closed, or None.
+    """
+
+    def __init__(self, master):
+        """
+        Builds the viewer window and draws the base map on it.
+
+        Parameters:
+            master (tkinter.Misc): The window the viewer belongs to.
+        """
+        self.window = tk.Toplevel(master)
+        self.window.withdraw()
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.fig, self.ax = setup_plot()
+        add_base_map_image(self.ax)
+        self.ax.set_facecolor("black")
+        set_plot_limits(self.ax)
+        remove_axes_labels_boxes_title(self.ax)
+        self.home_limits = (self.ax.get_xlim(), self.ax.get_ylim())
+
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.window)
+        self.canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+
+        # Create a custom toolbar with a close button
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self.window)
+        close_button = tk.Button(self.toolbar, text='Close', command=self.close)
+        close_button.pack(side=tk.RIGHT)
+
+        self.strip_panels = None
+        self.strip_axes = []
+        self.layer = []
+        self.on_close = None
+
+    def show(self, outlook_type, day, outlook_data, on_close=None):
+        """
+        Swaps the outlook being shown for another one and shows the viewer window.
+
+        Parameters:
+            outlook_type (str): The type of outlook.
+            day (int or str): The day of the outlook.
+            outlook_data (Outlook): The parsed outlook.
+            on_close (function): Called when the viewer is closed, or None.
+        """
+        log.info('Showing the plot')
+        self.clear_layer()
+        self.use_strip(False)
+        self.layer = [add_header(self.ax, outlook_type), *plot_outlook_polygons(self.ax, outlook_type, outlook_data)]
+        self.present(f'Day {day} {outlook_type} Outlook', on_close)
+
+    def show_d48_strip(self, outlooks, on_close=None):
+        """
+        Shows Days 4 through 8 side by side and shows the viewer window.
+
+        Parameters:
+            outlooks (dict): The parsed outlook for each ('d4-8', day) pair.
+            on_close (function): Called when the viewer is closed, or None.
+        """
+        log.info('Showing the Day 4-8 strip')
+        self.clear_layer()
+        if self.strip_panels is None:
+            self.strip_panels, header_ax, _ = setup_d48_strip(self.fig)
+            self.strip_axes = [*self.strip_panels, header_ax]
+        self.use_strip(True)
+        self.layer = plot_d48_panels(self.strip_panels, outlooks)
+        self.present('Day 4-8 Outlooks', on_close)
+
+    def clear_layer(self):
+        """
+        Removes the outlook being shown, leaving the base maps.
+        """
+        for artist in self.layer:
+            artist.remove()
+        self.layer = []
+
+    def use_strip(self, strip):
+        """
+        Switches the figure between the single outlook map and the Day 4-8 strip.
+
+        Parameters:
+            strip (bool): True to show the strip, False to show the single map.
+        """
+        self.ax.set_visible(not strip)
+        for ax in self.strip_axes:
+            ax.set_visible(strip)
+
+    def present(self, title, on_close):
+        """
+        Redraws the figure from the whole map, without the zoom history of the last outlook, and shows the window.
+
+        Parameters:
+            title (str): The title of the viewer window.
+            on_close (function): Called when the viewer is closed, or None.
+        """
+        for ax in (self.ax, *(self.strip_panels or ())):
+            ax.set_xlim(self.home_limits[0])
+            ax.set_ylim(self.home_limits[1])
+        self.toolbar.update()
+
+        self.on_close = on_close
+        self.window.title(title)
+        self.canvas.draw_idle()
+        self.window.deiconify()
+
+    def close(self):
+        """
+        Hides the viewer window and hands control back to whoever opened it.
+        """
+        self.window.withdraw()
+        on_close, self.on_close = self.on_close, None
+        if on_close is not None:
+            on_close()
+
+
+# Function to display the outlook
+def show_outlook(outlook_type, day, outlook_data, on_close=None):
+    """
+    Shows an outlook in the outlook viewer, creating the viewer the first time. Must be called on the Tk thread.
+
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int or str): The day of the outlook.
+        outlook_data (Outlook): The parsed outlook.
+        on_close (function): Called when the viewer is closed, or None.
+
+    Returns:
+        None
+    """
+    get_outlook_viewer().show(outlook_type, day, outlook_data, on_close)
+
+
+# Function to display the Day 4-8 strip
+def show_d48_strip(outlooks, on_close=None):
+    """
+    Shows the Day 4-8 strip in the outlook viewer, creating the viewer the first time. Must be called on the Tk thread.
+
+    Parameters:
+        outlooks (dict): The parsed outlook for each ('d4-8', day) pair.
+        on_close (function): Called when the viewer is closed, or None.
+
+    Returns:
+        None
+    """
+    get_outlook_viewer().show_d48_strip(outlooks, on_close)
+
+
+# Function to get the outlook viewer
+def get_outlook_viewer():
+    """
+    Gets the outlook viewer, creating it the first time it is needed. Must be called on the Tk thread.
+
+    Parameters:
+        None
+
+    Returns:
+        OutlookViewer: The outlook viewer.
+    """
+    global outlook_viewer  # skipcq: PYL-W0603
+    if outlook_viewer is None:
+        outlook_viewer = OutlookViewer(root)
+    return outlook_viewer
+
+
+# Colors for Display
+def color(outlook_type, outlook_level):
+    # skipcq: FLK-W505
+    """
+    Returns the color associated with a given outlook type.
+
+    Parameters:
+        type (str): The type of outlook (e.g., 'cat', 'tor', 'wind', 'hail', 'prob', 'd4-8').
+        outlook_type (str): The specific outlook type (e.g., 'TSTM', 'MRGL', 'SLGT', 'ENH', 'MDT', 'HIGH', '0.02', '0.05', '0.10', '0.15', '0.30', '0.45', '0.60', 'sig').  # skipcq: FLK-W505
+
+    Returns:
+        str: The color associated with the given outlook type, or 'blue' if not found.
+    """
+    log.info('Getting ' + outlook_level + ' for ' + outlook_type + ' outlook')
+    if outlook_type == 'cat':
+        colors = {
+            'TSTM': 'lightgreen',
+            'MRGL': 'green',
+            'SLGT': 'yellow',
+            'ENH': 'orange',
+            'MDT': 'red',
+            'HIGH': 'magenta'
+        }
+    if outlook_type == 'tor':
+        colors = {
+            '0.02': 'green',
+            '0.05': 'brown',
+            '0.10': 'yellow',
+            '0.15': 'red',
+            '0.30': 'pink',
+            '0.45': 'purple',
+            '0.60': 'blue',
+            'sig': 'black'
+        }
+    if outlook_type in ('wind', 'hail', 'prob'):
+        colors = {
+            '0.05': 'saddlebrown',
+            '0.15': 'gold',
+            '0.30': 'red',
+            '0.45': 'fuchsia',
+            '0.60': 'blueviolet',
+            'sig': 'black'
+        }
+    if outlook_type == 'd4-8':
+        colors = {
+            '0.15': 'gold',
+            '0.30': 'sandybrown'
+        }
+    if outlook_type not in ('cat', 'tor', 'wind', 'hail', 'prob', 'd4-8'):
+        log.error("There was an error accessing colors. Error on line 751")
+        popup('warning', 'Invalid Outlook Type', 'There was an error when trying to get colors. The program will now quit.')
+        sys.exit(0)
+
+    return colors.get(outlook_level, 'blue')  # Returns the color, blue if not found
+
+
+# Displaying Popups
+def popup(popup_type, title, message):  # skipcq: PYL-R1710
+    """
+    The `popup` function displays different types of popups based on the input parameters such as
+    info, error, warning, or question.
+
+    :param type: The `type` parameter in the `popup` method specifies the type of popup to display.
+    :param title: The `title` parameter in the `popup` function refers to the title of the popup
+    window that will be displayed. It is the text that appears at the top of the popup window to
+    provide context or information about the message being shown to the user.
+    :param message: The `message` parameter in the `popup` function is the text that will be
+    displayed in the popup dialog box. It is the information, error message, warning message, or
+    question that you want to show to the user depending on the type of popup being displayed.
+    :return: The `popup` method returns the value of `question` when the `type` parameter is
+    set to 'question'.
+    """
+    log.info('Showing a ' + popup_type + ' popup titled ' + title + 'with the following message: ' + message)
+    if popup_type == 'info':
+        messagebox.showinfo(title, message)
+    elif popup_type == 'error':
+        messagebox.showerror(title, message)
+    elif popup_type == 'warning':
+        messagebox.showwarning(title, message)
+    elif popup_type == 'question':
+        global question  # skipcq: PYL-W0603
+        question = messagebox.askquestion(title, message)
+        return question  # skipcq: PYL-R1710
+    else:
+        messagebox.showerror('Invalid Popup', 'There was an error when trying to display a popup. The program will now quit.')
+        sys.exit(0)
+
+
+# Start the GUI
+def start_gui():  # skipcq: PY-R1000
+    """
+    This function initializes and runs the graphical user interface (GUI) for the Severe Weather Outlook Display program.
+    It creates the main window, sets up the layout, and defines the behavior for various buttons and events.
+    The function does not take any parameters and does not return any values.
+    """
+    # Initialize a window
+    log.info('GUI - Initializing window')
+    window = ctk.CTkToplevel()
+    window.geometry('1700x900+50+50')
+    window.title('Severe Weather Outlook Display')
+
+    # Configure Layout
+    window.grid_rowconfigure(0, weight=1)
+    window.grid_columnconfigure(2, weight=1)
+
+    # Fonts
+    Title_Font = ctk.CTkFont(family='Montserrat', size=50, weight='bold')
+    Description_Font = ctk.CTkFont(family='karla', size=21)
+
+    # Frames
+    sidebar_frame = ctk.CTkFrame(window, height=550, fg_color='#103157')
+    sidebar_frame.grid(row=0, column=0, sticky='ns')
+
+    main_frame = ctk.CTkFrame(window)
+    main_frame.grid(row=0, column=1, columnspan=2, sticky='nsew')
+
+    def side_bar():
+        """
+        Initializes the sidebar buttons for the GUI.
+
+        Creates and configures the following buttons:
+        - Logo Button: Displays the logo image and is disabled.
+        - Home Button: Changes the frame to the home frame when clicked.
+        - Day 1 Button: Changes the frame to the frame corresponding to day 1 when clicked.
+        - Day 2 Button: Changes the frame to the frame corresponding to day 2 when clicked.
+        - Day 3 Button: Changes the frame to the frame corresponding to day 3 when clicked.
+        - Day 4-8 Button: Changes the frame to the frame corresponding to days 4-8 when clicked.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        # Logo
+        logo_Button = ctk.CTkButton(sidebar_frame, text='', width=200, height=250, corner_radius=10, fg_color='transparent',
+                                    state='disabled', image=logo_icon, compound='top')
+        logo_Button.grid(row=0, column=0, columnspan=1, padx=5, pady=10)
+
+        # Home Button
+        Home_Side_Button = ctk.CTkButton(sidebar_frame, text='Home', width=200, corner_radius=10, fg_color='transparent',
+                                         font=('karla', 26), command=lambda: frame_change('home'),
+                                         hover_color='#2191aa', image=home_icon, compound='top')
+        Home_Side_Button.grid(row=1, column=0, columnspan=1, padx=5, pady=10)
+
+        # Day 1 Button
+        D1_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 1', width=200, corner_radius=12, fg_color='transparent',
+                                       font=('karla', 26), command=lambda: frame_change(1),
+                                       hover_color='#2191aa', image=tornado_icon)
+        D1_Side_Button.grid(row=2, column=0, columnspan=1, padx=5, pady=10)
+
+        # Day 2 Button
+        D2_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 2', width=200, corner_radius=12, fg_color='transparent',
+                                       font=('karla', 26), command=lambda: frame_change(2),
+                                       hover_color='#2191aa', image=tornado_icon)
+        D2_Side_Button.grid(row=3, column=0, columnspan=1, padx=5, pady=10)
+
+        # Day 3 Button
+        D3_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 3', width=200, corner_radius=12, fg_color='transparent',
+                                       font=('karla', 26), command=lambda: frame_change(3),
+                                       hover_color='#2191aa', image=lightning_icon)
+        D3_Side_Button.grid(row=4, column=0, columnspan=1, padx=5, pady=10)
+
+        # Day 4-8 Button
+        D48_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 4-8', width=200, corner_radius=12, fg_color='transparent',
+                                        font=Description_Font, command=lambda: frame_change('d4-8'),
+                                        hover_color='#2191aa', image=lightning_icon)
+        D48_Side_Button.grid(row=5, column=0, columnspan=1, padx=5, pady=10)
+
+    def show_loading(message, on_cancel):
+        """
+        Replaces the main frame with a loading message while a background job runs.
+
+        Parameters:
+            message (str): The message to show while loading.
+            on_cancel (function): Called when the Cancel button is pressed.
+
+        Returns:
+            None
+        """
+        for widget in main_frame.winfo_children():
+            widget.destroy()
+
+        # Loading Label
+        Loading_Label = ctk.CTkLabel(main_frame, text=message, font=Title_Font)
+        Loading_Label.place(relx=0.5, rely=0.45, anchor='center')
+
+        # Cancel Button
+        Cancel_Button = ctk.CTkButton(main_frame, text='Cancel', width=200, font=Description_Font,
+                                      command=on_cancel)
+        Cancel_Button.place(relx=0.5, rely=0.55, anchor='center')
+
+    def load_frame(day, products):
+        """
+        Fetches the outlooks a frame needs in the background, then builds the frame with them.
+
+        Parameters:
+            day (str or int): The day of the frame being loaded.
+            products (list): The (outlook_type, day) pairs the frame needs.
+
+        Returns:
+            None
+        """
+        show_loading('Loading Outlooks...', lambda: frame_change('home'))
+        submit_job('frame', fetch_outlooks, (products,),
+                   on_done=lambda outlooks: frame_change(day, outlooks),
+                   on_error=lambda error: frame_change('home'))
+
+    def frames(day, outlooks=None):
+        """
+        This function handles the frames for different days of the week. It takes a day parameter and
+        based on that, it creates the corresponding frame with the required buttons and labels.
+
+        Frames that show risk levels fetch their outlooks in the background first and are built
+        once the outlooks arrive.
+
+        Parameters:
+        day (str or int): The day of the week. It can be 'home', 1, 2, 3, 'd4-8', or 'test'.
+        outlooks (dict): The fetched outlooks for the frame, keyed by (outlook_type, day).
+
+        Returns:
+        None
+        """
+        if day == 'home':
+            side_bar()
+
+            # Home Button
+            Home_Side_Button = ctk.CTkButton(sidebar_frame, text='Home', width=200, corner_radius=10,
+                                             fg_color='transparent',
+                                             font=('karla', 26), command=lambda: frame_change('home'),
+                                             state='disabled', image=home_icon, compound='top')
+            Home_Side_Button.grid(row=1, column=0, columnspan=1, padx=5, pady=10)
+
+            # Close Button
+            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
+                                         command=close_program)
+            Close_Button.place(x=1285, y=15)
+
+            # Hide Button
+            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
+                                        command=hide_to_system_tray)
+            Hide_Button.place(x=1075, y=15)
+
+            # Title Label
+            Title_Label = ctk.CTkLabel(main_frame, text='Severe Weather Outlook Display',
+                                       font=('Montserrat', 72, 'bold'), width=1200)
+            Title_Label.place(x=150, y=350)
+
+            # Welcome Label
+            Welcome_Label = ctk.CTkLabel(main_frame,
+                                         text='Welcome to the Severe Weather Outlook Display! Press a button below to find a outlook to dispaly.',
+                                         font=('karla', 25))
+            Welcome_Label.place(x=200, y=450)
+        elif day == 1:
+            if outlooks is None:
+                load_frame(day, [('cat', 1), ('tor', 1), ('wind', 1), ('hail', 1)])
+                return
+
+            highest_risk_level_cat_day_1 = summarize_outlook(outlooks['cat', 1])['highest_risk']
+            highest_risk_level_tor_day_1 = summarize_outlook(outlooks['tor', 1])['highest_risk']
+            highest_risk_level_wind_day_1 = summarize_outlook(outlooks['wind', 1])['highest_risk']
+            highest_risk_level_hail_day_1 = summarize_outlook(outlooks['hail', 1])['highest_risk']
+
+            side_bar()
+
+            # Day 1 Button
+            D1_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 1', width=200, corner_radius=12, fg_color='transparent',
+                                           font=('karla', 26), command=lambda: frame_change(1),
+                                           state='disabled', image=tornado_icon)
+            D1_Side_Button.grid(row=2, column=0, columnspan=1, padx=5, pady=10)
+
+            # Close Button
+            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
+                                         command=close_program)
+            Close_Button.grid(row=1, column=3, padx=20, pady=15, sticky='e')
+
+            # Hide_Button
+            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
+                                        command=hide_to_system_tray)
+            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+
+            # Day 1 Heading Label
+            D1_Label = ctk.CTkLabel(main_frame, text='Day 1 Outlooks', font=Title_Font)
+            D1_Label.grid(row=2, column=1, columnspan=2, padx=435, pady=50, sticky='nsew')
+
+            # Day 1 Categorical Button
+            D1_Cat_Button = ctk.CTkButton(main_frame, text='Day 1 Categorical', width=150, height=50, font=('karla', 28),
+                                          command=lambda: button_run('cat', 1))
+            D1_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 1 Categorial Risk Label
+            highest_risk_label_cat_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_cat_day_1}',
+                                                        font=('karla', 25))
+            highest_risk_label_cat_day_1.grid(row=3, column=2, columnspan=1, sticky='nsew')
+
+            # Day 1 Tornado Button
+            D1_Tor_Button = ctk.CTkButton(main_frame, text='Day 1 Tornado', width=150, height=50, font=('karla', 28),
+                                          command=lambda: button_run('tor', 1))
+            D1_Tor_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 1 Tornado Risk Label
+            highest_risk_label_tor_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_tor_day_1}',
+                                                        font=('karla', 25))
+            highest_risk_label_tor_day_1.grid(row=4, column=2, columnspan=1, sticky='nsew')
+
+            # Day 1 Wind Outlook
+            D1_Wind_Button = ctk.CTkButton(main_frame, text='Day 1 Wind', width=150, height=50, font=('karla', 28),
+                                           command=lambda: button_run('wind', 1))
+            D1_Wind_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 1 Wind Risk Label
+            highest_risk_label_wind_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_wind_day_1}',
+                                                         font=('karla', 25))
+            highest_risk_label_wind_day_1.grid(row=5, column=2, columnspan=1, sticky='nsew')
+
+            # Day 1 Hail Outlook
+            D1_Hail_Button = ctk.CTkButton(main_frame, text='Day 1 Hail', width=150, height=50, font=('karla', 28),
+                                           command=lambda: button_run('hail', 1))
+            D1_Hail_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 1 Hail Risk Label
+            highest_risk_label_hail_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_hail_day_1}',
+                                                         font=('karla', 25))
+            highest_risk_label_hail_day_1.grid(row=6, column=2, columnspan=1, sticky='nsew')
+        elif day == 2:
+            if outlooks is None:
+                load_frame(day, [('cat', 2), ('tor', 2), ('wind', 2), ('hail', 2)])
+                return
+
+            highest_risk_level_cat_day_2 = summarize_outlook(outlooks['cat', 2])['highest_risk']
+            highest_risk_level_tor_day_2 = summarize_outlook(outlooks['tor', 2])['highest_risk']
+            highest_risk_level_wind_day_2 = summarize_outlook(outlooks['wind', 2])['highest_risk']
+            highest_risk_level_hail_day_2 = summarize_outlook(outlooks['hail', 2])['highest_risk']
+
+            side_bar()
+
+            # Day 2 Button
+            D2_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 2', width=200, corner_radius=12,
+                                           fg_color='transparent',
+                                           font=('karla', 26), command=lambda: frame_change(2),
+                                           state='disabled', image=tornado_icon)
+            D2_Side_Button.grid(row=3, column=0, columnspan=1, padx=5, pady=10)
+
+            # Close Button
+            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
+                                         command=close_program)
+            Close_Button.grid(row=1, column=3, padx=15, pady=15, sticky='e')
+
+            # Hide_Button
+            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
+                                        command=hide_to_system_tray)
+            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+
+            # Day 2 Heading Label
+            D2_Label = ctk.CTkLabel(main_frame, text='Day 2 Outlooks', font=Title_Font)
+            D2_Label.grid(row=2, column=1, columnspan=2, padx=435, pady=50, sticky='nsew')
+
+            # Day 2 Categorical Button
+            D2_Cat_Button = ctk.CTkButton(main_frame, text='Day 2 Categorical', width=150, height=50, font=('karla', 28),
+                                          command=lambda: button_run('cat', 2))
+            D2_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 2 Categorial Risk Label
+            highest_risk_label_cat_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_cat_day_2}',
+                                                        font=('karla', 25))
+            highest_risk_label_cat_day_2.grid(row=3, column=2, columnspan=1, sticky='nsew')
+
+            # Day 2 Tornado Button
+            D2_Tor_Button = ctk.CTkButton(main_frame, text='Day 2 Tornado', width=150, height=50, font=('karla', 28),
+                                          command=lambda: button_run('tor', 2))
+            D2_Tor_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 2 Tornado Risk Label
+            highest_risk_label_tor_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_tor_day_2}',
+                                                        font=('karla', 25))
+            highest_risk_label_tor_day_2.grid(row=4, column=2, columnspan=1, sticky='nsew')
+
+            # Day 2 Wind Outlook
+            D1_Wind_Button = ctk.CTkButton(main_frame, text='Day 2 Wind', width=150, height=50, font=('karla', 28),
+                                           command=lambda: button_run('wind', 2))
+            D1_Wind_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 1 Wind Risk Label
+            highest_risk_label_wind_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_wind_day_2}',
+                                                         font=('karla', 25))
+            highest_risk_label_wind_day_2.grid(row=5, column=2, columnspan=1, sticky='nsew')
+
+            # Day 2 Hail Outlook
+            D2_Hail_Button = ctk.CTkButton(main_frame, text='Day 2 Hail', width=150, height=50, font=('karla', 28),
+                                           command=lambda: button_run('hail', 2))
+            D2_Hail_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 2 Hail Risk Label
+            highest_risk_label_hail_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_hail_day_2}',
+                                                         font=('karla', 25))
+            highest_risk_label_hail_day_2.grid(row=6, column=2, columnspan=1, sticky='nsew')
+        elif day == 3:
+            if outlooks is None:
+                load_frame(day, [('cat', 3), ('prob', 3)])
+                return
+
+            highest_risk_level_cat_day_3 = summarize_outlook(outlooks['cat', 3])['highest_risk']
+            highest_risk_level_prob_day_3 = summarize_outlook(outlooks['prob', 3])['highest_risk']
+
+            side_bar()
+
+            # Day 3 Button
+            D3_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 3', width=200, corner_radius=12,
+                                           fg_color='transparent',
+                                           font=('karla', 26), command=lambda: frame_change(3),
+                                           state='disabled', image=lightning_icon)
+            D3_Side_Button.grid(row=4, column=0, columnspan=1, padx=5, pady=10)
+
+            # Close Button
+            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
+                                         command=close_program)
+            Close_Button.grid(row=1, column=3, padx=15, pady=15, sticky='e')
+
+            # Hide_Button
+            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
+                                        command=hide_to_system_tray)
+            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+
+            # Day 3 Heading Label
+            D3_Label = ctk.CTkLabel(main_frame, text='Day 3 Outlooks', font=Title_Font)
+            D3_Label.grid(row=2, column=1, columnspan=2, padx=435, pady=50, sticky='nsew')
+
+            # Day 3 Categorical Button
+            D3_Cat_Button = ctk.CTkButton(main_frame, text='Day 3 Categorical', width=150, height=50, font=('karla', 28),
+                                          command=lambda: button_run('cat', 3))
+            D3_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 3 Categorial Risk Label
+            highest_risk_label_cat_day_3 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_cat_day_3}',
+                                                        font=('karla', 25))
+            highest_risk_label_cat_day_3.grid(row=3, column=2, columnspan=1, sticky='nsew')
+
+            # Day 3 Probabilistic Outlook
+            D3_Prob_Button = ctk.CTkButton(main_frame, text='Day 3 Probabilistic', width=150, height=50, font=('karla', 28),
+                                           command=lambda: button_run('prob', 3))
+            D3_Prob_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Day 3 Probabilistic Risk Label
+            highest_risk_label_prob_day_3 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_prob_day_3}',
+                                                         font=('karla', 25))
+            highest_risk_label_prob_day_3.grid(row=4, column=2, columnspan=1, sticky='nsew')
+        elif day == 'd4-8':
+            if outlooks is None:
+                load_frame(day, [('d4-8', d48_day) for d48_day in range(4, 9)])
+                return
+
+            highest_risk_level_d48_day_4 = summarize_outlook(outlooks['d4-8', 4])['highest_risk']
+            highest_risk_level_d48_day_5 = summarize_outlook(outlooks['d4-8', 5])['highest_risk']
+            highest_risk_level_d48_day_6 = summarize_outlook(outlooks['d4-8', 6])['highest_risk']
+            highest_risk_level_d48_day_7 = summarize_outlook(outlooks['d4-8', 7])['highest_risk']
+            highest_risk_level_d48_day_8 = summarize_outlook(outlooks['d4-8', 8])['highest_risk']
+
+            side_bar()
+
+            # Day 4-8 Button
+            D48_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 4-8', width=200, corner_radius=12,
+                                            fg_color='transparent',
+                                            font=Description_Font, command=lambda: frame_change('d4-8'),
+                                            state='disabled', image=lightning_icon)
+            D48_Side_Button.grid(row=5, column=0, columnspan=1, padx=5, pady=10)
+
+            # Close Button
+            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
+                                         command=close_program)
+            Close_Button.grid(row=1, column=3, padx=15, pady=15, sticky='e')
+
+            # Hide_Button
+            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
+                                        command=hide_to_system_tray)
+            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+
+            # Day 4-8 Heading Label
+            D48_Label = ctk.CTkLabel(main_frame, text='Day 4-8 Outlooks', font=Title_Font)
+            D48_Label.grid(row=2, column=1, columnspan=2, padx=400, pady=50, sticky='nsew')
+
+            # Day 4 Button
+            D4_Cat_Button = ctk.CTkButton(main_frame, text='Day 4 Outlook', font=('karla', 28),
+                                          height=50, command=lambda: button_run('d4-8', 4))
+            D4_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+
+            # Day 4 Probabilistic Risk Label
+            highest_risk_label_d48_day_4 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_4}',
+                                                        font=('karla', 25))
+            highest_risk_label_d48_day_4.grid(row=3, column=2, columnspan=1, sticky='nsew')
+
+            # Day 5 Button
+            D5_Cat_Button = ctk.CTkButton(main_frame, text='Day 5 Outlook', font=('karla', 28),
+                                          width=150, height=50, command=lambda: button_run('d4-8', 5))
+            D5_Cat_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+
+            # Day 5 Probabilistic Risk Label
+            highest_risk_label_d48_day_5 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_5}',
+                                                        font=('karla', 25))
+            highest_risk_label_d48_day_5.grid(row=4, column=2, columnspan=1, sticky='nsew')
+
+            # Day 6 Button
+            D6_Cat_Button = ctk.CTkButton(main_frame, text='Day 6 Outlook', font=('karla', 28),
+                                          width=150, height=50, command=lambda: button_run('d4-8', 6))
+            D6_Cat_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+
+            # Day 6 Probabilistic Risk Label
+            highest_risk_label_d48_day_6 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_6}',
+                                                        font=('karla', 25))
+            highest_risk_label_d48_day_6.grid(row=5, column=2, columnspan=1, sticky='nsew')
+
+            # Day 7 Button
+            D7_Cat_Button = ctk.CTkButton(main_frame, text='Day 7 Outlook', font=('karla', 28),
+                                          width=150, height=50, command=lambda: button_run('d4-8', 7))
+            D7_Cat_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+
+            # Day 7 Probabilistic Risk Label
+            highest_risk_label_d48_day_7 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_7}',
+                                                        font=('karla', 25))
+            highest_risk_label_d48_day_7.grid(row=6, column=2, columnspan=1, sticky='nsew')
+
+            # Day 8 Button
+            D8_Cat_Button = ctk.CTkButton(main_frame, text='Day 8 Outlook', font=('karla', 28),
+                                          width=150, height=50, command=lambda: button_run('d4-8', 8))
+            D8_Cat_Button.grid(row=7, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+
+            # Day 8 Probabilistic Risk Label
+            highest_risk_label_d48_day_8 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_8}',
+                                                        font=('karla', 25))
+            highest_risk_label_d48_day_8.grid(row=7, column=2, columnspan=1, sticky='nsew')
+
+            # Day 4-8 Strip Button
+            D48_Strip_Button = ctk.CTkButton(main_frame, text='Days 4-8 Together', font=('karla', 28),
+                                             width=150, height=50, command=button_run_d48_strip)
+            D48_Strip_Button.grid(row=8, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+        elif day == 'test':
+            # Close Button
+            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
+                                         command=close_program)
+            Close_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+
+            # Hide_Button
+            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
+                                        command=hide_to_system_tray)
+            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+
+            # Heading Label
+            Test_Label = ctk.CTkLabel(main_frame, text='Outlook Tests', font=Title_Font)
+            Test_Label.grid(row=2, column=1, columnspan=1, padx=450, pady=50, sticky='nsew')
+
+            # Test Categorial Button
+            Test_Button = ctk.CTkButton(main_frame, text='(Test) March 31st, 2023', width=300,
+                                        font=Description_Font, command=lambda: button_run('cat', 'test'))
+            Test_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Test Tornado Button
+            Test_Tor_Button = ctk.CTkButton(main_frame, text='(Test) March 17th, 2021', width=300,
+                                            font=Description_Font, command=lambda: button_run('tor', 'test'))
+            Test_Tor_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Test Wind Button
+            Test_Wind_Button = ctk.CTkButton(main_frame, text='(Test) March 25th, 2021', width=300,
+                                             font=Description_Font, command=lambda: button_run('wind', 'test'))
+            Test_Wind_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+
+            # Test Hail Button
+            Test_Hail_Button = ctk.CTkButton(main_frame, text='(Test) May 26th, 2021', width=300,
+                                             font=Description_Font, command=lambda: button_run('hail', 'test'))
+            Test_Hail_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+        else:
+            log.error('Invalid Button. Day = ' + str(day) + 'Error on line 1798')
+            popup('error', 'Invalid Button', "An error has occured where the button isn't programmed correctly. The program will now quit.")
+            sys.exit(0)
+
+    def frame_change(day, outlooks=None):  # skipcq: PTC-W0065
+        """
+        This function changes the frame of the GUI based on the provided day.
+
+        It cancels any outlooks still loading for the old frame, destroys all the widgets in the main frame
+        and then calls the frames function to recreate the frame for the specified day.
+
+        Parameters:
+            day (int): The day for which the frame needs to be changed.
+            outlooks (dict): The fetched outlooks for the frame, if they have already been loaded.
+
+        Returns:
+            None
+        """
+        cancel_job('frame')
+        cancel_job('outlook')
+
+        for widget in main_frame.winfo_children():
+            widget.destroy()
+
+        frames(day, outlooks)
+
+    def button_run(outlook_type, day):  # skipcq: PTC-W0065
+        """
+        Handles the button press event for running a specific outlook type for a given day.
+
+        Parameters:
+            type (str): The type of outlook to be run.
+            day (int): The day for which the outlook needs to be run.
+
+        Returns:
+            None
+        """
+        log.info('GUI - ' + outlook_type + str(day) + ' button has been pressed.')
+        frame_day = day if day in (1, 2, 3, 'test') else 'd4-8'
+        show_loading('Loading Outlook...', lambda: frame_change(frame_day))
+        run(outlook_type, day, window, instance, on_error=lambda error: frame_change(frame_day),
+            on_close=lambda: frame_change(frame_day))
+
+    def button_run_d48_strip():  # skipcq: PTC-W0065
+        """
+        Handles the button press event for showing Days 4 through 8 together.
 
+        Parameters:
+            None
 
-# Start the GUI
-def start_gui():  # skipcq: PY-R1000
-    """
-    This function initializes and runs the graphical user interface (GUI) for the Severe Weather Outlook Display program.
-    It creates the main window, sets up the layout, and defines the behavior for various buttons and events.
-    The function does not take any parameters and does not return any values.
-    """
-    # Initialize a window
-    log.info('GUI - Initializing window')
-    window = ctk.CTkToplevel()
-    window.geometry('1700x900+50+50')
-    window.title('Severe Weather Outlook Display')
+        Returns:
+            None
+        """
+        log.info('GUI - Day 4-8 strip button has been pressed.')
+        show_loading('Loading Outlooks...', lambda: frame_change('d4-8'))
+        run_d48_strip(window, on_error=lambda error: frame_change('d4-8'), on_close=lambda: frame_change('d4-8'))
 
-    # Configure Layout
-    window.grid_rowconfigure(0, weight=1)
-    window.grid_columnconfigure(2, weight=1)
+    def hide_to_system_tray():  # skipcq: PTC-W0065
+        """
+        Hides the application window to the system tray.
 
-    # Fonts
-    Title_Font = ctk.CTkFont(family='Montserrat', size=50, weight='bold')
-    Description_Font = ctk.CTkFont(family='karla', size=21)
+        Parameters:
+            None
 
-    # Frames
-    sidebar_frame = ctk.CTkFrame(window, height=550, fg_color='#103157')
-    sidebar_frame.grid(row=0, column=0, sticky='ns')
+        Returns:
+            None
+        """
+        import pystray  # Imported here as pystray needs a desktop session to load
 
-    main_frame = ctk.CTkFrame(window)
-    main_frame.grid(row=0, column=1, columnspan=2, sticky='nsew')
+        window.withdraw()
+        image = Image.open('My_project.png')
+        menu = (pystray.MenuItem("Show", show_from_system_tray),
+                pystray.MenuItem("Exit", close_program))
+        global logo_icon_tray  # skipcq: PYL-W0601
+        logo_icon_tray = pystray.Icon("name", image, "My System Tray Icon", menu)
+        logo_icon_tray.run()
 
-    def side_bar():
+    def close_program():
         """
-        Initializes the sidebar buttons for the GUI.
+        Closes the program after prompting the user for confirmation.
 
-        Creates and configures the following buttons:
-        - Logo Button: Displays the logo image and is disabled.
-        - Home Button: Changes the frame to the home frame when clicked.
-        - Day 1 Button: Changes the frame to the frame corresponding to day 1 when clicked.
-        - Day 2 Button: Changes the frame to the frame corresponding to day 2 when clicked.
-        - Day 3 Button: Changes the frame to the frame corresponding to day 3 when clicked.
-        - Day 4-8 Button: Changes the frame to the frame corresponding to days 4-8 when clicked.
+        This function displays a popup asking the user if they want to close the program.
+        If the user responds with 'yes', it stops the system tray icon, withdraws the main window, and exits the program.
 
         Parameters:
             None
@@ -1160,786 +3608,1295 @@ def start_gui():  # skipcq: PY-R1000
         Returns:
             None
         """
-        # Logo
-        logo_Button = ctk.CTkButton(sidebar_frame, text='', width=200, height=250, corner_radius=10, fg_color='transparent',
-                                    state='disabled', image=logo_icon, compound='top')
-        logo_Button.grid(row=0, column=0, columnspan=1, padx=5, pady=10)
+        log.info('GUI - Now Closing Program')
+        popup('question',
+              'Close Program?',
+              'Are you sure you want to close the program? You will not receive notifications for new outlooks when the program is closed. Use "Hide" instead to hide the program and still receive new outlook notifications!')  # skipcq: FLK-E501
+        if question == 'yes':
+            if 'icon' in globals() and logo_icon_tray is not None:
+                logo_icon_tray.stop()
+            window.withdraw()
+            os._exit(0)
+        else:
+            return
 
-        # Home Button
-        Home_Side_Button = ctk.CTkButton(sidebar_frame, text='Home', width=200, corner_radius=10, fg_color='transparent',
-                                         font=('karla', 26), command=lambda: frame_change('home'),
-                                         hover_color='#2191aa', image=home_icon, compound='top')
-        Home_Side_Button.grid(row=1, column=0, columnspan=1, padx=5, pady=10)
+    def show_from_system_tray(logo_icon_tray_1, item):  # skipcq: PYL-W0613  # skipcq: PTC-W0065
+        """
+        Shows the application window from the system tray.
 
-        # Day 1 Button
-        D1_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 1', width=200, corner_radius=12, fg_color='transparent',
-                                       font=('karla', 26), command=lambda: frame_change(1),
-                                       hover_color='#2191aa', image=tornado_icon)
-        D1_Side_Button.grid(row=2, column=0, columnspan=1, padx=5, pady=10)
+        Parameters:
+            icon: The system tray icon object.
+            item: The item that triggered this function call.
 
-        # Day 2 Button
-        D2_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 2', width=200, corner_radius=12, fg_color='transparent',
-                                       font=('karla', 26), command=lambda: frame_change(2),
-                                       hover_color='#2191aa', image=tornado_icon)
-        D2_Side_Button.grid(row=3, column=0, columnspan=1, padx=5, pady=10)
+        Returns:
+            None
+        """
+        logo_icon_tray_1.stop()
+        window.deiconify()
 
-        # Day 3 Button
-        D3_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 3', width=200, corner_radius=12, fg_color='transparent',
-                                       font=('karla', 26), command=lambda: frame_change(3),
-                                       hover_color='#2191aa', image=lightning_icon)
-        D3_Side_Button.grid(row=4, column=0, columnspan=1, padx=5, pady=10)
+    window.protocol("WM_DELETE_WINDOW", close_program)
 
-        # Day 4-8 Button
-        D48_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 4-8', width=200, corner_radius=12, fg_color='transparent',
-                                        font=Description_Font, command=lambda: frame_change('d4-8'),
-                                        hover_color='#2191aa', image=lightning_icon)
-        D48_Side_Button.grid(row=5, column=0, columnspan=1, padx=5, pady=10)
+    side_bar()
+    frames('home')
 
-    risk_level_mapping_cat = {
-        'TSTM': 1,  # Thunderstorm
-        'MRGL': 2,  # Marginal
-        'SLGT': 3,  # Slight
-        'ENH': 4,   # Enhanced
-        'MDT': 5,   # Moderate
-        'HIGH': 6   # High
-    }
+    log.info('GUI - Created widgets')
 
-    risk_level_mapping_tor = {
-        '0.02': 1,
-        '0.05': 2,
-        '0.10': 3,
-        '0.15': 4,
-        '0.30': 5,
-        '0.45': 6,
-        '0.60': 7
-    }
+    # Run the Window
+    log.info('GUI - Running window')
+    window.mainloop()
 
-    risk_level_mapping_prob = {
-        '0.05': 1,
-        '0.15': 2,
-        '0.30': 3,
-        '0.45': 4,
-        '0.60': 5,
-    }
 
-    risk_level_mapping_d48 = {
-        '0.15': 1,
-        '0.30': 2
-    }
+# Function to Run the Program
+def run(outlook_type, day, window, instance_run, on_error=None, on_close=None):
+    """
+    Runs the severe weather outlook program for a specified outlook type and day.
 
-    def determine_highest_risk_level_cat(outlook_data):
-        """
-        Determines the highest risk level category from the given outlook data.
+    This function logs the start of the program, then fetches the outlook data, checks its availability
+    and saves it on a background job so the window keeps responding. The outlook is shown in the outlook
+    viewer once the job finishes, and closing the viewer brings the window back. If the outlook data is not
+    available, it displays a warning message. It also checks if the outlook type is valid and exits the
+    program if it's not.
+
+    Parameters:
+        outlook_type (str): The type of severe weather outlook (e.g., 'cat', 'tor', 'wind', etc.).
+        day (int): The day of the outlook (e.g., 1, 2, 3, etc.).
+        window: The GUI window object.
+        on_error (function): Called on the Tk thread if the outlook fails to load or is not available.
+        on_close (function): Called on the Tk thread after the outlook viewer is closed.
+
+    Returns:
+        None
+    """
+    log.info('Running outlook' + outlook_type + 'day' + str(day))
 
-        Args:
-            outlook_data (dict): A dictionary containing the outlook data with 'features' key.
+    if outlook_type not in outlook_fetch_functions:
+        log.error('Invalid Outlook Type. Outlook Type = ' + outlook_type)
+        popup('error', 'Invalid Outlook Type', "An error has occurred where the outlook type wasn't read correctly. The program will now quit.")
+        sys.exit(0)
+
+    def load_outlook():
+        """
+        Gets the outlook from the session store, fetching it if needed, and saves its image to the output
+        directory. Runs on a background thread.
 
         Returns:
-            str: The highest risk level category, or 'None' if no risk level is found.
-        """
-        highest_risk_level = 0
-        for feature in outlook_data['features']:
-            risk_level_label = feature['properties'].get('LABEL')
-            if risk_level_label:
-                risk_level = risk_level_mapping_cat.get(risk_level_label)
-                if risk_level is not None and (highest_risk_level is None or risk_level > highest_risk_level):
-                    highest_risk_level = risk_level
-        if highest_risk_level == 0:
-            highest_risk_level = 'None'
-        elif highest_risk_level == 1:
-            highest_risk_level = 'Thunderstorm'
-        elif highest_risk_level == 2:
-            highest_risk_level = 'Marginal'
-        elif highest_risk_level == 3:
-            highest_risk_level = 'Slight'
-        elif highest_risk_level == 4:
-            highest_risk_level = 'Enhanced'
-        elif highest_risk_level == 5:
-            highest_risk_level = 'Moderate'
-        elif highest_risk_level == 6:
-            highest_risk_level = 'High'
-        return highest_risk_level
-
-    def determine_highest_risk_level_tor(outlook_data):
-        """
-        Determines the highest risk level for tornadoes from the given outlook data.
-
-        Args:
-            outlook_data (dict): The outlook data containing the features.
+            Outlook: The parsed outlook, or None if no outlook is available.
+        """
+        outlook_data = get_outlook(outlook_type, day)
+        if not check_outlook_availability(outlook_data):
+            return None
+        render_outlook(outlook_type, day, outlook_data)
+        return outlook_data
+
+    def return_to_window():
+        """
+        Brings the window back after the outlook viewer is closed.
 
         Returns:
-            str: The highest risk level for tornadoes as a string, or 'None' if no risk level is found.
-        """
-        highest_tor_risk_level = 0
-        for feature in outlook_data['features']:
-            tor_risk_level_label = feature['properties'].get('LABEL')
-            if tor_risk_level_label:
-                risk_level = risk_level_mapping_tor.get(tor_risk_level_label)
-                if risk_level is not None and (highest_tor_risk_level is None or risk_level > highest_tor_risk_level):
-                    highest_tor_risk_level = risk_level
-        if highest_tor_risk_level == 0:
-            highest_tor_risk_level = 'None'
-        elif highest_tor_risk_level == 1:
-            highest_tor_risk_level = '2%'
-        elif highest_tor_risk_level == 2:
-            highest_tor_risk_level = '5%'
-        elif highest_tor_risk_level == 3:
-            highest_tor_risk_level = '10%'
-        elif highest_tor_risk_level == 4:
-            highest_tor_risk_level = '15%'
-        elif highest_tor_risk_level == 5:
-            highest_tor_risk_level = '30%'
-        elif highest_tor_risk_level == 6:
-            highest_tor_risk_level = '45%'
-        elif highest_tor_risk_level == 7:
-            highest_tor_risk_level = '60%'
-        return highest_tor_risk_level
-
-    def determine_highest_risk_level_wind(outlook_data):
-        """
-        Determines the highest wind risk level from the given outlook data.
-
-        Args:
-            outlook_data (dict): A dictionary containing the outlook data with 'features' key.
+            None
+        """
+        window.deiconify()
+        if on_close is not None:
+            on_close()
+
+    def show_loaded_outlook(outlook_data):
+        """
+        Shows the outlook in the outlook viewer, or a warning if there is no outlook. Runs on the Tk thread.
+
+        Parameters:
+            outlook_data (Outlook): The parsed outlook, or None if no outlook is available.
 
         Returns:
-            str: The highest wind risk level category, or 'None' if no risk level is found.
-        """
-        highest_wind_risk_level = 0
-        for feature in outlook_data['features']:
-            wind_risk_level_label = feature['properties'].get('LABEL')
-            if wind_risk_level_label:
-                risk_level = risk_level_mapping_prob.get(wind_risk_level_label)
-                if risk_level is not None and (highest_wind_risk_level is None or risk_level > highest_wind_risk_level):
-                    highest_wind_risk_level = risk_level
-        if highest_wind_risk_level == 0:
-            highest_wind_risk_level = 'None'
-        elif highest_wind_risk_level == 1:
-            highest_wind_risk_level = '5%'
-        elif highest_wind_risk_level == 2:
-            highest_wind_risk_level = '15%'
-        elif highest_wind_risk_level == 3:
-            highest_wind_risk_level = '30%'
-        elif highest_wind_risk_level == 4:
-            highest_wind_risk_level = '45%'
-        elif highest_wind_risk_level == 5:
-            highest_wind_risk_level = '60%'
-        return highest_wind_risk_level
-
-    def determine_highest_risk_level_hail(outlook_data):
-        """
-        Determines the highest risk level for hail from the given outlook data.
-
-        Args:
-            outlook_data (dict): The outlook data containing the features.
+            None
+        """
+        if outlook_data is None:
+            popup('warning', 'No Outlook Available', f'There is no {outlook_type} outlook available for day {day}.')
+            if on_error is not None:
+                on_error(None)
+            return
+
+        if instance_run == 0:
+            popup('info', 'Program is Running',
+                  'The Severe Weather Outlook Display is now running. The program may take some time to load so be patient. Click "Ok" or Close the Window to Continue')  # skipcq: FLK-E501
+
+        window.withdraw()
+        show_outlook(outlook_type, day, outlook_data, on_close=return_to_window)
+
+    submit_job('outlook', load_outlook, on_done=show_loaded_outlook, on_error=on_error)
+
+
+# Function to show the Day 4-8 strip
+def run_d48_strip(window, on_error=None, on_close=None):
+    """
+    Fetches Days 4 through 8 at the same time, draws them as one strip and shows it in the outlook viewer.
+
+    Parameters:
+        window: The GUI window object.
+        on_error (function): Called on the Tk thread if the outlooks fail to load.
+        on_close (function): Called on the Tk thread after the outlook viewer is closed.
+
+    Returns:
+        None
+    """
+    log.info('Running the Day 4-8 strip')
+
+    def load_strip():
+        """
+        Gets the five outlooks from the session store, fetching them together if needed, and saves the strip
+        to the output directory. Runs on a background thread.
 
         Returns:
-            str: The highest risk level for hail as a string, or 'None' if no risk level is found.
-        """
-        highest_hail_risk_level = 0
-        for feature in outlook_data['features']:
-            hail_risk_level_label = feature['properties'].get('LABEL')
-            if hail_risk_level_label:
-                risk_level = risk_level_mapping_prob.get(hail_risk_level_label)
-                if risk_level is not None and (highest_hail_risk_level is None or risk_level > highest_hail_risk_level):
-                    highest_hail_risk_level = risk_level
-        if highest_hail_risk_level == 0:
-            highest_hail_risk_level = 'None'
-        elif highest_hail_risk_level == 1:
-            highest_hail_risk_level = '5%'
-        elif highest_hail_risk_level == 2:
-            highest_hail_risk_level = '15%'
-        elif highest_hail_risk_level == 3:
-            highest_hail_risk_level = '30%'
-        elif highest_hail_risk_level == 4:
-            highest_hail_risk_level = '45%'
-        elif highest_hail_risk_level == 5:
-            highest_hail_risk_level = '60%'
-        return highest_hail_risk_level
-
-    def determine_highest_risk_level_prob(outlook_data):
-        """
-        Determines the highest risk level for probability from the given outlook data.
-
-        Args:
-            outlook_data (dict): The outlook data containing the features.
+            dict: The parsed outlook for each ('d4-8', day) pair.
+        """
+        outlooks = fetch_outlooks([('d4-8', day) for day in outlook_days['d4-8']])
+        render_d48_strip(outlooks)
+        return outlooks
+
+    def return_to_window():
+        """
+        Brings the window back after the outlook viewer is closed.
 
         Returns:
-            str: The highest risk level for probability as a string, or 'None' if no risk level is found.
-
-        Raises:
-            None.
-        """
-        highest_prob_risk_level = 0
-        for feature in outlook_data['features']:
-            prob_risk_level_label = feature['properties'].get('LABEL')
-            if prob_risk_level_label:
-                risk_level = risk_level_mapping_prob.get(prob_risk_level_label)
-                if risk_level is not None and (highest_prob_risk_level is None or risk_level > highest_prob_risk_level):
-                    highest_prob_risk_level = risk_level
-        if highest_prob_risk_level == 0:
-            highest_prob_risk_level = 'None'
-        elif highest_prob_risk_level == 1:
-            highest_prob_risk_level = '5%'
-        elif highest_prob_risk_level == 2:
-            highest_prob_risk_level = '15%'
-        elif highest_prob_risk_level == 3:
-            highest_prob_risk_level = '30%'
-        elif highest_prob_risk_level == 4:
-            highest_prob_risk_level = '45%'
-        elif highest_prob_risk_level == 1:
-            highest_prob_risk_level = '60%'
-        return highest_prob_risk_level
-
-    def determine_highest_risk_level_d48(outlook_data):
-        """
-        Determines the highest risk level for day 4-8 from the given outlook data.
-
-        Args:
-            outlook_data (dict): The outlook data containing the features.
+            None
+        """
+        window.deiconify()
+        if on_close is not None:
+            on_close()
+
+    def show_loaded_strip(outlooks):
+        """
+        Shows the strip in the outlook viewer. Runs on the Tk thread.
+
+        Parameters:
+            outlooks (dict): The parsed outlook for each ('d4-8', day) pair.
 
         Returns:
-            str: The highest risk level for day 4-8 as a string, or 'None' if no risk level is found.
-
-        Raises:
-            None.
-        """
-        highest_d48_risk_level = 0
-        for feature in outlook_data['features']:
-            d48_risk_level_label = feature['properties'].get('LABEL')
-            if d48_risk_level_label:
-                risk_level = risk_level_mapping_d48.get(d48_risk_level_label)
-                if risk_level is not None and (highest_d48_risk_level is None or risk_level > highest_d48_risk_level):
-                    highest_d48_risk_level = risk_level
-        if highest_d48_risk_level == 0:
-            highest_d48_risk_level = 'None'
-        elif highest_d48_risk_level == 1:
-            highest_d48_risk_level = '15%'
-        elif highest_d48_risk_level == 2:
-            highest_d48_risk_level = '30%'
-        return highest_d48_risk_level
-
-    def frames(day):
+            None
         """
-        This function handles the frames for different days of the week. It takes a day parameter and
-        based on that, it creates the corresponding frame with the required buttons and labels.
+        window.withdraw()
+        show_d48_strip(outlooks, on_close=return_to_window)
+
+    submit_job('outlook', load_strip, on_done=show_loaded_strip, on_error=on_error)
+
+
+# Function to read a product from the command line
+def parse_product(product):
+    """
+    Reads an outlook product written as type:day, e.g. 'cat:1', 'd4-8:5' or 'tor:test'.
+
+    Parameters:
+        product (str): The product as written on the command line.
+
+    Returns:
+        tuple: The (outlook_type, day) pair.
+
+    Raises:
+        argparse.ArgumentTypeError: If the product is not a valid outlook type and day.
+    """
+    outlook_type, _, day = product.partition(':')
+    if day != 'test':
+        day = int(day) if day.isdigit() else None
+    valid_days = outlook_days.get(outlook_type, ())
+    if 1 in valid_days:
+        valid_days += ('test',)  # The Day 1 outlooks also have an archived test outlook
+    if day not in valid_days:
+        raise argparse.ArgumentTypeError(f"'{product}' is not an outlook product. Use type:day, e.g. cat:1, prob:3 or d4-8:5")
+    return outlook_type, day
+
+
+# Function to list every current outlook product
+def all_products():
+    """
+    Lists every current outlook product: Day 1-2 cat/tor/wind/hail, Day 3 cat/prob and Days 4-8.
+
+    Parameters:
+        None
+
+    Returns:
+        list: The (outlook_type, day) pairs of every product.
+    """
+    return [(outlook_type, day) for outlook_type, days in outlook_days.items() for day in days]
+
+
+# Function to set up a render worker process
+def init_render_worker(output_directory, offline):
+    """
+    Sets up a render worker process and loads the base map, so every render it does starts warm.
+
+    Parameters:
+        output_directory (str): Where rendered outlooks are saved.
+        offline (bool): Whether the worker may use the network.
+
+    Returns:
+        None
+    """
+    global output_directory_path, offline_mode  # skipcq: PYL-W0603
+    output_directory_path = output_directory
+    offline_mode = offline
+    matplotlib.use('Agg')
+    preload_base_map()
+
+
+# Function to render an outlook and time it
+def render_outlook_timed(outlook_type, day, outlook_data):
+    """
+    Renders an outlook to the output directory and measures how long it took.
+
+    Parameters:
+        outlook_type (str): The type of outlook to draw.
+        day (int or str): The day of the outlook.
+        outlook_data (Outlook): The parsed outlook to draw.
+
+    Returns:
+        float: The render time in seconds.
+    """
+    start_time = time.perf_counter()
+    render_outlook(outlook_type, day, outlook_data)
+    return time.perf_counter() - start_time
+
+
+# Function to render outlooks without the GUI
+def render_products(products, processes=1):
+    """
+    Fetches outlooks in parallel and renders each one straight to PNG, without the GUI.
+
+    With more than one process the renders are spread over a process pool whose workers keep the
+    base map loaded between renders. A product that fails to download or draw is logged and skipped
+    so the rest are still rendered.
+
+    Parameters:
+        products (list): The (outlook_type, day) pairs to render.
+        processes (int): The number of render processes. 1 renders in this process, None uses one per CPU core.
+
+    Returns:
+        dict: The saved image path for each product, or None if it has no outlook. Products that failed are left out.
+    """
+    log.info('Rendering ' + str(len(products)) + ' outlooks without the GUI')
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(fetch_max_workers, len(products))),
+                                               thread_name_prefix='fetch') as executor:
+        futures = {product: executor.submit(outlook_fetch_functions[product[0]], product[1]) for product in products}
+
+    rendered = {}
+    outlooks = {}
+    for (outlook_type, day), future in futures.items():
+        try:
+            outlook_data = future.result()
+        except Exception:  # skipcq: PYL-W0703
+            log.error(f'Could not fetch the {outlook_type} outlook for day {day}', exc_info=True)  # skipcq: PYL-W1203
+            continue
+        if check_outlook_availability(outlook_data):
+            outlooks[outlook_type, day] = outlook_data
+        else:
+            log.info(f'There is no {outlook_type} outlook available for day {day}')  # skipcq: PYL-W1203
+            rendered[outlook_type, day] = None
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(outlooks))
+    start_time = time.perf_counter()
+    if processes > 1:
+        try:
+            preload_base_map()  # Draw the base map once here so the workers only have to load it
+        except Exception:  # skipcq: PYL-W0703
+            log.warning('Could not draw the base map before starting the render workers', exc_info=True)
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=init_render_worker,
+                                                          initargs=(output_directory_path, offline_mode))
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='render')
+    with executor:
+        futures = {product: executor.submit(render_outlook_timed, product[0], product[1], outlook_data)
+                   for product, outlook_data in outlooks.items()}
+
+    for (outlook_type, day), future in futures.items():
+        try:
+            render_time = future.result()
+        except Exception:  # skipcq: PYL-W0703
+            log.error(f'Could not render the {outlook_type} outlook for day {day}', exc_info=True)  # skipcq: PYL-W1203
+            continue
+        rendered[outlook_type, day] = outlook_output_path(outlook_type, day)
+        log.info(f'Rendered the {outlook_type} outlook for day {day} in {render_time:.2f}s to {rendered[outlook_type, day]}')  # skipcq: PYL-W1203
+    log.info(f'Rendered {len(futures)} outlooks in {time.perf_counter() - start_time:.2f}s '  # skipcq: PYL-W1203
+             f'using {max(processes, 1)} process(es)')
+    return rendered
+
+
+# Outlook Archive
+# Name SPC uses for each outlook type in the archive file names
+archive_products = {
+    'cat': 'cat',
+    'tor': 'torn',
+    'wind': 'wind',
+    'hail': 'hail',
+    'prob': 'prob'
+}
+
+# UTC times each outlook day has been issued at. Some only happen in daylight or standard time, so a missing one is normal
+archive_issue_times = {
+    1: ('0100', '1200', '1300', '1630', '2000'),
+    2: ('0600', '0700', '1730'),
+    3: ('0730', '0830', '1930')
+}
+
+archive_rate_lock = threading.Lock()
+archive_next_request = 0.0  # time.monotonic() value when the next archive request may start
+
+
+# Function to list the archive issuances in a date range
+def archive_issuances(start_date, end_date, outlook_types=None):
+    """
+    Lists every archive issuance that could exist between two dates, skipping times that have not happened yet.
+
+    Parameters:
+        start_date (datetime.date): The first date to list.
+        end_date (datetime.date): The last date to list.
+        outlook_types (list): The outlook types to list, or None for every archived type.
+
+    Returns:
+        list: An (outlook_type, day, date, issue_time) tuple for each issuance, with the date as 'YYYYMMDD' and the time as 'HHMM'.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%d%H%M')
+    issuances = []
+    for offset in range((end_date - start_date).days + 1):
+        date = (start_date + datetime.timedelta(days=offset)).strftime('%Y%m%d')
+        for outlook_type in outlook_types or archive_products:
+            for day in outlook_days[outlook_type]:
+                issuances.extend((outlook_type, day, date, issue_time) for issue_time in archive_issue_times[day]
+                                 if date + issue_time <= now)
+    return issuances
+
+
+# Function to name an archive issuance in the progress file
+def archive_key(outlook_type, day, date, issue_time):
+    """
+    Gets the key an archive issuance is recorded under in the progress file.
 
-        Parameters:
-        day (str or int): The day of the week. It can be 'home', 1, 2, 3, 'd4-8', or 'test'.
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int): The day of the outlook.
+        date (str): The issue date as 'YYYYMMDD'.
+        issue_time (str): The issue time as 'HHMM'.
 
-        Returns:
-        None
-        """
-        if day == 'home':
-            side_bar()
+    Returns:
+        str: The key, e.g. 'cat/day1/20230331_1630'.
+    """
+    return outlook_type + '/day' + str(day) + '/' + date + '_' + issue_time
 
-            # Home Button
-            Home_Side_Button = ctk.CTkButton(sidebar_frame, text='Home', width=200, corner_radius=10,
-                                             fg_color='transparent',
-                                             font=('karla', 26), command=lambda: frame_change('home'),
-                                             state='disabled', image=home_icon, compound='top')
-            Home_Side_Button.grid(row=1, column=0, columnspan=1, padx=5, pady=10)
 
-            # Close Button
-            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
-                                         command=close_program)
-            Close_Button.place(x=1285, y=15)
+# Function to get the path of an archive month
+def archive_month_path(outlook_type, month):
+    """
+    Gets the path of the GeoParquet file holding one month of an outlook type.
 
-            # Hide Button
-            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
-                                        command=hide_to_system_tray)
-            Hide_Button.place(x=1075, y=15)
+    Parameters:
+        outlook_type (str): The type of outlook.
+        month (str): The month as 'YYYY-MM'.
 
-            # Title Label
-            Title_Label = ctk.CTkLabel(main_frame, text='Severe Weather Outlook Display',
-                                       font=('Montserrat', 72, 'bold'), width=1200)
-            Title_Label.place(x=150, y=350)
+    Returns:
+        str: The path of the file.
+    """
+    return os.path.join(archive_directory, outlook_type, month + '.parquet')
 
-            # Welcome Label
-            Welcome_Label = ctk.CTkLabel(main_frame,
-                                         text='Welcome to the Severe Weather Outlook Display! Press a button below to find a outlook to dispaly.',
-                                         font=('karla', 25))
-            Welcome_Label.place(x=200, y=450)
-        elif day == 1:
-            outlook_data_cat_day_1 = fetch_cat_outlooks(1)
-            highest_risk_level_cat_day_1 = determine_highest_risk_level_cat(outlook_data_cat_day_1)
 
-            outlook_data_tor_day_1 = fetch_tor_outlooks(1)
-            highest_risk_level_tor_day_1 = determine_highest_risk_level_tor(outlook_data_tor_day_1)
+# Function to read the backfill progress
+def read_archive_progress():
+    """
+    Reads which archive issuances have already been backfilled.
 
-            outlook_data_wind_day_1 = fetch_wind_outlooks(1)
-            highest_risk_level_wind_day_1 = determine_highest_risk_level_wind(outlook_data_wind_day_1)
+    Parameters:
+        None
 
-            outlook_data_hail_day_1 = fetch_hail_outlooks(1)
-            highest_risk_level_hail_day_1 = determine_highest_risk_level_hail(outlook_data_hail_day_1)
+    Returns:
+        dict: 'stored', 'empty' or 'missing' for each issuance key that is done.
+    """
+    try:
+        with open(os.path.join(archive_directory, 'progress.json'), 'r', encoding='utf-8') as progress_file:
+            return json.load(progress_file)
+    except (OSError, ValueError):
+        return {}
 
-            side_bar()
 
-            # Day 1 Button
-            D1_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 1', width=200, corner_radius=12, fg_color='transparent',
-                                           font=('karla', 26), command=lambda: frame_change(1),
-                                           state='disabled', image=tornado_icon)
-            D1_Side_Button.grid(row=2, column=0, columnspan=1, padx=5, pady=10)
+# Function to save the backfill progress
+def write_archive_progress(progress):
+    """
+    Saves which archive issuances have been backfilled, so an interrupted backfill can pick up where it stopped.
 
-            # Close Button
-            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
-                                         command=close_program)
-            Close_Button.grid(row=1, column=3, padx=20, pady=15, sticky='e')
+    Parameters:
+        progress (dict): The status of each issuance key that is done.
 
-            # Hide_Button
-            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
-                                        command=hide_to_system_tray)
-            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+    Returns:
+        None
+    """
+    os.makedirs(archive_directory, exist_ok=True)
+    progress_path = os.path.join(archive_directory, 'progress.json')
+    with open(progress_path + '.tmp', 'w', encoding='utf-8') as progress_file:
+        json.dump(progress, progress_file, sort_keys=True)
+    os.replace(progress_path + '.tmp', progress_path)
 
-            # Day 1 Heading Label
-            D1_Label = ctk.CTkLabel(main_frame, text='Day 1 Outlooks', font=Title_Font)
-            D1_Label.grid(row=2, column=1, columnspan=2, padx=435, pady=50, sticky='nsew')
 
-            # Day 1 Categorical Button
-            D1_Cat_Button = ctk.CTkButton(main_frame, text='Day 1 Categorical', width=150, height=50, font=('karla', 28),
-                                          command=lambda: button_run('cat', 1))
-            D1_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+# Function to space out archive requests
+def wait_for_archive_request():
+    """
+    Waits until another archive request may start, so no more than archive_requests_per_second are started each second.
 
-            # Day 1 Categorial Risk Label
-            highest_risk_label_cat_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_cat_day_1}',
-                                                        font=('karla', 25))
-            highest_risk_label_cat_day_1.grid(row=3, column=2, columnspan=1, sticky='nsew')
+    Parameters:
+        None
 
-            # Day 1 Tornado Button
-            D1_Tor_Button = ctk.CTkButton(main_frame, text='Day 1 Tornado', width=150, height=50, font=('karla', 28),
-                                          command=lambda: button_run('tor', 1))
-            D1_Tor_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Returns:
+        None
+    """
+    global archive_next_request  # skipcq: PYL-W0603
+    with archive_rate_lock:
+        now = time.monotonic()
+        start = max(now, archive_next_request)
+        archive_next_request = start + 1 / archive_requests_per_second
+    time.sleep(start - now)
 
-            # Day 1 Tornado Risk Label
-            highest_risk_label_tor_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_tor_day_1}',
-                                                        font=('karla', 25))
-            highest_risk_label_tor_day_1.grid(row=4, column=2, columnspan=1, sticky='nsew')
 
-            # Day 1 Wind Outlook
-            D1_Wind_Button = ctk.CTkButton(main_frame, text='Day 1 Wind', width=150, height=50, font=('karla', 28),
-                                           command=lambda: button_run('wind', 1))
-            D1_Wind_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+# Function to download an archived outlook
+def download_archive_outlook(outlook_type, day, date, issue_time):
+    """
+    Downloads and parses one archived outlook. Archived outlooks never change, so they skip the outlook cache.
 
-            # Day 1 Wind Risk Label
-            highest_risk_label_wind_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_wind_day_1}',
-                                                         font=('karla', 25))
-            highest_risk_label_wind_day_1.grid(row=5, column=2, columnspan=1, sticky='nsew')
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int): The day of the outlook.
+        date (str): The issue date as 'YYYYMMDD'.
+        issue_time (str): The issue time as 'HHMM'.
 
-            # Day 1 Hail Outlook
-            D1_Hail_Button = ctk.CTkButton(main_frame, text='Day 1 Hail', width=150, height=50, font=('karla', 28),
-                                           command=lambda: button_run('hail', 1))
-            D1_Hail_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Returns:
+        Outlook: The parsed outlook, or None if SPC has no outlook for that issuance.
 
-            # Day 1 Hail Risk Label
-            highest_risk_label_hail_day_1 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_hail_day_1}',
-                                                         font=('karla', 25))
-            highest_risk_label_hail_day_1.grid(row=6, column=2, columnspan=1, sticky='nsew')
-        elif day == 2:
-            outlook_data_cat_day_2 = fetch_cat_outlooks(2)
-            highest_risk_level_cat_day_2 = determine_highest_risk_level_cat(outlook_data_cat_day_2)
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+        ValueError: If the response is not a GeoJSON FeatureCollection.
+    """
+    url = archive_url.format(year=date[:4], day=day, date=date, time=issue_time, product=archive_products[outlook_type])
+    wait_for_archive_request()
+    with get_http_session().get(url, timeout=fetch_timeout, stream=True) as response:
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return Outlook(outlook_type, iter_geojson_features(response.iter_content(stream_chunk_size)))
 
-            outlook_data_tor_day_2 = fetch_tor_outlooks(2)
-            highest_risk_level_tor_day_2 = determine_highest_risk_level_tor(outlook_data_tor_day_2)
 
-            outlook_data_wind_day_2 = fetch_wind_outlooks(2)
-            highest_risk_level_wind_day_2 = determine_highest_risk_level_wind(outlook_data_wind_day_2)
+# Function to turn an outlook into archive rows
+def archive_rows(outlook_data, day, date, issue_time):
+    """
+    Turns each risk area of an outlook into a row for the archive.
 
-            outlook_data_hail_day_2 = fetch_hail_outlooks(2)
-            highest_risk_level_hail_day_2 = determine_highest_risk_level_hail(outlook_data_hail_day_2)
+    Parameters:
+        outlook_data (Outlook): The parsed outlook.
+        day (int): The day of the outlook.
+        date (str): The issue date as 'YYYYMMDD', used if the outlook has no ISSUE time.
+        issue_time (str): The issue time as 'HHMM', used if the outlook has no ISSUE time.
 
-            side_bar()
+    Returns:
+        list: A dict for each risk area with 'day', 'issue', 'valid', 'expire', 'label', 'rank' and 'geometry' keys.
+    """
+    rows = []
+    for feature in outlook_data.features:
+        if not feature.polygons:
+            continue
+        rows.append({
+            'day': day,
+            'issue': outlook_data.issue or date + issue_time,
+            'valid': outlook_data.valid,
+            'expire': outlook_data.expire,
+            'label': feature.label,
+            'rank': feature.rank,
+            'geometry': outlook_data.geometry(feature)
+        })
+    return rows
+
+
+# Function to add outlooks to an archive month
+def write_archive_month(outlook_type, month, rows):
+    """
+    Adds rows to the GeoParquet file for a month, replacing any rows already stored for the same issuances.
+    Rows are sorted by issue time, day and rank so readers can skip row groups by their statistics.
 
-            # Day 2 Button
-            D2_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 2', width=200, corner_radius=12,
-                                           fg_color='transparent',
-                                           font=('karla', 26), command=lambda: frame_change(2),
-                                           state='disabled', image=tornado_icon)
-            D2_Side_Button.grid(row=3, column=0, columnspan=1, padx=5, pady=10)
+    Parameters:
+        outlook_type (str): The type of outlook.
+        month (str): The month as 'YYYY-MM'.
+        rows (list): The rows from archive_rows.
 
-            # Close Button
-            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
-                                         command=close_program)
-            Close_Button.grid(row=1, column=3, padx=15, pady=15, sticky='e')
+    Returns:
+        None
+    """
+    frame = gpd.GeoDataFrame(rows, geometry='geometry', crs='EPSG:4326')
+    for column in ('issue', 'valid', 'expire'):
+        frame[column] = pd.to_datetime(frame[column], format='%Y%m%d%H%M', utc=True)
+    frame = frame.astype({'day': 'int8', 'rank': 'int8'})
 
-            # Hide_Button
-            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
-                                        command=hide_to_system_tray)
-            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+    month_path = archive_month_path(outlook_type, month)
+    if os.path.exists(month_path):
+        stored = gpd.read_parquet(month_path)
+        replaced = pd.MultiIndex.from_frame(stored[['day', 'issue']]).isin(pd.MultiIndex.from_frame(frame[['day', 'issue']]))
+        frame = pd.concat([stored[~replaced], frame], ignore_index=True)
+    frame = frame.sort_values(['issue', 'day', 'rank', 'label'], ignore_index=True)
 
-            # Day 2 Heading Label
-            D2_Label = ctk.CTkLabel(main_frame, text='Day 2 Outlooks', font=Title_Font)
-            D2_Label.grid(row=2, column=1, columnspan=2, padx=435, pady=50, sticky='nsew')
+    os.makedirs(os.path.dirname(month_path), exist_ok=True)
+    frame.to_parquet(month_path + '.tmp', index=False)
+    os.replace(month_path + '.tmp', month_path)
 
-            # Day 2 Categorical Button
-            D2_Cat_Button = ctk.CTkButton(main_frame, text='Day 2 Categorical', width=150, height=50, font=('karla', 28),
-                                          command=lambda: button_run('cat', 2))
-            D2_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
 
-            # Day 2 Categorial Risk Label
-            highest_risk_label_cat_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_cat_day_2}',
-                                                        font=('karla', 25))
-            highest_risk_label_cat_day_2.grid(row=3, column=2, columnspan=1, sticky='nsew')
+# Function to backfill the archive
+def backfill_archive(start_date, end_date, outlook_types=None):
+    """
+    Downloads the archived outlooks issued between two dates into the local archive. Issuances that are
+    already done are skipped, so running it again resumes an interrupted backfill.
 
-            # Day 2 Tornado Button
-            D2_Tor_Button = ctk.CTkButton(main_frame, text='Day 2 Tornado', width=150, height=50, font=('karla', 28),
-                                          command=lambda: button_run('tor', 2))
-            D2_Tor_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Parameters:
+        start_date (datetime.date): The first date to backfill.
+        end_date (datetime.date): The last date to backfill.
+        outlook_types (list): The outlook types to backfill, or None for every archived type.
 
-            # Day 2 Tornado Risk Label
-            highest_risk_label_tor_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_tor_day_2}',
-                                                        font=('karla', 25))
-            highest_risk_label_tor_day_2.grid(row=4, column=2, columnspan=1, sticky='nsew')
+    Returns:
+        dict: How many issuances were 'stored', 'empty', 'missing' or 'failed'.
+    """
+    progress = read_archive_progress()
+    pending = {}
+    for issuance in archive_issuances(start_date, end_date, outlook_types):
+        if archive_key(*issuance) not in progress:
+            outlook_type, _, date, _ = issuance
+            pending.setdefault((outlook_type, date[:4] + '-' + date[4:6]), []).append(issuance)
+    log.info(f'Backfilling {sum(len(issuances) for issuances in pending.values())} archive issuances')  # skipcq: PYL-W1203
+
+    counts = {'stored': 0, 'empty': 0, 'missing': 0, 'failed': 0}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=archive_max_workers, thread_name_prefix='archive') as executor:
+        for (outlook_type, month), issuances in sorted(pending.items()):
+            futures = {issuance: executor.submit(download_archive_outlook, *issuance) for issuance in issuances}
+            rows = []
+            statuses = {}
+            for issuance, future in futures.items():
+                try:
+                    outlook_data = future.result()
+                except Exception:  # skipcq: PYL-W0703
+                    log.warning('Could not download archive issuance ' + archive_key(*issuance), exc_info=True)
+                    counts['failed'] += 1
+                    continue
+                if outlook_data is None:
+                    status = 'missing'
+                else:
+                    issuance_rows = archive_rows(outlook_data, *issuance[1:])
+                    rows.extend(issuance_rows)
+                    status = 'stored' if issuance_rows else 'empty'
+                statuses[archive_key(*issuance)] = status
+                counts[status] += 1
+
+            if rows:
+                write_archive_month(outlook_type, month, rows)
+            progress.update(statuses)
+            write_archive_progress(progress)
+            log.info(f'Backfilled {outlook_type} outlooks for {month}: {len(rows)} risk areas')  # skipcq: PYL-W1203
+
+    log.info(f'Backfill finished: {counts}')  # skipcq: PYL-W1203
+    return counts
+
+
+# Function to query the archive
+def query_archive(outlook_type, start_date, end_date, days=None, labels=None):
+    """
+    Reads archived risk areas from the local archive. Only the months in the range are opened, and the
+    date, day and label filters are applied while the files are read.
 
-            # Day 2 Wind Outlook
-            D1_Wind_Button = ctk.CTkButton(main_frame, text='Day 2 Wind', width=150, height=50, font=('karla', 28),
-                                           command=lambda: button_run('wind', 2))
-            D1_Wind_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Parameters:
+        outlook_type (str): The type of outlook.
+        start_date (datetime.date): The first issue date to include.
+        end_date (datetime.date): The last issue date to include.
+        days (list): The outlook days to include, or None for all of them.
+        labels (list): The labels to include (e.g. ['SLGT', 'ENH']), or None for all of them.
 
-            # Day 1 Wind Risk Label
-            highest_risk_label_wind_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_wind_day_2}',
-                                                         font=('karla', 25))
-            highest_risk_label_wind_day_2.grid(row=5, column=2, columnspan=1, sticky='nsew')
+    Returns:
+        geopandas.GeoDataFrame: One row per risk area with 'day', 'issue', 'valid', 'expire', 'label', 'rank' and 'geometry' columns.
+    """
+    start = pd.Timestamp(start_date, tz='UTC')
+    end = pd.Timestamp(end_date, tz='UTC') + pd.Timedelta(days=1)
+    filters = [('issue', '>=', start), ('issue', '<', end)]
+    if days is not None:
+        filters.append(('day', 'in', list(days)))
+    if labels is not None:
+        filters.append(('label', 'in', list(labels)))
+
+    frames = []
+    for month in pd.period_range(start_date, end_date, freq='M'):
+        month_path = archive_month_path(outlook_type, str(month))
+        if os.path.exists(month_path):
+            frames.append(gpd.read_parquet(month_path, filters=filters))
+    if not frames:
+        return gpd.GeoDataFrame(columns=['day', 'issue', 'valid', 'expire', 'label', 'rank', 'geometry'], geometry='geometry', crs='EPSG:4326')
+    return pd.concat(frames, ignore_index=True)
+
+
+# Function to read the archived issuances of an outlook
+def archive_outlooks(outlook_type, day, start_date, end_date):
+    """
+    Reads each archived issuance of an outlook between two dates, oldest first. The archive is read one
+    month at a time, so only a month of risk areas is held in memory however long the range is.
 
-            # Day 2 Hail Outlook
-            D2_Hail_Button = ctk.CTkButton(main_frame, text='Day 2 Hail', width=150, height=50, font=('karla', 28),
-                                           command=lambda: button_run('hail', 2))
-            D2_Hail_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int): The day of the outlook.
+        start_date (datetime.date): The first issue date to include.
+        end_date (datetime.date): The last issue date to include.
 
-            # Day 2 Hail Risk Label
-            highest_risk_label_hail_day_2 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_hail_day_2}',
-                                                         font=('karla', 25))
-            highest_risk_label_hail_day_2.grid(row=6, column=2, columnspan=1, sticky='nsew')
-        elif day == 3:
-            outlook_data_cat_day_3 = fetch_cat_outlooks(3)
-            highest_risk_level_cat_day_3 = determine_highest_risk_level_cat(outlook_data_cat_day_3)
+    Yields:
+        Outlook: Each archived issuance, rebuilt from its risk areas.
+    """
+    for month in pd.period_range(start_date, end_date, freq='M'):
+        month_start = max(start_date, month.start_time.date())
+        month_end = min(end_date, month.end_time.date())
+        rows = query_archive(outlook_type, month_start, month_end, days=[day])
+        for issue, issuance in rows.groupby('issue', sort=True):
+            features = [{'geometry': shapely.geometry.mapping(row.geometry),
+                         'properties': {'LABEL': row.label, 'ISSUE': issue.strftime('%Y%m%d%H%M'),
+                                        'VALID': row.valid.strftime('%Y%m%d%H%M') if pd.notna(row.valid) else None,
+                                        'EXPIRE': row.expire.strftime('%Y%m%d%H%M') if pd.notna(row.expire) else None}}
+                        for row in issuance.itertuples()]
+            yield Outlook(outlook_type, features)
+
+
+# Function to list the issuances an animation shows
+def outlook_issuances(outlook_type, day, start_date, end_date):
+    """
+    Reads each issuance of an outlook between two dates from the local archive, then adds the current
+    outlook from the session store when the range reaches today and it is newer than the archive.
 
-            outlook_data_prob_day_3 = fetch_prob_outlooks(3)
-            highest_risk_level_prob_day_3 = determine_highest_risk_level_prob(outlook_data_prob_day_3)
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int): The day of the outlook.
+        start_date (datetime.date): The first issue date to include.
+        end_date (datetime.date): The last issue date to include.
 
-            side_bar()
+    Yields:
+        Outlook: Each issuance, oldest first.
+    """
+    last_issue = None
+    for outlook_data in archive_outlooks(outlook_type, day, start_date, end_date):
+        last_issue = outlook_data.issue
+        yield outlook_data
+
+    if end_date < datetime.datetime.now(datetime.timezone.utc).date() or day not in outlook_days.get(outlook_type, ()):
+        return
+    try:
+        outlook_data = get_outlook(outlook_type, day)
+    except requests.exceptions.RequestException:
+        log.warning(f'Could not get the current day {day} {outlook_type} outlook for the animation', exc_info=True)  # skipcq: PYL-W1203
+        return
+    if outlook_data.issue is None or outlook_data.issue[:8] < start_date.strftime('%Y%m%d'):
+        return
+    if last_issue is None or outlook_data.issue > last_issue:
+        yield outlook_data
+
+
+# Function to pick the writer for an animation
+def animation_writer(path, fps):
+    """
+    Picks the writer for an animation file. ffmpeg is used whenever it is installed since it encodes each
+    frame as it is drawn. Without it GIFs fall back to Pillow, which keeps every frame until the end.
 
-            # Day 3 Button
-            D3_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 3', width=200, corner_radius=12,
-                                           fg_color='transparent',
-                                           font=('karla', 26), command=lambda: frame_change(3),
-                                           state='disabled', image=lightning_icon)
-            D3_Side_Button.grid(row=4, column=0, columnspan=1, padx=5, pady=10)
+    Parameters:
+        path (str): The file to write, ending in .gif or .mp4.
+        fps (int): The frames per second.
 
-            # Close Button
-            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
-                                         command=close_program)
-            Close_Button.grid(row=1, column=3, padx=15, pady=15, sticky='e')
+    Returns:
+        matplotlib.animation.AbstractMovieWriter: The writer.
 
-            # Hide_Button
-            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
-                                        command=hide_to_system_tray)
-            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+    Raises:
+        ValueError: If the file is not a GIF or MP4.
+        RuntimeError: If an MP4 is asked for and ffmpeg is not installed.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ('.gif', '.mp4'):
+        raise ValueError('Animations can only be saved as .gif or .mp4, not ' + path)
+    if animation.writers.is_available('ffmpeg'):
+        return animation.FFMpegWriter(fps=fps)
+    if extension == '.mp4':
+        raise RuntimeError('ffmpeg is needed to save MP4 animations')
+    log.warning('ffmpeg is not installed, so the GIF frames are held in memory until the animation is saved')
+    return animation.PillowWriter(fps=fps)
+
+
+# Function to export an animation of an outlook's issuances
+def export_animation(outlook_type, outlooks, path, fps=None):
+    """
+    Saves an animation of how an outlook changed from one issuance to the next. The base map and header
+    are drawn once; each frame only swaps the risk polygons and the issue time, and is handed to the
+    writer as soon as it is drawn so memory does not grow with the number of frames.
 
-            # Day 3 Heading Label
-            D3_Label = ctk.CTkLabel(main_frame, text='Day 3 Outlooks', font=Title_Font)
-            D3_Label.grid(row=2, column=1, columnspan=2, padx=435, pady=50, sticky='nsew')
+    Parameters:
+        outlook_type (str): The type of outlook.
+        outlooks (iterable): The issuances to animate, oldest first, e.g. from outlook_issuances.
+        path (str): The file to save, ending in .gif or .mp4.
+        fps (int): The frames per second, or None for animation_fps.
 
-            # Day 3 Categorical Button
-            D3_Cat_Button = ctk.CTkButton(main_frame, text='Day 3 Categorical', width=150, height=50, font=('karla', 28),
-                                          command=lambda: button_run('cat', 3))
-            D3_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Returns:
+        int: The number of frames saved.
+    """
+    writer = animation_writer(path, fps or animation_fps)
+    fig, ax = setup_plot()
+    add_overlays(ax, outlook_type)
+    set_plot_limits(ax)
+    remove_axes_labels_boxes_title(ax)
+    issue_label = ax.text(0.98, 0.02, '', transform=ax.transAxes, ha='right', va='bottom', color='white', fontsize=14,
+                          fontweight='bold', bbox={'facecolor': 'black', 'alpha': 0.6, 'linewidth': 0})
+
+    frames = 0
+    layer = []
+    start_time = time.perf_counter()
+    with writer.saving(fig, path, output_dpi):
+        for outlook_data in outlooks:
+            for artist in layer:
+                artist.remove()
+            layer = plot_outlook_polygons(ax, outlook_type, outlook_data)
+            if outlook_data.issue is not None:
+                issued = datetime.datetime.strptime(outlook_data.issue, '%Y%m%d%H%M')
+                issue_label.set_text(issued.strftime('Issued %b %d, %Y %H%MZ'))
+            else:
+                issue_label.set_text('')
+            writer.grab_frame()
+            frames += 1
+    log.info(f'Saved {frames} frames to {path} in {time.perf_counter() - start_time:.2f}s')  # skipcq: PYL-W1203
+    return frames
+
+
+# Pre-rendering
+prerender_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='prerender')
+prerendered = {}  # Image path, summary and ready time of the latest pre-rendered graphic for each (outlook_type, day)
+prerendered_lock = threading.Lock()
+rss_product_pattern = re.compile(r'Day (4-8|[123]) Convective Outlook')  # RSS titles of the convective outlooks
+rss_issue_pattern = re.compile(r'([A-Z][a-z]{2} \d{1,2}, \d{4}) (\d{4}) UTC')  # Issue time in the RSS titles of the outlooks
+
+
+# Function to find the products an RSS entry announces
+def classify_rss_entry(title):
+    """
+    Works out which outlook products an RSS entry announces from its title.
 
-            # Day 3 Categorial Risk Label
-            highest_risk_label_cat_day_3 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_cat_day_3}',
-                                                        font=('karla', 25))
-            highest_risk_label_cat_day_3.grid(row=3, column=2, columnspan=1, sticky='nsew')
+    Parameters:
+        title (str): The title of the RSS entry, e.g. 'SPC Apr 16, 2024 1630 UTC Day 1 Convective Outlook'.
 
-            # Day 3 Probabilistic Outlook
-            D3_Prob_Button = ctk.CTkButton(main_frame, text='Day 3 Probabilistic', width=150, height=50, font=('karla', 28),
-                                           command=lambda: button_run('prob', 3))
-            D3_Prob_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Returns:
+        list: The (outlook_type, day) pairs the entry announces, empty if it is not a convective outlook.
+    """
+    match = rss_product_pattern.search(title)
+    if match is None:
+        return []
+    if match.group(1) == '4-8':
+        return [('d4-8', day) for day in outlook_days['d4-8']]
+    day = int(match.group(1))
+    return [(outlook_type, day) for outlook_type, days in outlook_days.items() if outlook_type != 'd4-8' and day in days]
 
-            # Day 3 Probabilistic Risk Label
-            highest_risk_label_prob_day_3 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_prob_day_3}',
-                                                         font=('karla', 25))
-            highest_risk_label_prob_day_3.grid(row=4, column=2, columnspan=1, sticky='nsew')
-        elif day == 'd4-8':
-            outlook_data_d48_day_4 = fetch_d48_outlooks(4)
-            highest_risk_level_d48_day_4 = determine_highest_risk_level_d48(outlook_data_d48_day_4)
 
-            outlook_data_d48_day_5 = fetch_d48_outlooks(5)
-            highest_risk_level_d48_day_5 = determine_highest_risk_level_d48(outlook_data_d48_day_5)
+# Function to get the issue time an RSS entry announces
+def rss_entry_issue_time(title):
+    """
+    Gets the issue time from the title of an outlook RSS entry.
+
+    Parameters:
+        title (str): The title of the RSS entry, e.g. 'SPC Apr 16, 2024 1630 UTC Day 1 Convective Outlook'.
 
-            outlook_data_d48_day_6 = fetch_d48_outlooks(6)
-            highest_risk_level_d48_day_6 = determine_highest_risk_level_d48(outlook_data_d48_day_6)
+    Returns:
+        float: The issue time as a Unix timestamp, or None if the title does not have one.
+    """
+    match = rss_issue_pattern.search(title)
+    if match is None:
+        return None
+    try:
+        issued = datetime.datetime.strptime(match.group(1) + ' ' + match.group(2), '%b %d, %Y %H%M')
+    except ValueError:
+        return None
+    return issued.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+
+# Function to make the next outlook fetch ask SPC for changes
+def invalidate_http_cache(urls=None):
+    """
+    Marks cached outlooks in memory as stale, so the next fetch revalidates them with SPC even if they are
+    younger than http_cache_max_age. An unchanged outlook still only costs a 304.
 
-            outlook_data_d48_day_7 = fetch_d48_outlooks(7)
-            highest_risk_level_d48_day_7 = determine_highest_risk_level_d48(outlook_data_d48_day_7)
+    Parameters:
+        urls (list): The URLs of the outlooks to mark, or None to mark every cached outlook.
 
-            outlook_data_d48_day_8 = fetch_d48_outlooks(8)
-            highest_risk_level_d48_day_8 = determine_highest_risk_level_d48(outlook_data_d48_day_8)
+    Returns:
+        None
+    """
+    with http_cache_lock:
+        for url, entry in http_cache_memory.items():
+            if urls is None or url in urls:
+                http_cache_memory[url] = dict(entry, fetched_at=0)
 
-            side_bar()
 
-            # Day 4-8 Button
-            D48_Side_Button = ctk.CTkButton(sidebar_frame, text='Day 4-8', width=200, corner_radius=12,
-                                            fg_color='transparent',
-                                            font=Description_Font, command=lambda: frame_change('d4-8'),
-                                            state='disabled', image=lightning_icon)
-            D48_Side_Button.grid(row=5, column=0, columnspan=1, padx=5, pady=10)
+# Function to save the risk summary next to an outlook image
+def save_outlook_summary(outlook_type, day, outlook_data, image_path):
+    """
+    Saves the risk summary of an outlook as JSON next to its image in the output directory.
 
-            # Close Button
-            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
-                                         command=close_program)
-            Close_Button.grid(row=1, column=3, padx=15, pady=15, sticky='e')
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int): The day of the outlook.
+        outlook_data (Outlook): The parsed outlook.
+        image_path (str): Where the outlook image was saved, or None if there is no outlook.
 
-            # Hide_Button
-            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
-                                        command=hide_to_system_tray)
-            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+    Returns:
+        dict: The saved summary.
+    """
+    summary = dict(summarize_outlook(outlook_data), issue=outlook_data.issue, valid=outlook_data.valid,
+                   expire=outlook_data.expire, fingerprint=outlook_data.fingerprint, image=image_path)
+    summary_path = os.path.splitext(outlook_output_path(outlook_type, day))[0] + '.json'
+    with open(summary_path + '.tmp', 'w', encoding='utf-8') as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    os.replace(summary_path + '.tmp', summary_path)
+    return summary
 
-            # Day 4-8 Heading Label
-            D48_Label = ctk.CTkLabel(main_frame, text='Day 4-8 Outlooks', font=Title_Font)
-            D48_Label.grid(row=2, column=1, columnspan=2, padx=400, pady=50, sticky='nsew')
 
-            # Day 4 Button
-            D4_Cat_Button = ctk.CTkButton(main_frame, text='Day 4 Outlook', font=('karla', 28),
-                                          height=50, command=lambda: button_run('d4-8', 4))
-            D4_Cat_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+# Function to fetch and draw outlooks ahead of the user
+def prerender_products(products, detected_at=None):
+    """
+    Fetches outlooks, and draws and summarizes the ones that changed since they were last seen, so the
+    graphics are ready before the user asks for them. How long each graphic took from issuance is logged.
 
-            # Day 4 Probabilistic Risk Label
-            highest_risk_label_d48_day_4 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_4}',
-                                                        font=('karla', 25))
-            highest_risk_label_d48_day_4.grid(row=3, column=2, columnspan=1, sticky='nsew')
+    Parameters:
+        products (list): The (outlook_type, day) pairs to draw.
+        detected_at (float): When the new outlook was noticed, as a Unix timestamp, or None.
 
-            # Day 5 Button
-            D5_Cat_Button = ctk.CTkButton(main_frame, text='Day 5 Outlook', font=('karla', 28),
-                                          width=150, height=50, command=lambda: button_run('d4-8', 5))
-            D5_Cat_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+    Returns:
+        list: The products that changed and were drawn.
+    """
+    invalidate_http_cache([outlook_urls[outlook_type][day] for outlook_type, day in products])
+    invalidate_outlook_store(products)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(fetch_max_workers, len(products))),
+                                               thread_name_prefix='fetch') as executor:
+        futures = {product: executor.submit(get_outlook, product[0], product[1]) for product in products}
+
+    changed = []
+    for (outlook_type, day), future in futures.items():
+        try:
+            outlook_data = future.result()
+            diff = track_outlook_change(outlook_type, day, outlook_data)
+            if diff is not None and not diff['changed']:
+                continue
+            image_path = None
+            if outlook_data.available:
+                image_path = render_outlook(outlook_type, day, outlook_data)
+            summary = save_outlook_summary(outlook_type, day, outlook_data, image_path)
+        except Exception:  # skipcq: PYL-W0703
+            log.error(f'Could not pre-render the day {day} {outlook_type} outlook', exc_info=True)  # skipcq: PYL-W1203
+            continue
+
+        ready_at = time.time()
+        with prerendered_lock:
+            prerendered[outlook_type, day] = {'image': image_path, 'summary': summary, 'ready_at': ready_at}
+        changed.append((outlook_type, day))
+
+        latency = f'Pre-rendered the day {day} {outlook_type} outlook'
+        if outlook_data.issue is not None:
+            issued_at = datetime.datetime.strptime(outlook_data.issue, '%Y%m%d%H%M').replace(tzinfo=datetime.timezone.utc).timestamp()
+            latency += f' {ready_at - issued_at:.0f}s after issuance'
+        if detected_at is not None:
+            latency += f' and {ready_at - detected_at:.1f}s after the RSS entry'
+        log.info(latency)
+    return changed
+
+
+# Function to handle a convective outlook RSS entry
+def prerender_entry(title, products, detected_at):
+    """
+    Draws the outlooks an RSS entry announces, then notifies the user if any of them changed.
 
-            # Day 5 Probabilistic Risk Label
-            highest_risk_label_d48_day_5 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_5}',
-                                                        font=('karla', 25))
-            highest_risk_label_d48_day_5.grid(row=4, column=2, columnspan=1, sticky='nsew')
+    SPC often posts the RSS entry before the GeoJSON is updated, so nothing is notified until every
+    outlook fetched was issued within rss_issue_window of the time in the entry's title.
 
-            # Day 6 Button
-            D6_Cat_Button = ctk.CTkButton(main_frame, text='Day 6 Outlook', font=('karla', 28),
-                                          width=150, height=50, command=lambda: button_run('d4-8', 6))
-            D6_Cat_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
+    Parameters:
+        title (str): The title of the RSS entry.
+        products (list): The (outlook_type, day) pairs the entry announces.
+        detected_at (float): When the entry was noticed, as a Unix timestamp.
 
-            # Day 6 Probabilistic Risk Label
-            highest_risk_label_d48_day_6 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_6}',
-                                                        font=('karla', 25))
-            highest_risk_label_d48_day_6.grid(row=5, column=2, columnspan=1, sticky='nsew')
+    Returns:
+        bool: True if the entry was handled, False if the outlooks have not updated yet and it should be tried again.
+    """
+    try:
+        changed = prerender_products(products, detected_at)
+    except Exception:  # skipcq: PYL-W0703
+        log.error('RSS - Could not pre-render ' + title, exc_info=True)
+        return False
+
+    entry_issued_at = rss_entry_issue_time(title)
+    if entry_issued_at is not None:
+        with outlook_store_lock:
+            issues = [outlook_store[product]['issue'] for product in products if product in outlook_store]
+        if len(issues) < len(products):
+            return False
+        for issue in issues:
+            if issue is None:
+                continue
+            issued_at = datetime.datetime.strptime(issue, '%Y%m%d%H%M').replace(tzinfo=datetime.timezone.utc).timestamp()
+            if issued_at < entry_issued_at - rss_issue_window:
+                return False
+
+    if changed:
+        notify_rss_entry(title, f'{title[:200]}. The new outlook is ready in the App!')
+    else:
+        log.info('RSS - ' + title + ' re-issued the same outlooks, so no notification was sent')
+    return True
 
-            # Day 7 Button
-            D7_Cat_Button = ctk.CTkButton(main_frame, text='Day 7 Outlook', font=('karla', 28),
-                                          width=150, height=50, command=lambda: button_run('d4-8', 7))
-            D7_Cat_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
 
-            # Day 7 Probabilistic Risk Label
-            highest_risk_label_d48_day_7 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_7}',
-                                                        font=('karla', 25))
-            highest_risk_label_d48_day_7.grid(row=6, column=2, columnspan=1, sticky='nsew')
+# Local HTTP Server
+served_products = {}  # The PNG and JSON summary served for each (outlook_type, day), with their caching headers
+served_flights = {}  # Future of the build in progress for each (outlook_type, day), shared by every request waiting on it
+served_lock = threading.Lock()
 
-            # Day 8 Button
-            D8_Cat_Button = ctk.CTkButton(main_frame, text='Day 8 Outlook', font=('karla', 28),
-                                          width=150, height=50, command=lambda: button_run('d4-8', 8))
-            D8_Cat_Button.grid(row=7, column=1, columnspan=1, padx=25, pady=20, sticky='nsew')
 
-            # Day 8 Probabilistic Risk Label
-            highest_risk_label_d48_day_8 = ctk.CTkLabel(main_frame, text=f'Highest Risk: {highest_risk_level_d48_day_8}',
-                                                        font=('karla', 25))
-            highest_risk_label_d48_day_8.grid(row=7, column=2, columnspan=1, sticky='nsew')
-        elif day == 'test':
-            # Close Button
-            Close_Button = ctk.CTkButton(main_frame, text='Close', width=200, font=Description_Font,
-                                         command=close_program)
-            Close_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+# Function to check if a served product is still current
+def served_product_is_fresh(product, entry):
+    """
+    Checks if a served product can be sent again without asking the session store for the outlook.
 
-            # Hide_Button
-            Hide_Button = ctk.CTkButton(main_frame, text='Hide', width=200, font=Description_Font,
-                                        command=hide_to_system_tray)
-            Hide_Button.grid(row=1, column=2, padx=25, pady=15, sticky='e')
+    Parameters:
+        product (tuple): The (outlook_type, day) pair.
+        entry (dict): The served product from served_products.
 
-            # Heading Label
-            Test_Label = ctk.CTkLabel(main_frame, text='Outlook Tests', font=Title_Font)
-            Test_Label.grid(row=2, column=1, columnspan=1, padx=450, pady=50, sticky='nsew')
+    Returns:
+        bool: True if the outlook is still fresh and has not been dropped from the session store, False otherwise.
+    """
+    with outlook_store_lock:
+        stored = outlook_store.get(product)
+    return stored is not None and stored['outlook'] is entry['outlook'] and time.time() < stored['fresh_until']
 
-            # Test Categorial Button
-            Test_Button = ctk.CTkButton(main_frame, text='(Test) March 31st, 2023', width=300,
-                                        font=Description_Font, command=lambda: button_run('cat', 'test'))
-            Test_Button.grid(row=3, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
 
-            # Test Tornado Button
-            Test_Tor_Button = ctk.CTkButton(main_frame, text='(Test) March 17th, 2021', width=300,
-                                            font=Description_Font, command=lambda: button_run('tor', 'test'))
-            Test_Tor_Button.grid(row=4, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+# Function to build the files served for a product
+def build_served_product(outlook_type, day, previous=None):
+    """
+    Gets an outlook from the session store and draws and summarizes it for the server. If the outlook has not
+    changed since the last build, the files and caching headers of that build are kept.
 
-            # Test Wind Button
-            Test_Wind_Button = ctk.CTkButton(main_frame, text='(Test) March 25th, 2021', width=300,
-                                             font=Description_Font, command=lambda: button_run('wind', 'test'))
-            Test_Wind_Button.grid(row=5, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int or str): The day of the outlook.
+        previous (dict): The last build of the product, or None.
 
-            # Test Hail Button
-            Test_Hail_Button = ctk.CTkButton(main_frame, text='(Test) May 26th, 2021', width=300,
-                                             font=Description_Font, command=lambda: button_run('hail', 'test'))
-            Test_Hail_Button.grid(row=6, column=1, columnspan=1, padx=25, pady=30, sticky='nsew')
-        else:
-            log.error('Invalid Button. Day = ' + str(day) + 'Error on line 1798')
-            popup('error', 'Invalid Button', "An error has occured where the button isn't programmed correctly. The program will now quit.")
-            sys.exit(0)
+    Returns:
+        dict: The 'outlook', its 'png' bytes (None if there is no outlook), the 'json' summary bytes, the 'etag'
+        of each as a dict keyed by 'png' and 'json', and 'last_modified' as a Unix timestamp.
+    """
+    outlook_data = get_outlook(outlook_type, day)
+    if previous is not None and previous['outlook'].fingerprint == outlook_data.fingerprint:
+        return dict(previous, outlook=outlook_data)
+
+    cache_key = render_cache_key(outlook_type, outlook_data)
+    image_path = None
+    png = None
+    if outlook_data.available:
+        image_path = render_outlook(outlook_type, day, outlook_data)
+        # The render cache copy never changes, while the output image can be replaced by another render at any time
+        for path in (os.path.join(render_cache_directory, cache_key + '.png'), image_path):
+            try:
+                with open(path, 'rb') as image_file:
+                    png = image_file.read()
+                break
+            except OSError:
+                continue
+        if png is None:
+            raise OSError('Could not read the rendered ' + outlook_type + ' outlook for day ' + str(day))
+    summary = save_outlook_summary(outlook_type, day, outlook_data, image_path)
+    summary_json = json.dumps(summary, indent=2).encode('utf-8')
+    return {
+        'outlook': outlook_data,
+        'png': png,
+        'json': summary_json,
+        'etag': {
+            'png': '"' + hashlib.sha1(png or b'').hexdigest() + '"',  # Not the cache key, which a render with missing tiles shares
+            'json': '"' + hashlib.sha1(summary_json).hexdigest() + '"'
+        },
+        'last_modified': time.time()
+    }
 
-    def frame_change(day):  # skipcq: PTC-W0065
-        """
-        This function changes the frame of the GUI based on the provided day.
 
-        It destroys all the widgets in the main frame and then calls the frames function to recreate the frame for the specified day.
+# Function to get the files served for a product
+def get_served_product(outlook_type, day):
+    """
+    Gets the files served for a product, building them if they are missing or stale. Concurrent requests for
+    a product that needs building wait on a single build instead of each drawing the outlook.
 
-        Parameters:
-            day (int): The day for which the frame needs to be changed.
+    Parameters:
+        outlook_type (str): The type of outlook.
+        day (int or str): The day of the outlook.
 
-        Returns:
-            None
-        """
-        for widget in main_frame.winfo_children():
-            widget.destroy()
+    Returns:
+        dict: The served product, as returned by build_served_product.
 
-        frames(day)
+    Raises:
+        requests.exceptions.RequestException: If the outlook has to be fetched and the download fails.
+    """
+    product = (outlook_type, day)
+    with served_lock:
+        entry = served_products.get(product)
+        if entry is not None and served_product_is_fresh(product, entry):
+            return entry
+        future = served_flights.get(product)
+        leader = future is None
+        if leader:
+            future = concurrent.futures.Future()
+            served_flights[product] = future
+    if not leader:
+        return future.result()
+
+    try:
+        entry = build_served_product(outlook_type, day, entry)
+    except BaseException as e:
+        with served_lock:
+            del served_flights[product]
+        future.set_exception(e)
+        raise
+    with served_lock:
+        served_products[product] = entry
+        del served_flights[product]
+    future.set_result(entry)
+    return entry
+
+
+class OutlookRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves the latest outlook images and risk summaries:
 
-    def button_run(outlook_type, day):  # skipcq: PTC-W0065
-        """
-        Handles the button press event for running a specific outlook type for a given day.
+        /                    the products and their URLs, as JSON
+        /<type>/<day>.png    the outlook image, e.g. /cat/1.png or /d4-8/5.png
+        /<type>/<day>.json   the risk summary of the outlook
 
-        Parameters:
-            type (str): The type of outlook to be run.
-            day (int): The day for which the outlook needs to be run.
+    Responses carry an ETag, Last-Modified and Cache-Control, and conditional requests are answered with 304.
+    """
+    server_version = 'SevereWeatherOutlookDisplay'
+    protocol_version = 'HTTP/1.1'
 
-        Returns:
-            None
+    def do_GET(self):  # skipcq: PYL-C0103
         """
-        log.info('GUI - ' + outlook_type + str(day) + ' button has been pressed.')
-        window.withdraw()
-        run(outlook_type, day, window, instance)
-
-    def hide_to_system_tray():  # skipcq: PTC-W0065
+        Answers a GET request.
         """
-        Hides the application window to the system tray.
+        self.send_product(send_body=True)
 
-        Parameters:
-            None
+    def do_HEAD(self):  # skipcq: PYL-C0103
+        """
+        Answers a HEAD request.
+        """
+        self.send_product(send_body=False)
 
-        Returns:
-            None
+    def send_product(self, send_body):
         """
-        window.withdraw()
-        image = Image.open('My_project.png')
-        menu = (pystray.MenuItem("Show", show_from_system_tray),
-                pystray.MenuItem("Exit", close_program))
-        global logo_icon_tray  # skipcq: PYL-W0601
-        logo_icon_tray = pystray.Icon("name", image, "My System Tray Icon", menu)
-        logo_icon_tray.run()
+        Sends the index or a product's image or summary.
 
-    def close_program():
+        Parameters:
+            send_body (bool): Whether to send the body, False for HEAD requests.
         """
-        Closes the program after prompting the user for confirmation.
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            index = {f'{outlook_type}:{day}': {'png': f'/{outlook_type}/{day}.png', 'json': f'/{outlook_type}/{day}.json'}
+                     for outlook_type, day in all_products()}
+            self.send_body(200, 'application/json', json.dumps(index, indent=2).encode('utf-8'), send_body, {'Cache-Control': 'no-cache'})
+            return
 
-        This function displays a popup asking the user if they want to close the program.
-        If the user responds with 'yes', it stops the system tray icon, withdraws the main window, and exits the program.
+        match = re.fullmatch(r'/([a-z0-9-]+)/(\w+)\.(png|json)', path)
+        try:
+            if match is None:
+                raise argparse.ArgumentTypeError(path)
+            outlook_type, day = parse_product(match.group(1) + ':' + match.group(2))
+        except argparse.ArgumentTypeError:
+            self.send_body(404, 'text/plain', b'Not found\n', send_body)
+            return
+        file_type = match.group(3)
 
-        Parameters:
-            None
+        try:
+            entry = get_served_product(outlook_type, day)
+        except Exception:  # skipcq: PYL-W0703
+            log.error(f'Server - Could not get the day {day} {outlook_type} outlook', exc_info=True)  # skipcq: PYL-W1203
+            self.send_body(502, 'text/plain', b'The outlook could not be fetched from SPC\n', send_body)
+            return
+        if entry[file_type] is None:
+            self.send_body(404, 'text/plain', b'There is no outlook available\n', send_body)
+            return
 
-        Returns:
-            None
-        """
-        log.info('GUI - Now Closing Program')
-        popup('question',
-              'Close Program?',
-              'Are you sure you want to close the program? You will not receive notifications for new outlooks when the program is closed. Use "Hide" instead to hide the program and still receive new outlook notifications!')  # skipcq: FLK-E501
-        if question == 'yes':
-            if 'icon' in globals() and logo_icon_tray is not None:
-                logo_icon_tray.stop()
-            window.withdraw()
-            os._exit(0)
-        else:
+        with outlook_store_lock:
+            stored = outlook_store.get((outlook_type, day))
+        max_age = 0 if stored is None else int(max(0, min(stored['fresh_until'] - time.time(), outlook_store_max_age)))
+        headers = {
+            'ETag': entry['etag'][file_type],
+            'Last-Modified': email.utils.formatdate(entry['last_modified'], usegmt=True),
+            'Cache-Control': f'public, max-age={max_age}'
+        }
+        if self.is_not_modified(entry['etag'][file_type], entry['last_modified']):
+            self.send_body(304, None, b'', False, headers)
             return
+        self.send_body(200, 'image/png' if file_type == 'png' else 'application/json', entry[file_type], send_body, headers)
 
-    def show_from_system_tray(logo_icon_tray_1, item):  # skipcq: PYL-W0613  # skipcq: PTC-W0065
+    def is_not_modified(self, etag, last_modified):
         """
-        Shows the application window from the system tray.
+        Checks the request's If-None-Match and If-Modified-Since headers against the current version.
 
         Parameters:
-            icon: The system tray icon object.
-            item: The item that triggered this function call.
+            etag (str): The ETag of the current version.
+            last_modified (float): When the current version was made, as a Unix timestamp.
 
         Returns:
-            None
+            bool: True if the client already has the current version, False otherwise.
         """
-        logo_icon_tray_1.stop()
-        window.deiconify()
-
-    window.protocol("WM_DELETE_WINDOW", close_program)
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return if_none_match.strip() == '*' or etag in (tag.strip() for tag in if_none_match.split(','))
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is not None:
+            try:
+                return int(last_modified) <= email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def send_body(self, status, content_type, body, send_body, headers=None):
+        """
+        Sends a response.
 
-    side_bar()
-    frames('home')
+        Parameters:
+            status (int): The HTTP status code.
+            content_type (str): The Content-Type of the body, or None for no body.
+            body (bytes): The body.
+            send_body (bool): Whether to write the body, False for HEAD requests and 304s.
+            headers (dict): Other headers to send, or None.
+        """
+        self.send_response(status)
+        if content_type is not None:
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):  # skipcq: PYL-W0622
+        """
+        Sends the server's request log to the program log instead of stderr.
+        """
+        log.info('Server - ' + self.address_string() + ' - ' + format % args)
 
-    log.info('GUI - Created widgets')
 
-    # Run the Window
-    log.info('GUI - Running window')
-    window.mainloop()
+# Function to run the local HTTP server
+def serve_outlooks(host, port):
+    """
+    Serves the latest outlook images and risk summaries over HTTP until the program is stopped. The RSS feed
+    is watched at the same time so new outlooks are drawn as soon as they are issued.
 
+    Parameters:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
 
-# Function to Run the Program
-def run(outlook_type, day, window, instance_run):
+    Returns:
+        None
     """
-    Runs the severe weather outlook program for a specified outlook type and day.
+    rss_feed_thread = threading.Thread(target=check_rss_feed, args=(rss_url, check_interval))
+    rss_feed_thread.daemon = True
+    rss_feed_thread.start()
+
+    server = http.server.ThreadingHTTPServer((host, port), OutlookRequestHandler)
+    server.daemon_threads = True
+    log.info(f'Server - Serving outlooks on http://{host}:{server.server_address[1]}/')  # skipcq: PYL-W1203
+    server.serve_forever()
 
-    This function logs the start of the program, fetches the outlook data, checks its availability,
-    and displays it on the map if available. If the outlook data is not available, it displays a
-    warning message. It also checks if the outlook type is valid and exits the program if it's not.
+
+# Function to set up logging
+def setup_logging():
+    """
+    Sets up the log directory and the log file.
 
     Parameters:
-        outlook_type (str): The type of severe weather outlook (e.g., 'cat', 'tor', 'wind', etc.).
-        day (int): The day of the outlook (e.g., 1, 2, 3, etc.).
-        window: The GUI window object.
+        None
 
     Returns:
         None
     """
-    log.info('Running outlook' + outlook_type + 'day' + str(day))
+    if not os.path.exists(log_directory):
+        os.makedirs(log_directory)
 
-    outlook_functions = {
-        'cat': fetch_cat_outlooks,
-        'tor': fetch_tor_outlooks,
-        'wind': fetch_wind_outlooks,
-        'hail': fetch_hail_outlooks,
-        'd4-8': fetch_d48_outlooks,
-        'prob': fetch_prob_outlooks
-    }
+    log.basicConfig(
+        level=log.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        filename='C:\\log\\cod.log',
+        filemode='w'
+    )
 
-    fetch_function = outlook_functions.get(outlook_type)
-    if fetch_function is None:
-        log.error('Invalid Outlook Type. Outlook Type = ' + outlook_type)
-        popup('error', 'Invalid Outlook Type', "An error has occurred where the outlook type wasn't read correctly. The program will now quit.")
-        sys.exit(0)
 
-    outlook_data = fetch_function(day)
+# Function to read the command line options
+def parse_arguments(argv=None):
+    """
+    Reads the command line options.
 
-    if check_outlook_availability(outlook_data):
-        if instance_run == 0:
-            popup('info', 'Program is Running',
-                  'The Severe Weather Outlook Display is now running. The program may take some time to load so be patient. Click "Ok" or Close the Window to Continue')  # skipcq: FLK-E501
-            instance_run = 1
+    Parameters:
+        argv (list): The command line arguments, or None to read sys.argv.
 
-        window.withdraw()
-        display_function = getattr(sys.modules[__name__], f'display_{outlook_type}_outlook')
-        display_function(day, outlook_data)
-    else:
-        popup('warning', 'No Outlook Available', f'There is no {outlook_type} outlook available for day {day}.')
-        start_gui()
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description='Severe Weather Outlook Display')
+    parser.add_argument('--prefetch-tiles', action='store_true',
+                        help='download the basemap tiles for the map into the local tile store, then exit')
+    parser.add_argument('--offline', action='store_true',
+                        help='never use the network; draw from the tile store and cached outlooks only')
+    parser.add_argument('--render', nargs='+', metavar='TYPE:DAY',
+                        help="render outlooks to PNG without the GUI, e.g. 'cat:1 tor:1 d4-8:5', or 'all' for every product")
+    parser.add_argument('--output-dir', help='folder to save rendered outlooks in (default: the output folder next to the program)')
+    parser.add_argument('--processes', type=int,
+                        help='number of processes --render draws with (default: one per CPU core)')
+    parser.add_argument('--backfill', nargs=2, type=datetime.date.fromisoformat, metavar=('START', 'END'),
+                        help='download the archived outlooks issued between two dates (YYYY-MM-DD) into the local archive, then exit')
+    parser.add_argument('--watch', action='store_true',
+                        help='watch the SPC RSS feed without the GUI and pre-render each new convective outlook')
+    parser.add_argument('--aggregate', nargs=2, metavar=('TYPE:DAY', 'PATH'),
+                        help="save the risk in each region for an outlook to a CSV or JSON file, e.g. 'cat:1 states.csv', then exit")
+    parser.add_argument('--animate', nargs=4, metavar=('TYPE:DAY', 'START', 'END', 'PATH'),
+                        help="save a GIF or MP4 of every issuance of an outlook between two dates (YYYY-MM-DD) from the local "
+                             "archive and the current outlook, e.g. 'cat:1 2024-04-16 2024-04-16 day1.gif', then exit")
+    parser.add_argument('--fps', type=int, help=f'frames per second of --animate (default: {animation_fps})')
+    parser.add_argument('--serve', nargs='?', type=int, const=server_port, metavar='PORT',
+                        help=f'serve the latest outlook images and JSON risk summaries over HTTP (default port: {server_port})')
+    parser.add_argument('--host', default=server_host, help=f'address --serve listens on (default: {server_host})')
+    parser.add_argument('--regions',
+                        help="polygon shapefile of the regions --aggregate summarizes, named from its 'NAME' column "
+                             '(default: the states)')
+    parser.add_argument('--population', help="CSV of 'latitude', 'longitude' and 'population' columns to weight --aggregate coverage by")
+    arguments = parser.parse_args(argv)
+    if arguments.render == ['all']:
+        arguments.render = all_products()
+    elif arguments.render is not None:
+        try:
+            arguments.render = [parse_product(product) for product in arguments.render]
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+    if arguments.aggregate is not None:
+        try:
+            arguments.aggregate = [parse_product(arguments.aggregate[0]), arguments.aggregate[1]]
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+    if arguments.animate is not None:
+        try:
+            arguments.animate = [parse_product(arguments.animate[0]), datetime.date.fromisoformat(arguments.animate[1]),
+                                 datetime.date.fromisoformat(arguments.animate[2]), arguments.animate[3]]
+        except (argparse.ArgumentTypeError, ValueError) as e:
+            parser.error(str(e))
+    return arguments
+
+
+# Function to create the Tkinter root window
+def create_root_window():
+    """
+    Creates the hidden Tkinter root window. It is the parent of the GUI window and the outlook viewer,
+    and runs the only Tk event loop.
 
-    if outlook_type not in ['cat', 'tor', 'wind', 'hail', 'd4-8', 'prob']:
-        log.error('Invalid Outlook Type. Outlook Type = ' + outlook_type)
-        popup('error', 'Invalid Outlook Type',
-              "An error has occurred where the outlook type wasn't read correctly. The program will now quit.")
-        sys.exit(0)
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+    global root  # skipcq: PYL-W0603
+    root = tk.Tk()
+    root.withdraw()
 
 
 # Startup Function
@@ -1953,21 +4910,92 @@ def startup():
     Returns:
         None
     """
-    if not os.path.exists(log_directory):
-        os.makedirs(log_directory)
+    setup_logging()
 
-    log.basicConfig(
-        level=log.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        filename='C:\\log\\cod.log',
-        filemode='w'
-    )
+    matplotlib.use('TkAgg')
+    create_root_window()
 
     rss_feed_thread = threading.Thread(target=check_rss_feed,
                                        args=(rss_url, check_interval))
     rss_feed_thread.daemon = True
     rss_feed_thread.start()
 
+    # Draw the base map before the first outlook needs it
+    job_executor.submit(preload_base_map)
+
+    # Hand finished background jobs back to the Tk thread
+    root.after(job_poll_interval, poll_job_results, root)
+
+
+# Main Function
+def main(argv=None):
+    """
+    Starts the program: the GUI by default, or one of the command line modes.
+
+    Parameters:
+        argv (list): The command line arguments, or None to read sys.argv.
+
+    Returns:
+        None
+    """
+    global offline_mode, output_directory_path, region_shapefile, region_label_file, population_file  # skipcq: PYL-W0603
+    arguments = parse_arguments(argv)
+    offline_mode = arguments.offline
+    if arguments.output_dir:
+        output_directory_path = os.path.abspath(arguments.output_dir)
+    if arguments.regions:
+        region_shapefile = os.path.abspath(arguments.regions)
+        region_label_file = None  # The bundled label points only name the bundled state outlines
+    if arguments.population:
+        population_file = os.path.abspath(arguments.population)
+
+    if arguments.prefetch_tiles:
+        setup_logging()
+        sys.exit(0 if prefetch_tiles() == len(map_tiles(tile_zoom)) else 1)
+
+    if arguments.render:
+        setup_logging()
+        log.getLogger().addHandler(log.StreamHandler())
+        matplotlib.use('Agg')
+        rendered = render_products(arguments.render, arguments.processes)
+        sys.exit(0 if len(rendered) == len(arguments.render) else 1)
+
+    if arguments.backfill:
+        setup_logging()
+        log.getLogger().addHandler(log.StreamHandler())
+        counts = backfill_archive(*arguments.backfill)
+        sys.exit(0 if counts['failed'] == 0 else 1)
+
+    if arguments.watch:
+        setup_logging()
+        log.getLogger().addHandler(log.StreamHandler())
+        matplotlib.use('Agg')
+        check_rss_feed(rss_url, check_interval)
+
+    if arguments.aggregate:
+        setup_logging()
+        log.getLogger().addHandler(log.StreamHandler())
+        (outlook_type, day), export_path = arguments.aggregate
+        export_region_summary(outlook_fetch_functions[outlook_type](day), export_path)
+        sys.exit(0)
+
+    if arguments.serve is not None:
+        setup_logging()
+        log.getLogger().addHandler(log.StreamHandler())
+        matplotlib.use('Agg')
+        serve_outlooks(arguments.host, arguments.serve)
+
+    if arguments.animate:
+        setup_logging()
+        log.getLogger().addHandler(log.StreamHandler())
+        matplotlib.use('Agg')
+        (outlook_type, day), start_date, end_date, animation_path = arguments.animate
+        frames = export_animation(outlook_type, outlook_issuances(outlook_type, day, start_date, end_date), animation_path, arguments.fps)
+        sys.exit(0 if frames else 1)
+
+    startup()
+    start_gui()
+
 
-startup()
-start_gui()
+if __name__ == '__main__':
+    main()
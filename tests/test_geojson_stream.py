@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+FEATURES = [
+    {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [[[-100, 35], [-96, 35], [-96, 39], [-100, 35]]]},
+     'properties': {'LABEL': 'SLGT', 'LABEL2': 'Slight Risk – 15°', 'stroke': '#e6c200'}},
+    {'type': 'Feature', 'geometry': {}, 'properties': {'LABEL': 'HIGH', 'LABEL2': 'Hög risk ⛈'}},
+]
+
+
+def document(**members):
+    return json.dumps(dict(type='FeatureCollection', **members, features=FEATURES), ensure_ascii=False).encode('utf-8')
+
+
+def split(data, *positions):
+    bounds = [0, *positions, len(data)]
+    return [data[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def test_features_split_at_every_chunk_boundary():
+    data = document()
+    for position in range(1, len(data)):
+        assert list(swod.iter_geojson_features(split(data, position))) == FEATURES
+
+
+def test_single_byte_chunks_split_utf8_characters():
+    data = document()
+    assert len(data) > len(data.decode('utf-8'))  # The document has multi-byte characters
+    assert list(swod.iter_geojson_features(data[index:index + 1] for index in range(len(data)))) == FEATURES
+
+
+def test_escaped_features_key_inside_a_string_is_skipped():
+    data = document(name='a "features": [1, 2] string', note='\\"features\\":[')
+    for position in range(1, len(data), 7):
+        assert list(swod.iter_geojson_features(split(data, position))) == FEATURES
+
+
+def test_truncated_document_raises():
+    data = document()
+    with pytest.raises(ValueError):
+        list(swod.iter_geojson_features(split(data[:-20], 50)))
@@ -0,0 +1,84 @@
+import http.server
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+BODY = json.dumps({'type': 'FeatureCollection', 'features': [
+    {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [[[-100, 35], [-96, 35], [-96, 39], [-100, 35]]]},
+     'properties': {'LABEL': 'SLGT', 'ISSUE': '202404161630', 'VALID': '202404161630', 'EXPIRE': '202404171200'}}
+]}).encode('utf-8')
+ETAG = '"v1"'
+
+
+class OutlookHandler(http.server.BaseHTTPRequestHandler):
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+@pytest.fixture
+def outlook_url(tmp_path, monkeypatch):
+    monkeypatch.setattr(swod, 'http_cache_directory', str(tmp_path))
+    monkeypatch.setattr(swod, 'http_cache_memory', {})
+    monkeypatch.setattr(swod, 'offline_mode', False)
+    OutlookHandler.requests = []
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), OutlookHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}/day1otlk_cat.nolyr.geojson'
+    server.shutdown()
+    server.server_close()
+
+
+def test_fresh_copy_is_used_without_a_request(outlook_url):
+    first = swod.fetch_outlook('cat', outlook_url)
+    second = swod.fetch_outlook('cat', outlook_url)
+
+    assert OutlookHandler.requests == [None]
+    assert second is first
+    assert second.max_rank == swod.risk_level_mappings['cat']['SLGT']
+
+
+def test_stale_copy_is_revalidated_with_a_304(outlook_url):
+    first = swod.fetch_outlook('cat', outlook_url)
+    swod.invalidate_http_cache([outlook_url])
+    second = swod.fetch_outlook('cat', outlook_url)
+
+    assert OutlookHandler.requests == [None, ETAG]
+    assert second is first
+    assert swod.read_http_cache(outlook_url)['fetched_at'] > 0
+
+
+def test_cache_survives_a_restart(outlook_url, monkeypatch):
+    swod.fetch_outlook('cat', outlook_url)
+    monkeypatch.setattr(swod, 'http_cache_memory', {})
+
+    outlook = swod.fetch_outlook('cat', outlook_url)
+    assert OutlookHandler.requests == [None]
+    assert outlook.issue == '202404161630'
+
+    monkeypatch.setattr(swod, 'http_cache_memory', {})
+    monkeypatch.setattr(swod, 'http_cache_max_age', 0)
+    swod.fetch_outlook('cat', outlook_url)
+    assert OutlookHandler.requests == [None, ETAG]
@@ -0,0 +1,42 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+def feature(label, coordinates, issue):
+    geometry = {'type': 'Polygon', 'coordinates': coordinates} if coordinates else {}
+    return {'type': 'Feature', 'geometry': geometry,
+            'properties': {'LABEL': label, 'ISSUE': issue, 'VALID': issue, 'EXPIRE': issue}}
+
+
+def square(x, y, size):
+    return [[[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]]
+
+
+def test_empty_risk_levels_do_not_count_towards_the_highest_risk():
+    previous = swod.Outlook('cat', [feature('MRGL', square(-100, 35, 4), '202404161300'),
+                                    feature('SLGT', square(-99, 36, 2), '202404161300')])
+    current = swod.Outlook('cat', [feature('MRGL', square(-100, 35, 4), '202404161630'),
+                                   feature('SLGT', square(-99, 36, 1), '202404161630'),
+                                   feature('HIGH', None, '202404161630')])
+
+    assert current.max_rank == swod.risk_level_mappings['cat']['SLGT']
+    diff = swod.diff_outlooks(previous, current)
+    assert diff['previous_risk'] == diff['current_risk'] == 'Slight'
+    assert not diff['upgraded']
+    assert not diff['downgraded']
+
+
+def test_highest_risk_going_up_is_an_upgrade():
+    previous = swod.Outlook('d4-8', [feature('0.15', square(-100, 35, 4), '202404160900'),
+                                     feature('0.30', None, '202404160900')])
+    current = swod.Outlook('d4-8', [feature('0.15', square(-100, 35, 4), '202404170900'),
+                                    feature('0.30', square(-99, 36, 2), '202404170900')])
+
+    diff = swod.diff_outlooks(previous, current)
+    assert diff['upgraded']
+    assert not diff['downgraded']
+    assert diff['added_levels'] == ('0.30',)
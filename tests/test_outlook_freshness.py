@@ -0,0 +1,40 @@
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+def utc(*args):
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc).timestamp()
+
+
+def outlook(issue):
+    return swod.Outlook('cat', [{'type': 'Feature', 'geometry': {},
+                                 'properties': {'LABEL': 'TSTM', 'ISSUE': issue, 'VALID': issue, 'EXPIRE': issue}}])
+
+
+def test_central_daylight_time_changes_at_2_am_local():
+    assert not swod.central_daylight_time(utc(2024, 3, 10, 7, 59))
+    assert swod.central_daylight_time(utc(2024, 3, 10, 8, 0))
+    assert swod.central_daylight_time(utc(2024, 11, 3, 6, 59))
+    assert not swod.central_daylight_time(utc(2024, 11, 3, 7, 0))
+
+
+def test_only_the_issuances_for_the_current_utc_offset_are_used():
+    assert swod.product_issue_times('day2', utc(2024, 7, 1)) == ('1730', '0600')
+    assert swod.product_issue_times('day2', utc(2024, 1, 15)) == ('1730', '0700')
+    assert swod.product_issue_times('day1', utc(2024, 1, 15)) == ('0100', '0600', '1300', '1630', '2000')
+
+
+def test_winter_outlook_is_not_expired_by_the_summer_issuance():
+    fetched_at = utc(2024, 1, 15, 6, 10)
+    fresh_until = swod.outlook_fresh_until(2, outlook('202401141730'), fetched_at)
+    assert fresh_until == fetched_at + swod.outlook_store_max_age
+
+
+def test_outlook_is_fresh_until_the_next_issuance():
+    fetched_at = utc(2024, 7, 1, 5, 55)
+    assert swod.outlook_fresh_until(2, outlook('202406301730'), fetched_at) == utc(2024, 7, 1, 6, 0)
@@ -0,0 +1,91 @@
+import concurrent.futures
+import http.client
+import http.server
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(swod, 'served_products', {})
+    monkeypatch.setattr(swod, 'served_flights', {})
+    monkeypatch.setattr(swod, 'outlook_store', {})
+    builds = []
+    release = threading.Event()
+
+    def build_served_product(outlook_type, day, previous=None):
+        builds.append((outlook_type, day))
+        release.wait(5)
+        outlook = swod.Outlook(outlook_type, [])
+        with swod.outlook_store_lock:
+            swod.outlook_store[outlook_type, day] = {'outlook': outlook, 'issue': None, 'fetched_at': time.time(),
+                                                     'fresh_until': time.time() + 60}
+        png = None if outlook_type == 'tor' else b'\x89PNG image'
+        return {'outlook': outlook, 'png': png, 'json': b'{}', 'etag': {'png': '"png-v1"', 'json': '"json-v1"'},
+                'last_modified': time.time() - 30}
+
+    monkeypatch.setattr(swod, 'build_served_product', build_served_product)
+    httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), swod.OutlookRequestHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_port, builds, release
+    release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get(port, path, headers=None):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    connection.request('GET', path, headers=headers or {})
+    response = connection.getresponse()
+    result = response.status, dict(response.getheaders()), response.read()
+    connection.close()
+    return result
+
+
+def test_concurrent_requests_share_one_build(server):
+    port, builds, release = server
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(get, port, '/cat/1.png') for _ in range(8)]
+        time.sleep(0.5)
+        release.set()
+        responses = [future.result() for future in futures]
+
+    assert builds == [('cat', 1)]
+    assert {status for status, _, _ in responses} == {200}
+    assert {body for _, _, body in responses} == {b'\x89PNG image'}
+
+
+def test_conditional_requests_get_a_304(server):
+    port, builds, release = server
+    release.set()
+    status, headers, _ = get(port, '/cat/1.png')
+    assert status == 200
+
+    status, _, body = get(port, '/cat/1.png', {'If-None-Match': headers['ETag']})
+    assert (status, body) == (304, b'')
+    status, _, _ = get(port, '/cat/1.png', {'If-Modified-Since': headers['Last-Modified']})
+    assert status == 304
+    status, _, _ = get(port, '/cat/1.png', {'If-None-Match': '"png-v0"'})
+    assert status == 200
+    assert builds == [('cat', 1)]
+
+
+def test_unknown_products_and_missing_outlooks_get_a_404(server):
+    port, builds, release = server
+    release.set()
+    assert get(port, '/nope/1.png')[0] == 404
+    assert get(port, '/cat/9.png')[0] == 404
+    assert get(port, '/cat/1.gif')[0] == 404
+    assert builds == []
+
+    status, _, body = get(port, '/tor/1.png')
+    assert (status, body) == (404, b'There is no outlook available\n')
+    assert get(port, '/tor/1.json')[0] == 200
@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+def square(x, y, size):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+def feature(label, geometry):
+    return {'type': 'Feature', 'geometry': geometry,
+            'properties': {'LABEL': label, 'ISSUE': '202404161630', 'VALID': '202404161630', 'EXPIRE': '202404171200'}}
+
+
+OUTLOOK = swod.Outlook('cat', [
+    feature('MRGL', {'type': 'Polygon', 'coordinates': [square(-110, 30, 20)]}),
+    feature('SLGT', {'type': 'Polygon', 'coordinates': [square(-105, 32, 10), square(-102, 35, 4)]}),  # With a hole
+    feature('ENH', {'type': 'MultiPolygon', 'coordinates': [[square(-104, 33, 1)], [square(-96, 40, 2)]]}),
+])
+
+
+def test_points_in_a_hole_get_the_risk_around_it():
+    labels, _ = swod.classify_points(OUTLOOK, [37, 36, 31], [-100, -104.5, -108])
+    assert labels.tolist() == ['MRGL', 'SLGT', 'MRGL']
+
+
+def test_every_part_of_a_multipolygon_counts():
+    labels, _ = swod.classify_points(OUTLOOK, [33.5, 41, 45], [-103.5, -95, -100])
+    assert labels.tolist() == ['ENH', 'ENH', 'MRGL']
+
+
+def test_points_on_an_edge_are_inside_and_outside_points_have_no_risk():
+    labels, significant = swod.classify_points(OUTLOOK, [32, 10], [-100, -100])
+    assert labels.tolist() == ['SLGT', None]
+    assert not significant.any()
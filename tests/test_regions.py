@@ -0,0 +1,54 @@
+import os
+import sys
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import LineString
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+def feature(label, coordinates):
+    return {'type': 'Feature', 'geometry': {'type': 'Polygon', 'coordinates': [coordinates]},
+            'properties': {'LABEL': label, 'ISSUE': '202404161630', 'VALID': '202404161630', 'EXPIRE': '202404171200'}}
+
+
+@pytest.fixture
+def state_lines(tmp_path, monkeypatch):
+    # Two states side by side, the eastern one with an island, and a lake in the west one
+    lines = [LineString([(-104, 36), (-96, 36), (-96, 40), (-104, 40), (-104, 36)]),
+             LineString([(-100, 36), (-100, 40)]),
+             LineString([(-95, 37), (-94, 37), (-94, 38), (-95, 38), (-95, 37)]),
+             LineString([(-103, 37), (-102.5, 37), (-102.5, 37.5), (-103, 37.5), (-103, 37)])]
+    shapefile = str(tmp_path / 'states.shp')
+    gpd.GeoDataFrame({'TYPE': ['outer', 'inner', 'outer', 'outer']}, geometry=lines, crs='EPSG:4326').to_file(shapefile)
+    label_file = tmp_path / 'labels.csv'
+    label_file.write_text('name,latitude,longitude\nWest,38.5,-101\nEast,38,-98\nEast,37.5,-94.5\nNowhere,50,-80\n')
+
+    monkeypatch.setattr(swod, 'region_shapefile', shapefile)
+    monkeypatch.setattr(swod, 'region_label_file', str(label_file))
+    monkeypatch.setattr(swod, 'population_file', None)
+    monkeypatch.setattr(swod, 'regions', None)
+    monkeypatch.setattr(swod, 'region_summaries', {})
+    return shapefile
+
+
+def test_line_regions_are_named_from_the_label_points(state_lines):
+    region_frame, _ = swod.load_regions()
+    assert sorted(region_frame['region']) == ['East', 'West']
+    assert region_frame.geometry[region_frame['region'] == 'East'].iloc[0].geom_type == 'MultiPolygon'
+
+
+def test_states_under_a_risk_are_listed_by_name(state_lines):
+    outlook = swod.Outlook('cat', [feature('MRGL', [[-105, 35], [-93, 35], [-93, 41], [-105, 41], [-105, 35]]),
+                                   feature('ENH', [[-94.8, 37.2], [-94.2, 37.2], [-94.2, 37.8], [-94.8, 37.2]])])
+    assert swod.regions_at_or_above(outlook, 'ENH') == ['East']
+    assert sorted(swod.regions_at_or_above(outlook, 'MRGL')) == ['East', 'West']
+
+
+def test_line_regions_are_numbered_without_a_label_file(state_lines, monkeypatch):
+    monkeypatch.setattr(swod, 'region_label_file', None)
+    region_frame, _ = swod.load_regions()
+    assert sorted(region_frame['region']) == ['0', '1', '2', '3']
@@ -0,0 +1,73 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Severe-Weather-Outlook-Display'))
+
+import Severe_Weather_Outlook_Display as swod  # noqa: E402
+
+
+def outlook(label='SLGT'):
+    return swod.Outlook('cat', [{'type': 'Feature',
+                                 'geometry': {'type': 'Polygon', 'coordinates': [[[-100, 35], [-96, 35], [-96, 39], [-100, 35]]]},
+                                 'properties': {'LABEL': label, 'ISSUE': '202404161630', 'VALID': '202404161630', 'EXPIRE': '202404171200'}}])
+
+
+@pytest.fixture
+def base_map(tmp_path, monkeypatch):
+    monkeypatch.setattr(swod, 'render_cache_directory', str(tmp_path / 'renders'))
+    monkeypatch.setattr(swod, 'output_directory_path', str(tmp_path / 'output'))
+    monkeypatch.setattr(swod, 'base_map_aspect', lambda: 1.3)
+    state = {'complete': True}
+    monkeypatch.setattr(swod, 'get_base_map', lambda width, height, dpi: (np.zeros((10, 10, 4)), state['complete']))
+    return state
+
+
+def test_key_changes_with_the_outlook():
+    assert swod.render_cache_key('cat', outlook()) == swod.render_cache_key('cat', outlook())
+    assert swod.render_cache_key('cat', outlook()) != swod.render_cache_key('cat', outlook('ENH'))
+
+
+def test_key_changes_with_the_styles(monkeypatch):
+    key = swod.render_cache_key('cat', outlook())
+    real_color = swod.color
+    monkeypatch.setattr(swod, 'color', lambda outlook_type, label: '#123456' if label == 'SLGT' else real_color(outlook_type, label))
+    assert swod.render_cache_key('cat', outlook()) != key
+
+
+@pytest.mark.parametrize('setting, value', [('basemap_source', 'https://tiles.example.com/{z}/{x}/{y}{r}.png'),
+                                            ('plot_extent', (-120, -70, 25, 50)),
+                                            ('base_layer_tolerance', 0.1)])
+def test_key_changes_with_the_base_map(monkeypatch, setting, value):
+    key = swod.render_cache_key('cat', outlook())
+    monkeypatch.setattr(swod, setting, value)
+    assert swod.render_cache_key('cat', outlook()) != key
+
+
+def test_key_changes_with_the_image_size(monkeypatch):
+    key = swod.render_cache_key('cat', outlook())
+    monkeypatch.setattr(swod, 'output_dpi', 150)
+    assert swod.render_cache_key('cat', outlook()) != key
+
+
+def test_render_is_cached_and_reused(base_map):
+    path = swod.render_outlook('cat', 1, outlook())
+    cached = os.listdir(swod.render_cache_directory)
+    assert cached == [swod.render_cache_key('cat', outlook()) + '.png']
+
+    os.remove(path)
+    assert swod.render_outlook('cat', 1, outlook()) == path
+    assert os.path.exists(path)
+
+
+def test_render_with_missing_tiles_is_not_cached(base_map):
+    base_map['complete'] = False
+    path = swod.render_outlook('cat', 1, outlook())
+    assert os.path.exists(path)
+    assert not os.path.exists(swod.render_cache_directory) or not os.listdir(swod.render_cache_directory)
+
+    base_map['complete'] = True
+    swod.render_outlook('cat', 1, outlook())
+    assert len(os.listdir(swod.render_cache_directory)) == 1